@@ -0,0 +1,78 @@
+"""Benchmark payload codecs: stored size against encode/decode throughput."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+
+import numpy as np
+
+from t81_python.pipelines.codecs import PAYLOAD_CODECS, choose_codec, decode_payload, encode_payload
+from t81_python.quantization import PAYLOAD_ENCODINGS, pack_trits_array
+
+
+def best_seconds(fn: Callable[[], object], repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    return min(timings)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--values", type=int, default=1 << 22)
+    parser.add_argument(
+        "--zero-fractions",
+        type=float,
+        nargs="+",
+        default=[0.33, 0.7, 0.9, 0.99],
+        help="Fractions of trits that are zero; each is benchmarked separately",
+    )
+    parser.add_argument("--encoding", choices=PAYLOAD_ENCODINGS, default="2bit")
+    parser.add_argument("--codecs", nargs="+", choices=PAYLOAD_CODECS, default=PAYLOAD_CODECS)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    results = []
+    for zero_fraction in args.zero_fractions:
+        signs = rng.choice(np.array([-1, 1], dtype=np.int8), size=args.values)
+        trits = np.where(rng.random(args.values) < zero_fraction, 0, signs).astype(np.int8)
+        packed = pack_trits_array(trits, args.encoding)
+        nonzero = int(np.count_nonzero(trits))
+        positive = int(np.count_nonzero(trits > 0))
+        counts = (nonzero - positive, args.values - nonzero, positive)
+        codecs = {}
+        for codec in args.codecs:
+            stored = encode_payload(packed, args.values, codec, args.encoding)
+            encode_s = best_seconds(
+                lambda: encode_payload(packed, args.values, codec, args.encoding), args.repeat
+            )
+            decode_s = best_seconds(
+                lambda: decode_payload(stored, args.values, codec, args.encoding), args.repeat
+            )
+            codecs[codec] = {
+                "bytes": len(stored),
+                "bytes_per_trit": round(len(stored) / args.values, 4),
+                "ratio_vs_float32": round(args.values * 4 / max(len(stored), 1), 2),
+                "encode_values_per_s": round(args.values / max(encode_s, 1e-9)),
+                "decode_values_per_s": round(args.values / max(decode_s, 1e-9)),
+            }
+        results.append(
+            {
+                "zero_fraction": zero_fraction,
+                "auto_choice": choose_codec(counts, args.encoding),
+                "codecs": codecs,
+            }
+        )
+    report = {"values": args.values, "encoding": args.encoding, "results": results}
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
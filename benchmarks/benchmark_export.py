@@ -4,19 +4,27 @@ from __future__ import annotations
 
 import argparse
 import json
-import random
 import time
 from pathlib import Path
 
-from t81_python.pipelines import export_state_dict_to_ternary, inspect_artifact
+import numpy as np
+import numpy.typing as npt
 
+from t81_python.pipelines import (
+    PAYLOAD_ENCODINGS,
+    export_state_dict_to_ternary,
+    inspect_artifact,
+)
 
-def make_state_dict(tensors: int, values_per_tensor: int, seed: int) -> dict[str, list[float]]:
-    rng = random.Random(seed)
-    out: dict[str, list[float]] = {}
-    for idx in range(tensors):
-        out[f"layer_{idx}.weight"] = [rng.uniform(-1.0, 1.0) for _ in range(values_per_tensor)]
-    return out
+
+def make_state_dict(
+    tensors: int, values_per_tensor: int, seed: int
+) -> dict[str, npt.NDArray[np.float32]]:
+    rng = np.random.default_rng(seed)
+    return {
+        f"layer_{idx}.weight": rng.uniform(-1.0, 1.0, values_per_tensor).astype(np.float32)
+        for idx in range(tensors)
+    }
 
 
 def main() -> None:
@@ -25,22 +33,44 @@ def main() -> None:
     parser.add_argument("--values-per-tensor", type=int, default=4096)
     parser.add_argument("--threshold", type=float, default=0.05)
     parser.add_argument("--seed", type=int, default=7)
+    parser.add_argument("--encoding", choices=PAYLOAD_ENCODINGS, default="2bit")
     parser.add_argument("--output", type=Path, default=Path("benchmark-out"))
+    parser.add_argument(
+        "--workers",
+        type=lambda text: [int(part) for part in text.split(",")],
+        default=[1],
+        help="Comma-separated worker counts to compare, e.g. 1,2,4,8",
+    )
     args = parser.parse_args()
 
     args.output.mkdir(parents=True, exist_ok=True)
 
     state_dict = make_state_dict(args.tensors, args.values_per_tensor, args.seed)
-    float_bytes = sum(len(values) for values in state_dict.values()) * 4
-
-    start = time.perf_counter()
-    export_state_dict_to_ternary(
-        state_dict,
-        output_dir=args.output,
-        threshold=args.threshold,
-        source="benchmark_synthetic",
-    )
-    elapsed = time.perf_counter() - start
+    float_bytes = sum(values.nbytes for values in state_dict.values())
+    total_values = args.tensors * args.values_per_tensor
+
+    scaling: list[dict[str, float | int]] = []
+    for workers in args.workers:
+        start = time.perf_counter()
+        export_state_dict_to_ternary(
+            state_dict,
+            output_dir=args.output,
+            threshold=args.threshold,
+            source="benchmark_synthetic",
+            workers=workers,
+            encoding=args.encoding,
+        )
+        run_elapsed = time.perf_counter() - start
+        scaling.append(
+            {
+                "workers": workers,
+                "elapsed_seconds": round(run_elapsed, 6),
+                "values_per_second": int(total_values / max(run_elapsed, 1e-9)),
+            }
+        )
+    elapsed = float(scaling[0]["elapsed_seconds"])
+    for row in scaling:
+        row["speedup"] = round(elapsed / max(float(row["elapsed_seconds"]), 1e-9), 3)
 
     inspection = inspect_artifact(args.output)
     payload_bytes = sum(
@@ -51,12 +81,15 @@ def main() -> None:
         "tensors": args.tensors,
         "values_per_tensor": args.values_per_tensor,
         "threshold": args.threshold,
+        "encoding": args.encoding,
         "elapsed_seconds": round(elapsed, 6),
-        "values_per_second": int((args.tensors * args.values_per_tensor) / max(elapsed, 1e-9)),
+        "values_per_second": int(total_values / max(elapsed, 1e-9)),
+        "ns_per_value": round(elapsed * 1e9 / max(total_values, 1), 3),
         "float32_bytes": float_bytes,
         "ternary_payload_bytes": payload_bytes,
         "compression_ratio": round(float_bytes / max(payload_bytes, 1), 4),
         "counts": inspection.counts,
+        "scaling": scaling,
     }
 
     print(json.dumps(report, indent=2))
@@ -0,0 +1,72 @@
+"""Benchmark packed ternary matmul against dequantize-then-matmul."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+import tracemalloc
+from collections.abc import Callable
+
+import numpy as np
+
+from t81_python.compute import ternary_matmul
+from t81_python.quantization import dequantize_trits, quantize_pack_trits, unpack_trits_array
+
+
+def measure(fn: Callable[[], object], repeat: int) -> dict[str, float]:
+    fn()
+    start = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    elapsed = (time.perf_counter() - start) / repeat
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {"ms": round(elapsed * 1e3, 3), "peak_alloc_bytes": peak}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=4096)
+    parser.add_argument("--cols", type=int, default=4096)
+    parser.add_argument("--batch", type=int, default=1, help="Input columns (1 = matvec)")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--repeat", type=int, default=10)
+    parser.add_argument("--threshold", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    shape = (args.rows, args.cols)
+    weights = (rng.standard_normal(shape) * 0.1).astype(np.float32)
+    packed, _ = quantize_pack_trits(weights, args.threshold)
+    del weights
+    x = rng.standard_normal((args.cols, args.batch)).astype(np.float32)
+    if args.batch == 1:
+        x = x.reshape(-1)
+
+    def dequantize_then_matmul() -> object:
+        dense = dequantize_trits(unpack_trits_array(packed, args.rows * args.cols))
+        return dense.reshape(shape) @ x
+
+    def packed_matmul() -> object:
+        return ternary_matmul(packed, shape, x, workers=args.workers)
+
+    baseline = measure(dequantize_then_matmul, args.repeat)
+    fused = measure(packed_matmul, args.repeat)
+    report = {
+        "shape": list(shape),
+        "batch": args.batch,
+        "workers": args.workers,
+        "weight_bytes": {"packed": int(packed.nbytes), "float32": args.rows * args.cols * 4},
+        "dequantize_then_matmul": baseline,
+        "packed_matmul": fused,
+        "speedup": round(baseline["ms"] / max(fused["ms"], 1e-9), 2),
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Benchmark CLI cold start: wall time per invocation and `-X importtime` breakdown."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+
+
+def median_ms(command: list[str], runs: int) -> float:
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, check=True, capture_output=True)
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings) * 1e3
+
+
+def import_times(statement: str) -> list[dict[str, object]]:
+    """Modules imported by `statement` in a fresh interpreter, slowest (cumulative) first."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        check=True,
+        capture_output=True,
+        text=True,
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:") :].split("|")
+        rows.append(
+            {
+                "module": name.strip(),
+                "self_ms": int(self_us) / 1e3,
+                "cumulative_ms": int(cumulative_us) / 1e3,
+            }
+        )
+    return sorted(rows, key=lambda row: -float(str(row["cumulative_ms"])))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--runs", type=int, default=20)
+    parser.add_argument("--top", type=int, default=10, help="Slowest imports to report")
+    parser.add_argument(
+        "--max-info-ms",
+        type=float,
+        default=None,
+        help="Exit non-zero if the median `info` run is slower than this",
+    )
+    args = parser.parse_args()
+
+    cli = [sys.executable, "-m", "t81_python.cli"]
+    imports = import_times("import t81_python.cli")
+    modules = {str(row["module"]) for row in imports}
+    report = {
+        "python": sys.version.split()[0],
+        "runs": args.runs,
+        "interpreter_ms": round(median_ms([sys.executable, "-c", "pass"], args.runs), 2),
+        "info_ms": round(median_ms([*cli, "info"], args.runs), 2),
+        "help_ms": round(median_ms([*cli, "--help"], args.runs), 2),
+        "imports_numpy": "numpy" in modules,
+        "modules_imported": len(modules),
+        "slowest_imports": imports[: args.top],
+    }
+    print(json.dumps(report, indent=2))
+    if args.max_info_ms is not None and float(report["info_ms"]) > args.max_info_ms:
+        print(
+            f"`info` took {report['info_ms']} ms (budget {args.max_info_ms:g} ms)", file=sys.stderr
+        )
+        raise SystemExit(1)
+
+
+if __name__ == "__main__":
+    main()
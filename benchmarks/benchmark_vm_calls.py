@@ -0,0 +1,86 @@
+"""Microbenchmark VMBridge call overhead: per-call vs bulk register reads and stepping."""
+
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from pathlib import Path
+
+from t81_python.vm_bridge import VMBridge
+
+
+def calls_per_second(fn: Callable[[], object], calls: int) -> int:
+    start = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return int(calls / max(time.perf_counter() - start, 1e-9))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("program", type=Path)
+    parser.add_argument("--lib", type=Path, default=None, help="Defaults to T81_VM_LIB")
+    parser.add_argument("--calls", type=int, default=100_000)
+    parser.add_argument("--registers", type=int, default=16)
+    parser.add_argument("--steps", type=int, default=10_000)
+    parser.add_argument("--snapshot-every", type=int, default=1)
+    args = parser.parse_args()
+
+    bridge = VMBridge(args.lib)
+    bridge.load_file(args.program)
+    bridge.run_to_halt()
+    count = args.registers
+
+    def per_register() -> list[int]:
+        return [bridge.register(index) for index in range(count)]
+
+    def bulk_registers() -> object:
+        return bridge.registers(count)
+
+    loop_calls = max(args.calls // count, 1)
+    report: dict[str, object] = {
+        "bulk_symbols": {
+            "t81vm_registers": bridge.has_bulk_registers,
+            "t81vm_trace_get_range": bridge.has_bulk_trace,
+            "t81vm_reset": bridge.has_reset,
+        },
+        "register_calls_per_second": calls_per_second(lambda: bridge.register(0), args.calls),
+        "state_hash_calls_per_second": calls_per_second(bridge.state_hash, args.calls),
+        "register_file_reads_per_second": {
+            "per_register": calls_per_second(per_register, loop_calls),
+            "bulk": calls_per_second(bulk_registers, loop_calls),
+        },
+    }
+
+    bridge.reset()
+    start = time.perf_counter()
+    executed = 0
+    while executed < args.steps:
+        before = bridge.trace_len()
+        bridge.run_to_halt(args.snapshot_every)
+        per_register()
+        bridge.state_hash()
+        ran = bridge.trace_len() - before
+        executed += ran
+        if ran < args.snapshot_every:
+            break
+    manual = time.perf_counter() - start
+
+    bridge.reset()
+    start = time.perf_counter()
+    result = bridge.run(args.steps, snapshot_every=args.snapshot_every, registers=count)
+    stepped = time.perf_counter() - start
+    report["snapshot_run"] = {
+        "steps": result.steps,
+        "snapshots": len(result.step),
+        "manual_snapshots_per_second": int(len(result.step) / max(manual, 1e-9)),
+        "run_snapshots_per_second": int(len(result.step) / max(stepped, 1e-9)),
+    }
+
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
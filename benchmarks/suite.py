@@ -0,0 +1,387 @@
+"""Benchmark suite with a JSON-lines result history and a throughput regression gate.
+
+Run every case (or those whose name contains `--filter`) and append the
+results to the history file, then compare two recorded runs:
+
+    python benchmarks/suite.py run [--quick] [--filter export/]
+    python benchmarks/suite.py compare [--baseline -2] [--current -1] [--max-regression 10]
+
+`compare` exits non-zero when any case's throughput dropped by more than
+`--max-regression` percent, or when a baseline case is missing from the current
+run (unless `--allow-missing`). Inputs come from fixed seeds, so runs on the same
+machine measure the same work. `startup/` cases time cold CLI processes (one
+value per process, so their rate is processes per second). VM cases run only when `T81_VM_LIB` and
+`T81_VM_CANARY_PROGRAM` (or `--vm-program`) are set.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from t81_python.core import TritVector
+from t81_python.pipelines import export_state_dict_to_ternary, inspect_artifact
+from t81_python.quantization import (
+    PAYLOAD_ENCODINGS,
+    count_packed_trits,
+    pack_trits_array,
+    quantize_array_to_trits,
+    quantize_pack_trits,
+    unpack_trits_array,
+)
+
+DEFAULT_HISTORY = Path(".benchmarks/history.jsonl")
+SEED = 7
+THRESHOLD = 0.05
+
+Timed = Callable[[], object]
+
+
+@dataclass(frozen=True)
+class Case:
+    """One benchmark: `setup()` builds inputs and returns the timed call over `values` items."""
+
+    name: str
+    values: int
+    setup: Callable[[], Timed]
+
+
+@dataclass(frozen=True)
+class Sizes:
+    values: int
+    export_shapes: tuple[tuple[int, ...], ...]
+    inspect_tensors: int
+    vm_calls: int
+    cli_runs: int
+
+
+FULL = Sizes(1 << 22, ((1 << 20,), (1024, 1024), (16, 256, 256)), 32, 20_000, 10)
+QUICK = Sizes(1 << 16, ((4096,), (64, 64), (4, 32, 32)), 4, 1_000, 2)
+
+
+def _weights(shape: tuple[int, ...], dtype: Any = np.float32) -> Any:
+    rng = np.random.default_rng(SEED)
+    return (rng.standard_normal(shape) * 0.05).astype(dtype)
+
+
+def _trits(count: int) -> Any:
+    return quantize_array_to_trits(_weights((count,)), THRESHOLD)
+
+
+def kernel_cases(sizes: Sizes) -> Iterator[Case]:
+    count = sizes.values
+    for encoding in PAYLOAD_ENCODINGS:
+
+        def pack(encoding: str = encoding) -> Timed:
+            trits = _trits(count)
+            return lambda: pack_trits_array(trits, encoding)
+
+        def unpack(encoding: str = encoding) -> Timed:
+            packed = pack_trits_array(_trits(count), encoding)
+            return lambda: unpack_trits_array(packed, count, encoding)
+
+        def count_trits(encoding: str = encoding) -> Timed:
+            packed = pack_trits_array(_trits(count), encoding)
+            return lambda: count_packed_trits(packed, count, encoding)
+
+        yield Case(f"pack/{encoding}", count, pack)
+        yield Case(f"unpack/{encoding}", count, unpack)
+        yield Case(f"count/{encoding}", count, count_trits)
+
+    for dtype in ("float32", "float16", "float64"):
+
+        def quantize(dtype: str = dtype) -> Timed:
+            values = _weights((count,), dtype)
+            out = np.empty(count, dtype=np.int8)
+            return lambda: quantize_array_to_trits(values, THRESHOLD, out=out)
+
+        def quantize_pack(dtype: str = dtype) -> Timed:
+            values = _weights((count,), dtype)
+            return lambda: quantize_pack_trits(values, THRESHOLD)
+
+        yield Case(f"quantize/{dtype}", count, quantize)
+        yield Case(f"quantize_pack/{dtype}", count, quantize_pack)
+
+    def from_numpy() -> Timed:
+        trits = _trits(count)
+        return lambda: TritVector.from_numpy(trits)
+
+    def from_packed() -> Timed:
+        packed = pack_trits_array(_trits(count)).tobytes()
+        return lambda: TritVector.from_packed(packed, count)
+
+    def from_ints() -> Timed:
+        values = _trits(count).tolist()
+        return lambda: TritVector(values)
+
+    yield Case("tritvector/from_numpy", count, from_numpy)
+    yield Case("tritvector/from_packed", count, from_packed)
+    yield Case("tritvector/from_ints", count, from_ints)
+
+
+def pipeline_cases(sizes: Sizes, workdir: Path) -> Iterator[Case]:
+    for shape in sizes.export_shapes:
+        numel = int(np.prod(shape))
+        label = "x".join(str(dim) for dim in shape)
+        for dtype in ("float32", "float16", "float64"):
+            for format_version in ("0.1", "0.2"):
+                out_dir = workdir / f"export-{label}-{dtype}-{format_version}"
+
+                def export(
+                    shape: tuple[int, ...] = shape,
+                    dtype: str = dtype,
+                    format_version: str = format_version,
+                    out_dir: Path = out_dir,
+                ) -> Timed:
+                    state = {"w": _weights(shape, dtype)}
+                    return lambda: export_state_dict_to_ternary(
+                        state, out_dir, threshold=THRESHOLD, format_version=format_version
+                    )
+
+                yield Case(f"export/{label}/{dtype}/{format_version}", numel, export)
+
+    per_tensor = sizes.values // sizes.inspect_tensors
+    for format_version in ("0.1", "0.2"):
+        out_dir = workdir / f"inspect-{format_version}"
+
+        def inspect(format_version: str = format_version, out_dir: Path = out_dir) -> Timed:
+            weights = _weights((sizes.inspect_tensors, per_tensor))
+            state = {f"layer_{i}.weight": row for i, row in enumerate(weights)}
+            export_state_dict_to_ternary(state, out_dir, format_version=format_version)
+            return lambda: inspect_artifact(out_dir)
+
+        yield Case(f"inspect/{format_version}", sizes.inspect_tensors * per_tensor, inspect)
+
+
+def startup_cases(sizes: Sizes) -> Iterator[Case]:
+    for label, argv in (("info", ["info"]), ("help", ["--help"])):
+
+        def cli(argv: list[str] = argv) -> Timed:
+            command = [sys.executable, "-m", "t81_python.cli", *argv]
+
+            def spawn() -> object:
+                for _ in range(sizes.cli_runs):
+                    subprocess.run(command, check=True, capture_output=True)
+                return None
+
+            return spawn
+
+        yield Case(f"startup/cli_{label}", sizes.cli_runs, cli)
+
+
+def vm_cases(sizes: Sizes, program: Path | None) -> Iterator[Case]:
+    if not os.environ.get("T81_VM_LIB") or program is None:
+        return
+    # Imported here so the rest of the suite runs without a VM library.
+    from t81_python.vm_bridge import VMBridge
+
+    calls = sizes.vm_calls
+
+    def loaded() -> Any:
+        bridge = VMBridge()
+        bridge.load_file(program)
+        bridge.run_to_halt()
+        return bridge
+
+    def register() -> Timed:
+        bridge = loaded()
+        return lambda: [bridge.register(0) for _ in range(calls)]
+
+    def state_hash() -> Timed:
+        bridge = loaded()
+        return lambda: [bridge.state_hash() for _ in range(calls)]
+
+    def rerun() -> Timed:
+        bridge = loaded()
+
+        def run() -> object:
+            for _ in range(max(calls // 100, 1)):
+                bridge.reset()
+                bridge.run_to_halt()
+            return None
+
+        return run
+
+    yield Case("vm/register", calls, register)
+    yield Case("vm/state_hash", calls, state_hash)
+    yield Case("vm/reset_run_to_halt", max(calls // 100, 1), rerun)
+
+
+def measure(case: Case, repeat: int) -> dict[str, float]:
+    fn = case.setup()
+    fn()  # Warm-up: first-touch allocations, lazy imports, page cache.
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append(time.perf_counter() - start)
+    best = min(timings)
+    return {
+        "values": case.values,
+        "best_seconds": round(best, 9),
+        "median_seconds": round(statistics.median(timings), 9),
+        "values_per_second": round(case.values / max(best, 1e-12), 1),
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return result.stdout.strip() or None
+
+
+def run(args: argparse.Namespace) -> int:
+    sizes = QUICK if args.quick else FULL
+    repeat = args.repeat if args.repeat is not None else (2 if args.quick else 5)
+    program = args.vm_program
+    if program is None and os.environ.get("T81_VM_CANARY_PROGRAM"):
+        program = Path(os.environ["T81_VM_CANARY_PROGRAM"])
+    results: dict[str, dict[str, float]] = {}
+    with tempfile.TemporaryDirectory(prefix="t81-bench-") as tmp:
+        cases = [
+            *kernel_cases(sizes),
+            *pipeline_cases(sizes, Path(tmp)),
+            *startup_cases(sizes),
+            *vm_cases(sizes, program),
+        ]
+        for case in cases:
+            if args.filter and args.filter not in case.name:
+                continue
+            results[case.name] = measure(case, repeat)
+            rate = results[case.name]["values_per_second"]
+            print(f"{case.name:<40} {rate:>16,.0f} values/s", file=sys.stderr)
+
+    record = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "quick": args.quick,
+        "seed": SEED,
+        "repeat": repeat,
+        "results": results,
+    }
+    args.history.parent.mkdir(parents=True, exist_ok=True)
+    with args.history.open("a", encoding="utf-8") as handle:
+        handle.write(json.dumps(record) + "\n")
+    print(json.dumps(record, indent=2))
+    return 0
+
+
+def load_run(ref: str, history: Path) -> dict[str, Any]:
+    """Resolve `ref`: an index into `history` (e.g. `-1` = latest) or a `.json`/`.jsonl` path."""
+    try:
+        index = int(ref)
+    except ValueError:
+        path = Path(ref)
+        if path.suffix == ".jsonl":
+            return load_run("-1", path)
+        try:
+            record: dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        except FileNotFoundError:
+            raise SystemExit(f"No saved benchmark run at {path}") from None
+        return record
+    try:
+        text = history.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        raise SystemExit(f"No benchmark history at {history}; record a run first") from None
+    lines = [line for line in text.splitlines() if line.strip()]
+    try:
+        record = json.loads(lines[index])
+    except IndexError:
+        raise SystemExit(f"{history} has {len(lines)} runs; no run at index {index}") from None
+    return record
+
+
+def compare(args: argparse.Namespace) -> int:
+    baseline = load_run(args.baseline, args.history)
+    current = load_run(args.current, args.history)
+    if baseline.get("quick") != current.get("quick"):
+        raise SystemExit("Cannot compare a --quick run with a full run")
+    regressions = 0
+    for name, now in current["results"].items():
+        before = baseline["results"].get(name)
+        if before is None:
+            print(f"{name:<40} {'new':>10}")
+            continue
+        change = 100.0 * (now["values_per_second"] / max(before["values_per_second"], 1e-12) - 1)
+        failed = change < -args.max_regression
+        regressions += failed
+        print(f"{name:<40} {change:>+9.1f}%{'  REGRESSION' if failed else ''}")
+    missing = [name for name in baseline["results"] if name not in current["results"]]
+    for name in missing:
+        print(f"{name:<40} {'missing':>10}{'' if args.allow_missing else '  MISSING'}")
+    status = 0
+    if regressions:
+        print(
+            f"{regressions} case(s) slower than the baseline by more than "
+            f"{args.max_regression:g}%",
+            file=sys.stderr,
+        )
+        status = 1
+    if missing and not args.allow_missing:
+        print(
+            f"{len(missing)} baseline case(s) missing from the current run "
+            "(pass --allow-missing if they were skipped on purpose)",
+            file=sys.stderr,
+        )
+        status = 1
+    return status
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n", 1)[0])
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--history", type=Path, default=DEFAULT_HISTORY)
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser(
+        "run", parents=[common], help="Run the suite and append to the history"
+    )
+    run_parser.add_argument("--quick", action="store_true", help="Small inputs for smoke runs")
+    run_parser.add_argument("--filter", default="", help="Only cases whose name contains this")
+    run_parser.add_argument("--repeat", type=int, default=None)
+    run_parser.add_argument("--vm-program", type=Path, default=None)
+
+    compare_parser = commands.add_parser(
+        "compare", parents=[common], help="Fail if throughput regressed"
+    )
+    compare_parser.add_argument("--baseline", default="-2", help="History index or JSON path")
+    compare_parser.add_argument("--current", default="-1", help="History index or JSON path")
+    compare_parser.add_argument(
+        "--max-regression",
+        type=float,
+        default=10.0,
+        help="Allowed throughput drop per case, in percent",
+    )
+    compare_parser.add_argument(
+        "--allow-missing",
+        action="store_true",
+        help="Do not fail on baseline cases absent from the current run",
+    )
+    args = parser.parse_args()
+    raise SystemExit(run(args) if args.command == "run" else compare(args))
+
+
+if __name__ == "__main__":
+    main()
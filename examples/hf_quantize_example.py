@@ -2,7 +2,22 @@
 
 from __future__ import annotations
 
-from t81_python.integrations.huggingface import quantize_state_dict
+import tempfile
+
+import numpy as np
+import numpy.typing as npt
+
+from t81_python.integrations.huggingface import export_model, quantize_model, quantize_state_dict
+
+
+class TinyModel:
+    """Anything with `named_parameters()` works, e.g. a `transformers` model."""
+
+    def named_parameters(self) -> list[tuple[str, npt.NDArray[np.float32]]]:
+        return [
+            ("layer.weight", np.array([0.22, -0.51, 0.00, 0.04, 0.90], dtype=np.float32)),
+            ("layer.norm.weight", np.ones(2, dtype=np.float32)),
+        ]
 
 
 def main() -> None:
@@ -13,6 +28,12 @@ def main() -> None:
     trits = quantize_state_dict(mock_state, threshold=0.05)
     print(trits)
 
+    model = TinyModel()
+    print(quantize_model(model, exclude=("*norm*",)))
+    with tempfile.TemporaryDirectory() as out_dir:
+        manifest = export_model(model, out_dir, exclude=("*norm*",))
+        print([tensor.name for tensor in manifest.tensors])
+
 
 if __name__ == "__main__":
     main()
@@ -19,6 +19,10 @@ if not all(summary.per_tensor_payload_ok.values()):
 print('Artifact sanity check passed for benchmark smoke run')
 PY
 
+SUITE_HISTORY="$(mktemp)"
+python benchmarks/suite.py run --quick --repeat 1 --history "${SUITE_HISTORY}" > /dev/null
+rm -f "${SUITE_HISTORY}"
+
 find "${OUT_DIR}" -type f -delete 2>/dev/null || true
 find "${OUT_DIR}" -type d -empty -delete 2>/dev/null || true
 find . -maxdepth 1 -name "${REPORT_JSON}" -type f -delete
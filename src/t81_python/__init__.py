@@ -1,8 +1,43 @@
-"""Public package surface for t81-python."""
+"""Public package surface for t81-python.
 
-from .core import Trit, TritVector
-from .quantization import dequantize_trits, pack_trits, quantize_float_to_trits, unpack_trits
-from .vm_bridge import VMBridge, VMTraceEntry
+Names are resolved on first access (PEP 562), so importing the package or a
+light submodule such as `t81_python.cli` does not load NumPy or the VM bridge.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+# `typing` is not imported at run time: it is a measurable part of CLI start-up.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .calibration import CalibrationSpec, calibrate
+    from .compute import ternary_matmul
+    from .core import Trit, TritVector
+    from .quantization import dequantize_trits, pack_trits, quantize_float_to_trits, unpack_trits
+    from .vm_async import AsyncVMBridge
+    from .vm_bridge import VMBridge, VMTraceEntry
+    from .vm_pool import VMPool, VMRunResult
+
+# Public name -> submodule that defines it.
+_EXPORTS = {
+    "Trit": "core",
+    "TritVector": "core",
+    "quantize_float_to_trits": "quantization",
+    "dequantize_trits": "quantization",
+    "pack_trits": "quantization",
+    "unpack_trits": "quantization",
+    "CalibrationSpec": "calibration",
+    "calibrate": "calibration",
+    "ternary_matmul": "compute",
+    "VMBridge": "vm_bridge",
+    "VMTraceEntry": "vm_bridge",
+    "VMPool": "vm_pool",
+    "VMRunResult": "vm_pool",
+    "AsyncVMBridge": "vm_async",
+}
 
 __all__ = [
     "Trit",
@@ -11,6 +46,25 @@ __all__ = [
     "dequantize_trits",
     "pack_trits",
     "unpack_trits",
+    "CalibrationSpec",
+    "calibrate",
+    "ternary_matmul",
     "VMBridge",
     "VMTraceEntry",
+    "VMPool",
+    "VMRunResult",
+    "AsyncVMBridge",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f".{module}", __name__), name)
+    globals()[name] = value  # Later lookups skip __getattr__.
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
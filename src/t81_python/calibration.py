@@ -0,0 +1,173 @@
+"""Vectorized threshold/scale calibration for ternary quantization."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from .quantization import _as_float_view
+
+CALIBRATION_MODES = ("fixed", "absmean", "percentile")
+# Values reduced per work item; large tensors are split into this many-value blocks.
+_CALIBRATION_BLOCK = 1 << 20
+_FLOAT16_MAX = float(np.finfo(np.float16).max)
+
+
+@dataclass(frozen=True)
+class CalibrationSpec:
+    """How thresholds and dequantization scales are derived for each tensor.
+
+    - `fixed`: the export `threshold` as-is and no stored scale (legacy behaviour).
+    - `absmean`: BitNet b1.58-style; scale = mean(|w|), threshold = scale / 2.
+    - `percentile`: threshold = `percentile` of |w|, scale = mean(|w|) above it.
+
+    `per_channel` computes one threshold/scale per slice along axis 0 (output
+    channels) for tensors with two or more dimensions.
+    """
+
+    mode: str = "fixed"
+    per_channel: bool = False
+    percentile: float = 50.0
+
+    def __post_init__(self) -> None:
+        if self.mode not in CALIBRATION_MODES:
+            raise ValueError(
+                f"Unknown calibration mode {self.mode!r}; expected one of {CALIBRATION_MODES}"
+            )
+        if not 0.0 < self.percentile <= 100.0:
+            raise ValueError(f"percentile must be in (0, 100], got {self.percentile}")
+        if self.mode == "fixed" and self.per_channel:
+            raise ValueError("fixed calibration has no per-channel variant")
+
+    @classmethod
+    def parse(cls, text: str | CalibrationSpec) -> CalibrationSpec:
+        """Parse `mode[:percentile][/channel]`, e.g. `absmean/channel` or `percentile:99`."""
+        if isinstance(text, CalibrationSpec):
+            return text
+        body, _, suffix = text.strip().partition("/")
+        if suffix not in ("", "channel"):
+            raise ValueError(f"Invalid calibration {text!r}: only '/channel' may follow the mode")
+        mode, _, percentile = body.partition(":")
+        if percentile and mode != "percentile":
+            raise ValueError(f"Invalid calibration {text!r}: only percentile takes a value")
+        return cls(
+            mode=mode,
+            per_channel=suffix == "channel",
+            percentile=float(percentile) if percentile else cls.percentile,
+        )
+
+    def __str__(self) -> str:
+        text = f"percentile:{self.percentile:g}" if self.mode == "percentile" else self.mode
+        return f"{text}/channel" if self.per_channel else text
+
+
+@dataclass(frozen=True)
+class Calibration:
+    """Per-channel thresholds and float16 scales for one tensor.
+
+    Value `i` of the flattened tensor belongs to channel `i // channel_size`;
+    per-tensor calibration is a single channel. `scales` is empty for `fixed`.
+    """
+
+    thresholds: npt.NDArray[np.float64]
+    scales: npt.NDArray[np.float16]
+    channel_size: int
+
+
+def _float_block(arr: npt.NDArray[Any], bfloat16_bits: bool, start: int, stop: int) -> Any:
+    block = arr[start:stop]
+    if bfloat16_bits:
+        return (block.astype(np.uint32) << 16).view(np.float32)
+    return block
+
+
+def _to_scales(values: npt.NDArray[np.float64]) -> npt.NDArray[np.float16]:
+    return np.clip(values, 0.0, _FLOAT16_MAX).astype(np.float16)
+
+
+def calibrate(
+    values: Any,
+    spec: str | CalibrationSpec,
+    *,
+    threshold: float = 0.05,
+    shape: Sequence[int] | None = None,
+    map_fn: Callable[..., Iterable[Any]] = map,
+) -> Calibration:
+    """Compute thresholds and scales for `values` in blocked NumPy reductions.
+
+    `shape` gives the tensor shape for per-channel calibration (defaults to
+    flat). Blocks of about a million values are reduced through `map_fn`, so
+    passing a thread pool's `map` spreads the work across cores (NumPy releases
+    the GIL). `absmean` is one pass; `percentile` partitions each channel's
+    magnitudes once and then sums the values above the threshold.
+    """
+    spec = CalibrationSpec.parse(spec)
+    arr, bfloat16_bits = _as_float_view(values)
+    numel = int(arr.size)
+    if spec.mode == "fixed":
+        empty = np.empty(0, dtype=np.float16)
+        return Calibration(np.array([float(threshold)]), empty, max(numel, 1))
+
+    dims = list(shape) if shape is not None else [numel]
+    channels = dims[0] if spec.per_channel and len(dims) >= 2 and numel else 1
+    channel_size = numel // channels if numel else 1
+    if numel == 0:
+        return Calibration(np.zeros(1), np.zeros(1, dtype=np.float16), 1)
+
+    if channel_size <= _CALIBRATION_BLOCK:
+        # Whole channels per work item: one vectorized reduction along axis 1.
+        rows_per_block = max(1, _CALIBRATION_BLOCK // channel_size)
+
+        def reduce_rows(first: int) -> tuple[Any, Any]:
+            last = min(first + rows_per_block, channels)
+            block = _float_block(arr, bfloat16_bits, first * channel_size, last * channel_size)
+            magnitude = np.abs(block).reshape(last - first, channel_size)
+            if spec.mode == "absmean":
+                scale = magnitude.mean(axis=1, dtype=np.float64)
+                return scale / 2.0, scale
+            cut = np.percentile(magnitude, spec.percentile, axis=1).astype(np.float64)
+            above = magnitude > cut[:, None]
+            total = np.where(above, magnitude, 0).sum(axis=1, dtype=np.float64)
+            return cut, total / np.maximum(above.sum(axis=1), 1)
+
+        parts = list(map_fn(reduce_rows, range(0, channels, rows_per_block)))
+        thresholds = np.concatenate([part[0] for part in parts])
+        scales = np.concatenate([part[1] for part in parts])
+        return Calibration(thresholds, _to_scales(scales), channel_size)
+
+    # Channels larger than a block: reduce each in parallel slices and combine.
+    thresholds = np.empty(channels)
+    scales = np.empty(channels)
+    for channel in range(channels):
+        base = channel * channel_size
+        starts = range(base, base + channel_size, _CALIBRATION_BLOCK)
+        stop = base + channel_size
+        if spec.mode == "absmean":
+
+            def abs_sum(start: int) -> float:
+                stop_at = min(start + _CALIBRATION_BLOCK, stop)
+                block = _float_block(arr, bfloat16_bits, start, stop_at)
+                return float(np.abs(block).sum(dtype=np.float64))
+
+            scales[channel] = sum(map_fn(abs_sum, starts)) / channel_size
+            thresholds[channel] = scales[channel] / 2.0
+            continue
+        cut = float(
+            np.percentile(np.abs(_float_block(arr, bfloat16_bits, base, stop)), spec.percentile)
+        )
+
+        def above_sum(start: int) -> tuple[float, int]:
+            block = np.abs(
+                _float_block(arr, bfloat16_bits, start, min(start + _CALIBRATION_BLOCK, stop))
+            )
+            above = block > cut
+            return float(block.sum(where=above, dtype=np.float64)), int(above.sum())
+
+        sums = list(map_fn(above_sum, starts))
+        thresholds[channel] = cut
+        scales[channel] = sum(s for s, _ in sums) / max(sum(c for _, c in sums), 1)
+    return Calibration(thresholds, _to_scales(scales), channel_size)
@@ -1,20 +1,168 @@
-"""CLI entrypoint for diagnostics and export pipelines."""
+"""CLI entrypoint for diagnostics and export pipelines.
+
+Start-up cost matters because wrapper scripts call the CLI many times: `info`
+is answered without building the parser, and NumPy and the pipelines are
+imported only by the subcommands that use them.
+"""
 
 from __future__ import annotations
 
-import argparse
-import json
+import math
+import sys
 
-from .pipelines import (
-    export_checkpoint_to_ternary,
-    export_state_dict_to_ternary,
-    inspect_artifact,
-    load_json_state_dict,
+from .formats import (
+    AUTO_CODEC,
+    FORMAT_VERSIONS,
+    PAYLOAD_CODECS,
+    PAYLOAD_ENCODINGS,
+    PROFILE_FORMATS,
+    PROGRESS_MODES,
 )
-from .quantization import quantize_float_to_trits
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    import argparse
+
+    from .calibration import CalibrationSpec
+    from .pipelines.profiling import ExportProfiler
+    from .pipelines.progress import ProgressReporter
+
+_SIZE_SUFFIXES = {"K": 1 << 10, "M": 1 << 20, "G": 1 << 30, "T": 1 << 40}
+_INFO = "t81-python: typed balanced-ternary helpers for AI integration workflows"
+
+
+def _parse_size(text: str) -> int:
+    """Parse a byte count such as `4096`, `512M` or `8G` (binary units)."""
+    import argparse
+
+    raw = text.strip().upper().removesuffix("B")
+    multiplier = _SIZE_SUFFIXES.get(raw[-1:], 1)
+    if multiplier != 1:
+        raw = raw[:-1]
+    try:
+        number = float(raw)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r}") from None
+    if not math.isfinite(number):
+        raise argparse.ArgumentTypeError(f"invalid size: {text!r}")
+    value = int(number * multiplier)
+    if value <= 0:
+        raise argparse.ArgumentTypeError(f"size must be positive: {text!r}")
+    return value
+
+
+def _positive_int(text: str) -> int:
+    import argparse
+
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer: {text!r}") from None
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1: {text!r}")
+    return value
+
+
+def _calibration(text: str) -> CalibrationSpec:
+    from .calibration import CalibrationSpec
+
+    return CalibrationSpec.parse(text)
+
+
+def _add_export_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--jobs", type=_positive_int, default=1, help="Tensors exported in parallel"
+    )
+    parser.add_argument(
+        "--format-version",
+        choices=FORMAT_VERSIONS,
+        default="0.1",
+        help="0.1: manifest.json + one .t81bin per tensor; 0.2: single-file container",
+    )
+    parser.add_argument(
+        "--incremental",
+        action="store_true",
+        help="Reuse payloads of unchanged tensors in OUTPUT and resume an interrupted export",
+    )
+    parser.add_argument(
+        "--encoding",
+        choices=PAYLOAD_ENCODINGS,
+        default="2bit",
+        help="Payload encoding: 2bit (4 trits/byte) or base3 (5 trits/byte, ~20%% smaller)",
+    )
+    parser.add_argument(
+        "--codec",
+        choices=(*PAYLOAD_CODECS, AUTO_CODEC),
+        default="raw",
+        help="Payload codec: raw, sparse (nonzero bitmap + signs), zlib, lzma, "
+        "or auto (sparse where the sampled zero fraction makes it >=10%% smaller)",
+    )
+    parser.add_argument(
+        "--calibration",
+        type=_calibration,
+        default="fixed",
+        help="fixed (use --threshold), absmean or percentile[:P], optionally suffixed /channel",
+    )
+
+
+def _add_profile_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        default=None,
+        help="Write per-stage timings, bytes and per-tensor memory to PATH",
+    )
+    parser.add_argument(
+        "--profile-format",
+        choices=PROFILE_FORMATS,
+        default="chrome",
+        help="chrome: trace-event JSON for Perfetto/chrome://tracing; json: stage/tensor totals",
+    )
+    parser.add_argument(
+        "--profile-memory",
+        action="store_true",
+        help="Also trace peak Python/NumPy heap per tensor with tracemalloc (slower)",
+    )
+
+
+def _add_progress_argument(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument(
+        "--progress",
+        choices=("auto", *PROGRESS_MODES, "none"),
+        default="auto",
+        help="Per-tensor progress on stderr: bar, json (one object per line), or none; "
+        "auto shows a bar when stderr is a terminal",
+    )
+
+
+def _progress(args: argparse.Namespace) -> ProgressReporter | None:
+    mode = args.progress
+    if mode == "auto":
+        mode = "bar" if sys.stderr.isatty() else "none"
+    if mode == "none":
+        return None
+    from .pipelines.progress import ProgressReporter
+
+    return ProgressReporter(mode)
+
+
+def _profiler(args: argparse.Namespace) -> ExportProfiler | None:
+    if args.profile is None:
+        return None
+    from .pipelines.profiling import ExportProfiler
+
+    return ExportProfiler(trace_memory=args.profile_memory)
+
+
+def _write_profile(args: argparse.Namespace, profiler: ExportProfiler | None) -> None:
+    if profiler is not None:
+        profiler.write(args.profile, args.profile_format)
+        print(f"Wrote {args.profile_format} profile to {args.profile}")
 
 
 def build_parser() -> argparse.ArgumentParser:
+    import argparse
+
     parser = argparse.ArgumentParser(prog="t81-python")
     sub = parser.add_subparsers(dest="command")
 
@@ -31,6 +179,9 @@ def build_parser() -> argparse.ArgumentParser:
     export.add_argument("input", help="Path to JSON mapping tensor names -> values")
     export.add_argument("output", help="Output directory")
     export.add_argument("--threshold", type=float, default=0.05)
+    _add_export_arguments(export)
+    _add_profile_arguments(export)
+    _add_progress_argument(export)
 
     export_hf = sub.add_parser(
         "export-hf",
@@ -39,50 +190,108 @@ def build_parser() -> argparse.ArgumentParser:
     export_hf.add_argument("input", help="Checkpoint path")
     export_hf.add_argument("output", help="Output directory")
     export_hf.add_argument("--threshold", type=float, default=0.05)
+    export_hf.add_argument(
+        "--max-memory",
+        type=_parse_size,
+        default=None,
+        help="Cap the exporter working set, e.g. 512M or 8G (tensors are streamed one at a time)",
+    )
+    _add_export_arguments(export_hf)
+    _add_profile_arguments(export_hf)
+    _add_progress_argument(export_hf)
 
     inspect = sub.add_parser(
         "inspect-artifact",
         help="Inspect/validate an exported artifact directory",
     )
-    inspect.add_argument("output", help="Output directory containing manifest.json + payloads")
+    inspect.add_argument(
+        "output", help="Artifact directory (manifest.json + payloads) or .t81 container"
+    )
+    inspect.add_argument(
+        "--jobs", type=_positive_int, default=1, help="Tensors validated in parallel"
+    )
     return parser
 
 
 def main() -> None:
+    if sys.argv[1:] in ([], ["info"]):
+        print(_INFO)  # Skips importing argparse, about half of the start-up time.
+        return
     parser = build_parser()
     args = parser.parse_args()
 
     if args.command in (None, "info"):
-        print("t81-python: typed balanced-ternary helpers for AI integration workflows")
+        print(_INFO)
         return
 
     if args.command == "quantize":
+        from .quantization import quantize_float_to_trits
+
         trits = quantize_float_to_trits(args.values, threshold=args.threshold)
         print(" ".join(str(v) for v in trits.to_ints()))
         return
 
     if args.command == "export-hf-json":
+        from .pipelines.hf_export import export_state_dict_to_ternary, load_json_state_dict
+
         state_dict = load_json_state_dict(args.input)
-        manifest = export_state_dict_to_ternary(
-            state_dict,
-            output_dir=args.output,
-            threshold=args.threshold,
-            source=args.input,
-        )
+        profiler = _profiler(args)
+        reporter = _progress(args)
+        try:
+            manifest = export_state_dict_to_ternary(
+                state_dict,
+                output_dir=args.output,
+                threshold=args.threshold,
+                source=args.input,
+                workers=args.jobs,
+                format_version=args.format_version,
+                incremental=args.incremental,
+                calibration=args.calibration,
+                encoding=args.encoding,
+                codec=args.codec,
+                profiler=profiler,
+                progress=reporter,
+            )
+        finally:
+            if reporter is not None:
+                reporter.close()
         print(f"Exported {len(manifest.tensors)} tensors to {args.output}")
+        _write_profile(args, profiler)
         return
 
     if args.command == "export-hf":
-        manifest = export_checkpoint_to_ternary(
-            args.input,
-            output_dir=args.output,
-            threshold=args.threshold,
-        )
+        from .pipelines.hf_export import export_checkpoint_to_ternary
+
+        profiler = _profiler(args)
+        reporter = _progress(args)
+        try:
+            manifest = export_checkpoint_to_ternary(
+                args.input,
+                output_dir=args.output,
+                threshold=args.threshold,
+                max_memory=args.max_memory,
+                workers=args.jobs,
+                format_version=args.format_version,
+                incremental=args.incremental,
+                calibration=args.calibration,
+                encoding=args.encoding,
+                codec=args.codec,
+                profiler=profiler,
+                progress=reporter,
+            )
+        finally:
+            if reporter is not None:
+                reporter.close()
         print(f"Exported {len(manifest.tensors)} tensors to {args.output}")
+        _write_profile(args, profiler)
         return
 
     if args.command == "inspect-artifact":
-        summary = inspect_artifact(args.output)
+        import json
+
+        from .pipelines.hf_export import inspect_artifact
+
+        summary = inspect_artifact(args.output, workers=args.jobs)
         print(
             json.dumps(
                 {
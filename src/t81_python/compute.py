@@ -0,0 +1,107 @@
+"""Matrix products on packed 2-bit ternary weights, without dequantizing them."""
+
+from __future__ import annotations
+
+import math
+from collections.abc import Sequence
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import numpy.typing as npt
+
+from .quantization import _BASE3_UNPACK_LUT, _UNPACK_LUT, packed_size, trits_per_byte
+
+# Decoded float32 weights per tile (256 KiB): small enough to stay in L2 while it is used.
+_TILE_VALUES = 1 << 16
+
+
+def _float_lut(trit_lut: npt.NDArray[np.int8]) -> npt.NDArray[np.float32]:
+    """Map each packed byte to its weights as float32 (invalid bytes decode to NaN)."""
+    lut = trit_lut.astype(np.float32)
+    lut[lut == 2] = np.nan
+    return lut
+
+
+_FLOAT_LUTS = {"2bit": _float_lut(_UNPACK_LUT), "base3": _float_lut(_BASE3_UNPACK_LUT)}
+
+
+def _row_ranges(rows: int, parts: int) -> list[tuple[int, int]]:
+    step = -(-rows // parts)
+    return [(start, min(start + step, rows)) for start in range(0, rows, step)]
+
+
+def ternary_matmul(
+    payload: bytes | memoryview | npt.NDArray[np.uint8],
+    shape: Sequence[int],
+    x: npt.ArrayLike,
+    *,
+    scales: npt.ArrayLike | None = None,
+    workers: int = 1,
+    out: npt.NDArray[np.float32] | None = None,
+    encoding: str = "2bit",
+) -> npt.NDArray[np.float32]:
+    """Compute `W @ x` where `W` is a packed ternary payload of `shape`.
+
+    `W` is read as a `(shape[0], prod(shape[1:]))` matrix. `x` is a float32
+    vector of length `cols` or a `(cols, n)` batch, giving a `(rows,)` or
+    `(rows, n)` result. Packed bytes (`encoding` `2bit` or `base3`) are decoded
+    through a 256-entry float32 lookup table into cache-sized row tiles, each
+    multiplied against `x` and then discarded, so the weights stay packed in
+    memory. `scales` (one value, or one per row as stored by calibrated
+    exports) multiplies the result. `workers > 1` splits the rows across
+    threads; decoding and BLAS both release the GIL. Invalid bytes decode to NaN.
+    """
+    if len(shape) < 2:
+        raise ValueError(f"weights must have at least 2 dimensions, got shape {list(shape)}")
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    rows, cols = int(shape[0]), math.prod(int(dim) for dim in shape[1:])
+    group = trits_per_byte(encoding)
+    lut = _FLOAT_LUTS[encoding]
+    packed = np.frombuffer(payload, dtype=np.uint8)
+    expected = packed_size(rows * cols, encoding)
+    if packed.size != expected:
+        raise ValueError(f"payload has {packed.size} bytes, expected {expected} for {list(shape)}")
+    inputs = np.asarray(x, dtype=np.float32)
+    if inputs.ndim not in (1, 2) or inputs.shape[0] != cols:
+        raise ValueError(f"x must have shape ({cols},) or ({cols}, n), got {inputs.shape}")
+    batch = inputs.reshape(cols, -1)
+    result_shape = (rows,) if inputs.ndim == 1 else (rows, batch.shape[1])
+    if out is None:
+        out = np.empty(result_shape, dtype=np.float32)
+    elif out.dtype != np.float32 or out.shape != result_shape or not out.flags.c_contiguous:
+        raise ValueError(f"out must be a C-contiguous float32 array of shape {result_shape}")
+    result = out.reshape(rows, batch.shape[1])
+    tile_rows = max(1, _TILE_VALUES // max(cols, 1))
+
+    def run_rows(span: tuple[int, int]) -> None:
+        first_row, last_row = span
+        scratch = np.empty((-(-(tile_rows * cols) // group) + 1, group), dtype=np.float32)
+        for r0 in range(first_row, last_row, tile_rows):
+            r1 = min(r0 + tile_rows, last_row)
+            start, stop = r0 * cols, r1 * cols
+            first_byte, last_byte = start // group, -(-stop // group)
+            decoded = scratch[: last_byte - first_byte]
+            np.take(lut, packed[first_byte:last_byte], axis=0, out=decoded)
+            skip = start - first_byte * group
+            weights = decoded.reshape(-1)[skip : skip + stop - start].reshape(r1 - r0, cols)
+            np.matmul(weights, batch, out=result[r0:r1])
+
+    spans = _row_ranges(rows, workers) if rows else []
+    if workers == 1 or len(spans) <= 1:
+        for span in spans:
+            run_rows(span)
+    else:
+        with ThreadPoolExecutor(max_workers=len(spans)) as pool:
+            list(pool.map(run_rows, spans))
+
+    if scales is not None:
+        factors = np.asarray(scales, dtype=np.float32).reshape(-1)
+        if factors.size == 1:
+            result *= factors[0]
+        elif factors.size == rows:
+            result *= factors[:, None]
+        else:
+            raise ValueError(f"expected 1 or {rows} scales, got {factors.size}")
+    return out
+
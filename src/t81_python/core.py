@@ -2,9 +2,12 @@
 
 from __future__ import annotations
 
-from collections.abc import Iterable
-from dataclasses import dataclass
+from collections.abc import Iterable, Iterator
 from enum import IntEnum
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
 
 
 class Trit(IntEnum):
@@ -15,18 +18,85 @@ class Trit(IntEnum):
     POS = 1
 
 
-@dataclass(frozen=True)
 class TritVector:
-    """Immutable vector wrapper used by quantization and adapters."""
+    """Immutable vector wrapper used by quantization and adapters.
+
+    Trits are stored in a read-only int8 ndarray (one byte per trit) rather than
+    as boxed `Trit` instances.
+    """
+
+    __slots__ = ("_data",)
+
+    _data: npt.NDArray[np.int8]
+
+    def __init__(self, values: Iterable[int | Trit] | npt.NDArray[Any] = ()) -> None:
+        if isinstance(values, np.ndarray):
+            raw = values.reshape(-1)
+        else:
+            raw = np.fromiter((int(v) for v in values), dtype=np.int64)
+        if raw.size and (int(raw.min()) < -1 or int(raw.max()) > 1):
+            raise ValueError("TritVector values must be -1, 0 or 1")
+        data = np.array(raw, dtype=np.int8)
+        data.setflags(write=False)
+        object.__setattr__(self, "_data", data)
 
-    values: tuple[Trit, ...]
+    @classmethod
+    def from_ints(cls, values: Iterable[int | Trit] | npt.NDArray[Any]) -> TritVector:
+        return cls(values)
+
+    @classmethod
+    def from_numpy(cls, values: npt.NDArray[np.int8]) -> TritVector:
+        """Wrap an already-validated int8 trit array without copying it."""
+        vector = cls.__new__(cls)
+        data = np.asarray(values, dtype=np.int8).reshape(-1).view()
+        data.setflags(write=False)
+        object.__setattr__(vector, "_data", data)
+        return vector
 
     @classmethod
-    def from_ints(cls, values: Iterable[int]) -> TritVector:
-        return cls(values=tuple(Trit(v) for v in values))
+    def from_packed(cls, payload: bytes, count: int) -> TritVector:
+        """Decode a 2-bit packed payload (see `quantization.pack_trits`)."""
+        from .quantization import unpack_trits_array
+
+        return cls.from_numpy(unpack_trits_array(payload, count))
+
+    @property
+    def values(self) -> tuple[Trit, ...]:
+        """Boxed view of the trits; prefer `as_numpy()` for large vectors."""
+        return tuple(Trit(v) for v in self._data.tolist())
+
+    def as_numpy(self) -> npt.NDArray[np.int8]:
+        """Return a read-only int8 view of the underlying buffer (no copy)."""
+        return self._data
+
+    def packed(self) -> bytes:
+        """Return the 2-bit packed encoding of this vector."""
+        from .quantization import pack_trits_array
+
+        return pack_trits_array(self._data).tobytes()
 
     def to_ints(self) -> list[int]:
-        return [int(v) for v in self.values]
+        return [int(v) for v in self._data.tolist()]
 
     def __len__(self) -> int:
-        return len(self.values)
+        return int(self._data.size)
+
+    def __iter__(self) -> Iterator[Trit]:
+        return (Trit(v) for v in self._data.tolist())
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TritVector):
+            return NotImplemented
+        return bool(np.array_equal(self._data, other._data))
+
+    def __hash__(self) -> int:
+        return hash(self._data.tobytes())
+
+    def __repr__(self) -> str:
+        return f"TritVector({np.array2string(self._data, separator=', ')})"
+
+    def __reduce__(self) -> tuple[type[TritVector], tuple[npt.NDArray[np.int8]]]:
+        return (type(self), (np.array(self._data),))
+
+    def __setattr__(self, name: str, value: object) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
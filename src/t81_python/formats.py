@@ -0,0 +1,15 @@
+"""Names of artifact formats, payload encodings/codecs and export report modes.
+
+Kept free of imports so the CLI can build its parser (and `--help`) without
+loading NumPy or the pipeline modules.
+"""
+
+FORMAT_VERSIONS = ("0.1", "0.2")
+# Payload encodings: "2bit" stores four 2-bit symbols per byte; "base3" stores five
+# trits per byte as d0 + 3*d1 + 9*d2 + 27*d3 + 81*d4 with d = trit + 1 (bytes >= 243 invalid).
+PAYLOAD_ENCODINGS = ("2bit", "base3")
+PAYLOAD_CODECS = ("raw", "sparse", "zlib", "lzma")
+# Export-only choice: `raw` or `sparse` per tensor from a sample of its trits.
+AUTO_CODEC = "auto"
+PROFILE_FORMATS = ("chrome", "json")
+PROGRESS_MODES = ("bar", "json")
@@ -1,6 +1,28 @@
 """Optional ecosystem integrations."""
 
-from .huggingface import is_available as hf_available
-from .llama_cpp import is_available as llama_cpp_available
+from __future__ import annotations
+
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from .huggingface import is_available as hf_available
+    from .llama_cpp import is_available as llama_cpp_available
 
 __all__ = ["hf_available", "llama_cpp_available"]
+
+
+def __getattr__(name: str) -> Any:
+    # `huggingface` imports NumPy; load each adapter only when its check is used.
+    if name == "hf_available":
+        from .huggingface import is_available
+    elif name == "llama_cpp_available":
+        from .llama_cpp import is_available
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = is_available
+    return is_available
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
@@ -3,11 +3,24 @@
 from __future__ import annotations
 
 import importlib.util
+from collections.abc import Callable, Iterator, Sequence
+from fnmatch import fnmatchcase
+from pathlib import Path
 from typing import Any
 
-import numpy as np
+import numpy.typing as npt
 
-from ..quantization import quantize_float_to_trits
+from ..calibration import CalibrationSpec
+from ..pipelines.hf_export import (
+    DEFAULT_CHUNK_VALUES,
+    ExportManifest,
+    _numel,
+    _to_array,
+    export_tensors_to_ternary,
+)
+from ..pipelines.profiling import ExportProfiler
+from ..pipelines.progress import ExportProgress
+from ..quantization import quantize_array_to_trits, quantize_pack_trits
 
 
 def is_available() -> bool:
@@ -22,13 +35,137 @@ def quantize_state_dict(
     *,
     threshold: float = 0.05,
 ) -> dict[str, list[int]]:
-    """Quantize tensor-like state dict entries into plain trit arrays."""
-    quantized: dict[str, list[int]] = {}
-    for key, value in state_dict.items():
-        if hasattr(value, "detach") and hasattr(value, "cpu") and hasattr(value, "numpy"):
-            arr = value.detach().cpu().numpy()
+    """Quantize tensor-like state dict entries into plain trit lists.
+
+    Prefer `quantize_model(..., packed=True)` or `export_model` for real
+    models: a Python int list costs about 8 bytes per trit on top of the ints.
+    """
+    return {
+        key: quantize_array_to_trits(_to_array(value), threshold).tolist()
+        for key, value in state_dict.items()
+    }
+
+
+def _selected(name: str, include: Sequence[str] | None, exclude: Sequence[str]) -> bool:
+    # Patterns match the parameter name or the name of the module that owns it.
+    module = name.rpartition(".")[0]
+
+    def matches(pattern: str) -> bool:
+        return fnmatchcase(name, pattern) or fnmatchcase(module, pattern)
+
+    if include is not None and not any(matches(pattern) for pattern in include):
+        return False
+    return not any(matches(pattern) for pattern in exclude)
+
+
+def iter_model_tensors(
+    model: Any,
+    *,
+    include: Sequence[str] | None = None,
+    exclude: Sequence[str] = (),
+) -> Iterator[tuple[str, Any]]:
+    """Yield `(name, tensor)` for a model's `named_parameters()`, one at a time.
+
+    `include` / `exclude` are `fnmatch` patterns (e.g. `"model.layers.*.mlp.*"`,
+    `"lm_head"`, `"*norm*"`) matched against each parameter name and the name
+    of its owning module; a parameter is kept if it matches some `include`
+    pattern (or `include` is None) and no `exclude` pattern. Tensors are
+    detached views of the live parameters, so nothing is copied here; CUDA
+    parameters are moved to the CPU by the consumer, one tensor at a time.
+    Tied weights appear once, under the first name `named_parameters()` reports.
+    """
+    for name, parameter in model.named_parameters():
+        if _selected(name, include, exclude):
+            yield name, parameter.detach() if hasattr(parameter, "detach") else parameter
+
+
+def quantize_model(
+    model: Any,
+    *,
+    threshold: float = 0.05,
+    include: Sequence[str] | None = None,
+    exclude: Sequence[str] = (),
+    packed: bool = False,
+    encoding: str = "2bit",
+) -> dict[str, npt.NDArray[Any]]:
+    """Quantize a model's parameters into flat int8 trit arrays, or packed payloads.
+
+    Parameters are visited one at a time (see `iter_model_tensors`) and
+    thresholded in their own dtype, so the working set beyond the result is a
+    single CPU copy of the current parameter when the model lives on a GPU.
+    With `packed=True` each value is the `encoding` payload from
+    `quantize_pack_trits` (a quarter of the int8 size for `"2bit"`); unpack it
+    with `unpack_trits_array(payload, param.numel(), encoding)`.
+    """
+    quantized: dict[str, npt.NDArray[Any]] = {}
+    for name, tensor in iter_model_tensors(model, include=include, exclude=exclude):
+        arr = _to_array(tensor)
+        del tensor
+        if packed:
+            quantized[name] = quantize_pack_trits(arr, threshold, encoding=encoding)[0]
         else:
-            arr = np.asarray(value)
-        trits = quantize_float_to_trits(arr.ravel().tolist(), threshold=threshold)
-        quantized[key] = trits.to_ints()
+            quantized[name] = quantize_array_to_trits(arr, threshold)
     return quantized
+
+
+def _model_source(model: Any) -> str:
+    config = getattr(model, "config", None)
+    name = getattr(config, "_name_or_path", None) or getattr(config, "name_or_path", None)
+    return str(name) if name else type(model).__name__
+
+
+def export_model(
+    model: Any,
+    output_dir: str | Path,
+    *,
+    include: Sequence[str] | None = None,
+    exclude: Sequence[str] = (),
+    threshold: float = 0.05,
+    source: str | None = None,
+    max_memory: int | None = None,
+    workers: int = 1,
+    chunk_values: int = DEFAULT_CHUNK_VALUES,
+    format_version: str = "0.1",
+    incremental: bool = False,
+    calibration: str | CalibrationSpec = "fixed",
+    encoding: str = "2bit",
+    codec: str = "raw",
+    profiler: ExportProfiler | None = None,
+    progress: Callable[[ExportProgress], None] | None = None,
+) -> ExportManifest:
+    """Stream a loaded model's parameters into packed ternary artifacts.
+
+    Parameters are pulled from `iter_model_tensors(model, include=..., exclude=...)`
+    and written by `export_tensors_to_ternary` in chunks, so exporting a model
+    already in memory adds at most one parameter's CPU copy (none for CPU
+    float parameters) plus the bounded in-flight chunks. `source` defaults to
+    the model's `config._name_or_path`, else its class name; the remaining
+    options are those of `export_tensors_to_ternary`.
+    """
+    total_tensors = total_values = None
+    if progress is not None:
+        sizes = [
+            _numel(tensor)
+            for _, tensor in iter_model_tensors(model, include=include, exclude=exclude)
+        ]
+        total_tensors = len(sizes)
+        if all(size is not None for size in sizes):
+            total_values = sum(size or 0 for size in sizes)
+    return export_tensors_to_ternary(
+        iter_model_tensors(model, include=include, exclude=exclude),
+        output_dir,
+        threshold=threshold,
+        source=_model_source(model) if source is None else source,
+        max_memory=max_memory,
+        workers=workers,
+        chunk_values=chunk_values,
+        format_version=format_version,
+        incremental=incremental,
+        calibration=calibration,
+        encoding=encoding,
+        codec=codec,
+        profiler=profiler,
+        progress=progress,
+        total_tensors=total_tensors,
+        total_values=total_values,
+    )
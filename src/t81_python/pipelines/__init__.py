@@ -1,23 +1,95 @@
-"""Pipeline entrypoints."""
-
-from .hf_export import (
-    ArtifactInspection,
-    ExportManifest,
-    export_checkpoint_to_ternary,
-    export_state_dict_to_ternary,
-    inspect_artifact,
-    load_checkpoint_state_dict,
-    load_json_state_dict,
-    read_manifest,
-)
+"""Pipeline entrypoints.
+
+Names are resolved on first access, so `import t81_python.pipelines` (or a
+stdlib-only submodule such as `profiling`) does not load NumPy.
+"""
+
+from __future__ import annotations
+
+import importlib
+
+# `typing` is not imported at run time: it is a measurable part of CLI start-up.
+TYPE_CHECKING = False
+if TYPE_CHECKING:
+    from typing import Any
+
+    from ..formats import FORMAT_VERSIONS, PAYLOAD_CODECS, PAYLOAD_ENCODINGS
+    from .artifact_reader import ArtifactReader, ArtifactTensor
+    from .codecs import decode_payload, encode_payload
+    from .hf_export import (
+        DEFAULT_CHUNK_VALUES,
+        ArtifactInspection,
+        ExportManifest,
+        export_checkpoint_to_ternary,
+        export_state_dict_to_ternary,
+        export_tensors_to_ternary,
+        inspect_artifact,
+        iter_checkpoint_tensors,
+        load_checkpoint_state_dict,
+        load_json_state_dict,
+        read_manifest,
+    )
+    from .profiling import ExportProfiler
+    from .progress import ExportProgress, ProgressReporter
+
+# Public name -> module that defines it (relative to this package).
+_EXPORTS = {
+    "DEFAULT_CHUNK_VALUES": ".hf_export",
+    "FORMAT_VERSIONS": "..formats",
+    "PAYLOAD_CODECS": "..formats",
+    "PAYLOAD_ENCODINGS": "..formats",
+    "ArtifactInspection": ".hf_export",
+    "ArtifactReader": ".artifact_reader",
+    "ArtifactTensor": ".artifact_reader",
+    "ExportManifest": ".hf_export",
+    "ExportProfiler": ".profiling",
+    "ExportProgress": ".progress",
+    "ProgressReporter": ".progress",
+    "decode_payload": ".codecs",
+    "encode_payload": ".codecs",
+    "export_checkpoint_to_ternary": ".hf_export",
+    "export_state_dict_to_ternary": ".hf_export",
+    "export_tensors_to_ternary": ".hf_export",
+    "inspect_artifact": ".hf_export",
+    "iter_checkpoint_tensors": ".hf_export",
+    "load_checkpoint_state_dict": ".hf_export",
+    "load_json_state_dict": ".hf_export",
+    "read_manifest": ".hf_export",
+}
 
 __all__ = [
+    "DEFAULT_CHUNK_VALUES",
+    "FORMAT_VERSIONS",
+    "PAYLOAD_CODECS",
+    "PAYLOAD_ENCODINGS",
     "ArtifactInspection",
+    "ArtifactReader",
+    "ArtifactTensor",
     "ExportManifest",
+    "ExportProfiler",
+    "ExportProgress",
+    "ProgressReporter",
+    "decode_payload",
+    "encode_payload",
     "export_checkpoint_to_ternary",
     "export_state_dict_to_ternary",
+    "export_tensors_to_ternary",
     "inspect_artifact",
+    "iter_checkpoint_tensors",
     "load_checkpoint_state_dict",
     "load_json_state_dict",
     "read_manifest",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *__all__})
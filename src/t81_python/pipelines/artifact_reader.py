@@ -0,0 +1,222 @@
+"""Memory-mapped, lazily decoded access to exported ternary artifacts."""
+
+from __future__ import annotations
+
+import math
+import mmap
+import os
+from collections.abc import Iterator
+from pathlib import Path
+from types import TracebackType
+
+import numpy as np
+import numpy.typing as npt
+
+from t81_python.compute import ternary_matmul
+from t81_python.pipelines.codecs import decode_payload
+from t81_python.pipelines.container import locate_artifact
+from t81_python.pipelines.hf_export import ExportManifest, TensorExportSummary, read_manifest
+from t81_python.quantization import dequantize_trits, trits_per_byte, unpack_trits_array
+
+
+class ArtifactTensor:
+    """Lazy view over one packed tensor payload; nothing is decoded until asked."""
+
+    def __init__(
+        self,
+        summary: TensorExportSummary,
+        payload: memoryview,
+        scales: memoryview | None = None,
+    ) -> None:
+        self.summary = summary
+        self._stored = payload
+        self._payload: memoryview | None = payload if summary.codec == "raw" else None
+        self._scales = scales
+
+    @property
+    def name(self) -> str:
+        return self.summary.name
+
+    @property
+    def shape(self) -> tuple[int, ...]:
+        return tuple(self.summary.shape)
+
+    @property
+    def numel(self) -> int:
+        return self.summary.numel
+
+    def packed(self) -> memoryview:
+        """Return the packed payload (see `summary.encoding`) as a memoryview.
+
+        `raw` payloads are zero-copy views of the mapping; other codecs (see
+        `summary.codec`) are decoded on first access and kept for later calls.
+        Raises ValueError if a coded payload is malformed.
+        """
+        if self._payload is None:
+            decoded = decode_payload(
+                self._stored, self.numel, self.summary.codec, self.summary.encoding
+            )
+            self._payload = decoded.data
+        return self._payload
+
+    def trits(self, start: int = 0, stop: int | None = None) -> npt.NDArray[np.int8]:
+        """Decode the flat element range `[start, stop)` to int8 trits.
+
+        Only the bytes covering the range are read from the mapping.
+        """
+        stop = self.numel if stop is None else stop
+        if not 0 <= start <= stop <= self.numel:
+            raise IndexError(f"range [{start}, {stop}) out of bounds for {self.numel} trits")
+        encoding = self.summary.encoding
+        group = trits_per_byte(encoding)
+        first_byte = start // group
+        last_byte = -(-stop // group)
+        window = self.packed()[first_byte:last_byte]
+        decoded = unpack_trits_array(window, (last_byte - first_byte) * group, encoding)
+        offset = first_byte * group
+        return decoded[start - offset : stop - offset]
+
+    def scales(self) -> npt.NDArray[np.float32] | None:
+        """Stored calibration scales (one per channel along axis 0, or one per tensor)."""
+        count = self.summary.scale_count
+        if count is None or self._scales is None:
+            return None
+        if len(self._scales) != 2 * count:
+            found = len(self._scales) // 2
+            raise ValueError(f"{self.name}: expected {count} scales, found {found}")
+        return np.frombuffer(self._scales, dtype="<f2").astype(np.float32)
+
+    def _dequantize(
+        self, trits: npt.NDArray[np.int8], first_row: int, rows: int, scale: float | None
+    ) -> npt.NDArray[np.float32]:
+        scales = None if scale is not None else self.scales()
+        if scales is None:
+            return dequantize_trits(trits, scale=1.0 if scale is None else scale)
+        if scales.size == 1:
+            return dequantize_trits(trits, scale=float(scales[0]))
+        values = trits.reshape(rows, trits.size // max(rows, 1)).astype(np.float32)
+        values *= scales[first_row : first_row + rows, None]
+        return values.reshape(-1)
+
+    def to_numpy(self, scale: float | None = None) -> npt.NDArray[np.float32]:
+        """Dequantize the whole tensor to float32 with the manifest `shape`.
+
+        Stored calibration scales are applied unless `scale` is given; without
+        either, trits map to -1.0/0.0/+1.0.
+        """
+        rows = self.shape[0] if self.shape else 1
+        return self._dequantize(self.trits(), 0, rows, scale).reshape(self.shape)
+
+    def rows(self, start: int, stop: int, scale: float | None = None) -> npt.NDArray[np.float32]:
+        """Dequantize rows `[start, stop)` along the first axis without decoding the rest."""
+        if not self.shape:
+            raise ValueError(f"{self.name} is a scalar and has no rows")
+        row_size = math.prod(self.shape[1:])
+        stop = min(stop, self.shape[0])
+        start = min(start, stop)
+        trits = self.trits(start * row_size, stop * row_size)
+        values = self._dequantize(trits, start, stop - start, scale)
+        return values.reshape((stop - start, *self.shape[1:]))
+
+    def matmul(
+        self, x: npt.ArrayLike, *, scale: float | None = None, workers: int = 1
+    ) -> npt.NDArray[np.float32]:
+        """`W @ x` straight from the packed payload (see `compute.ternary_matmul`).
+
+        Stored calibration scales are applied unless `scale` is given.
+        """
+        scales = self.scales() if scale is None else scale
+        return ternary_matmul(
+            self.packed(),
+            self.shape,
+            x,
+            scales=scales,
+            workers=workers,
+            encoding=self.summary.encoding,
+        )
+
+    def __len__(self) -> int:
+        return self.shape[0] if self.shape else 1
+
+    def __repr__(self) -> str:
+        return f"ArtifactTensor(name={self.name!r}, shape={self.shape})"
+
+
+class ArtifactReader:
+    """Open an exported artifact and map payloads on first access.
+
+    `path` may be a 0.1 artifact directory, a 0.2 container file, or a directory
+    holding one. Payload files are mapped read-only, so opening is O(manifest
+    size) and the page cache is shared by every process reading the artifact.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        located = locate_artifact(path)
+        self.root = located.parent
+        self.manifest: ExportManifest = read_manifest(located)
+        self._tensors = {tensor.name: tensor for tensor in self.manifest.tensors}
+        self._maps: dict[str, mmap.mmap] = {}
+
+    def _map(self, filename: str) -> memoryview:
+        mapped = self._maps.get(filename)
+        if mapped is None:
+            with (self.root / filename).open("rb") as handle:
+                if os.fstat(handle.fileno()).st_size == 0:
+                    return memoryview(b"")
+                mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+            self._maps[filename] = mapped
+        return memoryview(mapped)
+
+    def _payload(self, summary: TensorExportSummary) -> memoryview:
+        if summary.numel == 0:
+            return memoryview(b"")
+        view = self._map(summary.payload_file)
+        if summary.payload_offset is None:
+            return view
+        return view[summary.payload_offset : summary.payload_offset + (summary.payload_length or 0)]
+
+    def _scale_view(self, summary: TensorExportSummary) -> memoryview | None:
+        if summary.scale_file is None or summary.scale_count is None:
+            return None
+        try:
+            view = self._map(summary.scale_file)
+        except FileNotFoundError:
+            return memoryview(b"")
+        offset = summary.scale_offset or 0
+        return view[offset : offset + 2 * summary.scale_count]
+
+    def names(self) -> list[str]:
+        return list(self._tensors)
+
+    def __getitem__(self, name: str) -> ArtifactTensor:
+        summary = self._tensors[name]
+        return ArtifactTensor(summary, self._payload(summary), self._scale_view(summary))
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._tensors
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._tensors)
+
+    def __len__(self) -> int:
+        return len(self._tensors)
+
+    def close(self) -> None:
+        """Release mappings; ones still referenced by live views close when collected."""
+        for mapped in self._maps.values():
+            try:
+                mapped.close()
+            except BufferError:
+                pass
+        self._maps.clear()
+
+    def __enter__(self) -> ArtifactReader:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
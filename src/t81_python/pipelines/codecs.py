@@ -0,0 +1,152 @@
+"""Per-tensor payload codecs layered over the packed trit encodings.
+
+A codec turns a tensor's packed payload (`2bit` or `base3`, see
+`quantization.PAYLOAD_ENCODINGS`) into the bytes stored in the artifact:
+
+- `raw`: the packed payload itself (memory-mappable, zero-copy reads).
+- `sparse`: a bitmap of non-zero trits (1 bit per trit) followed by one sign
+  bit per non-zero trit (1 = +1), both `np.packbits` little-endian bit order.
+- `zlib` / `lzma`: the packed payload compressed in independent per-chunk
+  streams, concatenated.
+"""
+
+from __future__ import annotations
+
+import io
+import lzma
+import zlib
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
+
+from t81_python.formats import AUTO_CODEC as AUTO_CODEC
+from t81_python.formats import PAYLOAD_CODECS as PAYLOAD_CODECS
+from t81_python.quantization import pack_trits_array, packed_size, unpack_trits_array
+
+# `auto` picks `sparse` only when it is at least this much smaller than `raw`.
+_AUTO_MIN_SAVING = 0.1
+# Values quantized to estimate a tensor's zero fraction for `auto`.
+AUTO_SAMPLE_VALUES = 1 << 16
+
+# One encoded chunk: bytes to store now, plus sign bits still to be packed (`sparse`).
+CodecChunk = tuple[npt.NDArray[np.uint8], "npt.NDArray[np.bool_] | None"]
+
+
+def check_codec(codec: str, *, allow_auto: bool = False) -> None:
+    choices = (*PAYLOAD_CODECS, AUTO_CODEC) if allow_auto else PAYLOAD_CODECS
+    if codec not in choices:
+        raise ValueError(f"Unknown payload codec {codec!r}; expected one of {choices}")
+
+
+def sparse_size(count: int, nonzero: int) -> int:
+    """Stored bytes of a `sparse` payload with `nonzero` of `count` trits set."""
+    return -(-count // 8) + -(-nonzero // 8)
+
+
+def choose_codec(counts: tuple[int, int, int], encoding: str = "2bit") -> str:
+    """`sparse` if the `(neg, zero, pos)` distribution makes it clearly smaller, else `raw`."""
+    neg, zero, pos = counts
+    count = neg + zero + pos
+    dense = packed_size(count, encoding)
+    return "sparse" if sparse_size(count, neg + pos) <= dense * (1 - _AUTO_MIN_SAVING) else "raw"
+
+
+def encode_chunk(
+    packed: npt.NDArray[np.uint8], count: int, codec: str, encoding: str = "2bit"
+) -> CodecChunk:
+    """Encode one packed chunk of `count` trits (a multiple of 8 except the last for `sparse`)."""
+    if codec == "raw":
+        return packed, None
+    if codec == "sparse":
+        trits = unpack_trits_array(packed, count, encoding)
+        nonzero = trits != 0
+        return np.packbits(nonzero, bitorder="little"), trits[nonzero] > 0
+    compressed = zlib.compress(packed.data) if codec == "zlib" else lzma.compress(packed.data)
+    return np.frombuffer(compressed, dtype=np.uint8), None
+
+
+class CodecStream:
+    """Join encoded chunks of one payload in order.
+
+    `sparse` bitmaps are written as they arrive; sign bits are packed through
+    a sub-byte carry into a side buffer (at most `count / 8` bytes) that
+    `finish()` returns to be appended after the bitmap.
+    """
+
+    def __init__(self, codec: str) -> None:
+        self.codec = codec
+        self._signs = io.BytesIO()
+        self._carry = np.empty(0, dtype=np.bool_)
+
+    def feed(self, chunk: CodecChunk) -> npt.NDArray[np.uint8]:
+        data, signs = chunk
+        if signs is not None:
+            bits = np.concatenate((self._carry, signs)) if self._carry.size else signs
+            whole = bits.size // 8 * 8
+            self._signs.write(np.packbits(bits[:whole], bitorder="little").tobytes())
+            self._carry = bits[whole:]
+        return data
+
+    def finish(self) -> bytes:
+        if self._carry.size:
+            self._signs.write(np.packbits(self._carry, bitorder="little").tobytes())
+            self._carry = np.empty(0, dtype=np.bool_)
+        return self._signs.getvalue()
+
+
+def encode_payload(
+    packed: npt.NDArray[np.uint8], count: int, codec: str, encoding: str = "2bit"
+) -> bytes:
+    """Encode a whole packed payload of `count` trits with `codec`."""
+    check_codec(codec)
+    stream = CodecStream(codec)
+    data = stream.feed(encode_chunk(packed, count, codec, encoding))
+    return data.tobytes() + stream.finish()
+
+
+def _decompress_zlib(stored: Any) -> bytes:
+    out = bytearray()
+    data = bytes(stored)
+    while data:
+        stream = zlib.decompressobj()
+        out += stream.decompress(data)
+        if not stream.eof:
+            raise ValueError("Truncated zlib payload")
+        data = stream.unused_data
+    return bytes(out)
+
+
+def decode_payload(
+    stored: bytes | memoryview | npt.NDArray[np.uint8],
+    count: int,
+    codec: str,
+    encoding: str = "2bit",
+) -> npt.NDArray[np.uint8]:
+    """Decode stored payload bytes back to the packed `encoding` payload of `count` trits.
+
+    Raises ValueError for malformed input.
+    """
+    check_codec(codec)
+    raw = np.frombuffer(stored, dtype=np.uint8)
+    if codec == "raw":
+        return raw
+    if codec == "sparse":
+        bitmap_bytes = -(-count // 8)
+        if raw.size < bitmap_bytes:
+            raise ValueError(f"Sparse payload too short for {count} trits")
+        mask = np.unpackbits(raw[:bitmap_bytes], count=count, bitorder="little").view(np.bool_)
+        nonzero = int(np.count_nonzero(mask))
+        if raw.size != sparse_size(count, nonzero):
+            raise ValueError(f"Sparse payload has {raw.size} bytes for {nonzero} non-zero trits")
+        signs = np.unpackbits(raw[bitmap_bytes:], count=nonzero, bitorder="little")
+        trits = np.zeros(count, dtype=np.int8)
+        trits[mask] = signs.view(np.int8) * 2 - 1
+        return pack_trits_array(trits, encoding)
+    if raw.size == 0:
+        return raw  # Empty tensors are stored without a stream.
+    try:
+        data = _decompress_zlib(raw) if codec == "zlib" else lzma.decompress(raw.tobytes())
+    except (zlib.error, lzma.LZMAError) as exc:
+        raise ValueError(f"Corrupt {codec} payload: {exc}") from exc
+    return np.frombuffer(data, dtype=np.uint8)
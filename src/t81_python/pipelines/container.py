@@ -0,0 +1,123 @@
+"""Single-file artifact container (format_version 0.2) layout helpers.
+
+Layout (little-endian):
+
+- bytes 0-31: header = magic `T81PACK\\0`, u16 major, u16 minor, u32 flags (0),
+  u64 index offset, u64 index length; zero-padded to 64 bytes
+- payloads: one per tensor, each starting on a 64-byte boundary
+- index: UTF-8 JSON manifest (64-byte aligned) whose tensor entries carry
+  `payload_offset` / `payload_length` into this file
+
+The file is written as `<name>.partial` and renamed into place once the
+header has been written last, so an interrupted export never replaces or
+looks like a valid container.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import struct
+from pathlib import Path
+from typing import Any, BinaryIO
+
+CONTAINER_FILE = "artifact.t81"
+MANIFEST_FILE = "manifest.json"
+CONTAINER_MAGIC = b"T81PACK\0"
+CONTAINER_VERSION = (0, 2)
+PAYLOAD_ALIGNMENT = 64
+PARTIAL_SUFFIX = ".partial"
+
+_HEADER = struct.Struct("<8sHHIQQ")
+
+
+def partial_path(path: Path) -> Path:
+    """Path a container is written to before it is renamed into place."""
+    return path.with_name(path.name + PARTIAL_SUFFIX)
+
+
+def align_offset(offset: int) -> int:
+    return -(-offset // PAYLOAD_ALIGNMENT) * PAYLOAD_ALIGNMENT
+
+
+def is_container(path: Path) -> bool:
+    """Return True when `path` is a file starting with the container magic."""
+    if not path.is_file():
+        return False
+    with path.open("rb") as handle:
+        return handle.read(len(CONTAINER_MAGIC)) == CONTAINER_MAGIC
+
+
+def locate_artifact(path: str | Path) -> Path:
+    """Resolve an artifact directory to its `manifest.json` (0.1) or container (0.2).
+
+    Raises ValueError when the directory holds both, since either may be stale.
+    """
+    target = Path(path)
+    if not target.is_dir():
+        return target
+    found = [
+        candidate
+        for candidate in (target / MANIFEST_FILE, target / CONTAINER_FILE)
+        if candidate.exists()
+    ]
+    if len(found) > 1:
+        raise ValueError(
+            f"{target} holds both {MANIFEST_FILE} and {CONTAINER_FILE}; "
+            "re-export it or remove the stale one"
+        )
+    if not found:
+        raise FileNotFoundError(f"No {MANIFEST_FILE} or {CONTAINER_FILE} found in {target}")
+    return found[0]
+
+
+def read_index(path: Path) -> dict[str, Any]:
+    """Read and decode the JSON index of a container file."""
+    with path.open("rb") as handle:
+        magic, major, minor, _flags, index_offset, index_length = _HEADER.unpack(
+            handle.read(_HEADER.size)
+        )
+        if magic != CONTAINER_MAGIC:
+            raise ValueError(f"Not a t81 artifact container: {path}")
+        if (major, minor) != CONTAINER_VERSION:
+            raise ValueError(f"Unsupported container version {major}.{minor} in {path}")
+        handle.seek(index_offset)
+        index = json.loads(handle.read(index_length).decode("utf-8"))
+    if not isinstance(index, dict):
+        raise ValueError(f"Malformed container index in {path}")
+    return index
+
+
+class ContainerWriter:
+    """Append aligned payloads to a container file, then seal it with index + header."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.partial = partial_path(path)
+        self.handle: BinaryIO = self.partial.open("wb")
+        self.handle.write(b"\0" * PAYLOAD_ALIGNMENT)
+
+    def begin_payload(self) -> int:
+        """Pad to the next payload boundary and return its offset."""
+        position = self.handle.tell()
+        aligned = align_offset(position)
+        self.handle.write(b"\0" * (aligned - position))
+        return aligned
+
+    def finish(self, index: dict[str, Any]) -> None:
+        index_offset = self.begin_payload()
+        data = json.dumps(index, indent=2).encode("utf-8")
+        self.handle.write(data)
+        self.handle.seek(0)
+        major, minor = CONTAINER_VERSION
+        self.handle.write(
+            _HEADER.pack(CONTAINER_MAGIC, major, minor, 0, index_offset, len(data))
+        )
+        self.handle.close()
+        os.replace(self.partial, self.path)
+
+    def abort(self, *, keep_partial: bool = False) -> None:
+        """Close the file; the partial container is kept only when it can be resumed from."""
+        self.handle.close()
+        if not keep_partial:
+            self.partial.unlink(missing_ok=True)
@@ -2,17 +2,82 @@
 
 from __future__ import annotations
 
+import hashlib
 import importlib.util
 import json
-from dataclasses import asdict, dataclass
+import math
+import mmap
+import os
+import time
+from collections import deque
+from collections.abc import Callable, Iterable, Iterator, Sized
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import asdict, dataclass, replace
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any
+from typing import Any, BinaryIO, TypeVar
 
 import numpy as np
 import numpy.typing as npt
 
-from t81_python.quantization import pack_trits, quantize_float_to_trits, unpack_trits
+from t81_python.calibration import CalibrationSpec, calibrate
+from t81_python.formats import FORMAT_VERSIONS as FORMAT_VERSIONS
+from t81_python.pipelines.codecs import (
+    AUTO_CODEC,
+    AUTO_SAMPLE_VALUES,
+    CodecChunk,
+    CodecStream,
+    check_codec,
+    choose_codec,
+    encode_chunk,
+)
+from t81_python.pipelines.container import (
+    CONTAINER_FILE,
+    MANIFEST_FILE,
+    ContainerWriter,
+    is_container,
+    locate_artifact,
+    partial_path,
+    read_index,
+)
+from t81_python.pipelines.profiling import ExportProfiler
+from t81_python.pipelines.progress import ExportProgress, ProgressTracker
+from t81_python.quantization import (
+    PAYLOAD_ENCODINGS,
+    count_packed_trits,
+    packed_size,
+    quantize_array_to_trits,
+    quantize_pack_trits,
+    trits_per_byte,
+)
+
+# Values quantized per work item; large tensors are split into chunks of this size.
+DEFAULT_CHUNK_VALUES = 1 << 22
+# int8 trits + packed output + packing scratch, per value in flight.
+_WORKING_BYTES_PER_VALUE = 3
+# Incremental exports log each finished tensor here so a killed run can resume.
+EXPORT_JOURNAL = ".t81-export.journal"
+# Tensors are hashed in fixed-size blocks (in parallel) and the block digests hashed
+# again, so a content hash never depends on `workers`, `chunk_values` or `max_memory`.
+_HASH_BLOCK_BYTES = 1 << 24
+_RESUME_SUFFIX = ".resume"
+_COPY_BLOCK_BYTES = 1 << 24
+
+_T = TypeVar("_T")
+
+_SAFETENSORS_DTYPES: dict[str, Any] = {
+    "F64": np.float64,
+    "F32": np.float32,
+    "F16": np.float16,
+    "BF16": np.uint16,
+    "I64": np.int64,
+    "I32": np.int32,
+    "I16": np.int16,
+    "I8": np.int8,
+    "U8": np.uint8,
+    "BOOL": np.bool_,
+}
 
 
 @dataclass(frozen=True)
@@ -23,6 +88,15 @@ class TensorExportSummary:
     threshold: float
     counts: dict[str, int]
     payload_file: str
+    payload_offset: int | None = None
+    payload_length: int | None = None
+    content_hash: str | None = None
+    calibration: str | None = None
+    scale_file: str | None = None
+    scale_offset: int | None = None
+    scale_count: int | None = None
+    encoding: str = "2bit"
+    codec: str = "raw"
 
 
 @dataclass(frozen=True)
@@ -43,79 +117,791 @@ class ArtifactInspection:
     per_tensor_payload_ok: dict[str, bool]
 
 
-def _to_numpy(value: Any) -> npt.NDArray[np.float32]:
+def _to_array(value: Any) -> Any:
+    """Return a CPU tensor or float ndarray for `value`, copying only non-float inputs."""
     if hasattr(value, "detach") and hasattr(value, "cpu") and hasattr(value, "numpy"):
-        arr = np.asarray(value.detach().cpu().numpy(), dtype=np.float32)
-        return arr
-    arr = np.asarray(value, dtype=np.float32)
-    return arr
+        return value.detach().cpu()
+    if isinstance(value, np.ndarray) and value.dtype.kind == "f":
+        return value
+    return np.asarray(value, dtype=np.float32)
 
 
-def export_state_dict_to_ternary(
-    state_dict: dict[str, Any],
+def _nbytes(arr: Any) -> int:
+    if hasattr(arr, "element_size"):
+        return int(arr.numel() * arr.element_size())
+    return int(arr.nbytes)
+
+
+def _numel(value: Any) -> int | None:
+    """Element count of an array or tensor without converting it, else None."""
+    if hasattr(value, "numel"):
+        return int(value.numel())
+    if isinstance(value, np.ndarray):
+        return int(value.size)
+    return None
+
+
+def _content_hash(arr: Any, map_fn: Callable[..., Iterable[bytes]] = map) -> str:
+    """SHA-256 over dtype, shape and raw bytes of `arr`; blocks are hashed via `map_fn`."""
+    if hasattr(arr, "detach"):
+        dtype_name = str(arr.dtype).removeprefix("torch.")
+        tensor = arr.contiguous()
+        if dtype_name == "bfloat16":
+            import torch
+
+            tensor = tensor.view(torch.int16)
+        data = tensor.numpy()
+    else:
+        data = np.ascontiguousarray(arr)
+        dtype_name = data.dtype.name
+    raw = np.ascontiguousarray(data).reshape(-1).view(np.uint8).data
+
+    def hash_block(start: int) -> bytes:
+        return hashlib.sha256(raw[start : start + _HASH_BLOCK_BYTES]).digest()
+
+    digest = hashlib.sha256(f"{dtype_name}{list(data.shape)}".encode())
+    for block in map_fn(hash_block, range(0, len(raw), _HASH_BLOCK_BYTES)):
+        digest.update(block)
+    return f"sha256:{digest.hexdigest()}"
+
+
+def _chunk_values(chunk_values: int, max_memory: int | None, in_flight: int) -> int:
+    """Values per chunk so `in_flight` chunks stay under `max_memory` (bytes)."""
+    if chunk_values <= 0 or chunk_values % 4:
+        raise ValueError(f"chunk_values must be a positive multiple of 4, got {chunk_values}")
+    if max_memory is None:
+        return chunk_values
+    if max_memory <= 0:
+        raise ValueError(f"max_memory must be positive, got {max_memory}")
+    # Whole 4-trit groups keep every packed chunk byte-aligned.
+    budget = max_memory // in_flight // _WORKING_BYTES_PER_VALUE // 4 * 4
+    return max(4, min(chunk_values, budget))
+
+
+def _encode_chunk(
+    flat: Any,
+    start: int,
+    stop: int,
+    threshold: float | npt.NDArray[np.float64],
+    channel_size: int | None = None,
+    encoding: str = "2bit",
+    codec: str = "raw",
+) -> tuple[CodecChunk, dict[str, int]]:
+    packed, (neg, zero, pos) = quantize_pack_trits(
+        flat[start:stop],
+        threshold=threshold,
+        channel_size=channel_size,
+        offset=start,
+        encoding=encoding,
+    )
+    return encode_chunk(packed, stop - start, codec, encoding), {"-1": neg, "0": zero, "+1": pos}
+
+
+def _profiled_encode_chunk(
+    profiler: ExportProfiler, name: str, flat: Any, start: int, stop: int, *args: Any
+) -> tuple[CodecChunk, dict[str, int]]:
+    began = time.perf_counter_ns()
+    result = _encode_chunk(flat, start, stop, *args)
+    profiler.record(
+        "quantize_pack",
+        name,
+        began,
+        bytes_in=_nbytes(flat[start:stop]),
+        bytes_out=int(result[0][0].nbytes),
+    )
+    return result
+
+
+def _auto_codec(flat: Any, threshold: float, encoding: str) -> str:
+    """Pick `raw` or `sparse` for a tensor from a strided sample of its trits."""
+    numel = int(flat.shape[0])
+    if numel == 0:
+        return "raw"
+    sample = quantize_array_to_trits(flat[:: max(1, numel // AUTO_SAMPLE_VALUES)], threshold)
+    nonzero = int(np.count_nonzero(sample))
+    positive = int(np.count_nonzero(sample > 0))
+    return choose_codec((nonzero - positive, sample.size - nonzero, positive), encoding)
+
+
+def _manifest_files(out_dir: Path) -> set[str]:
+    """Payload and scale files referenced by the 0.1 `manifest.json` in `out_dir`, if any."""
+    try:
+        manifest = read_manifest(out_dir / MANIFEST_FILE)
+    except (OSError, ValueError, KeyError):
+        return set()
+    files = set()
+    for tensor in manifest.tensors:
+        files.add(tensor.payload_file)
+        if tensor.scale_file is not None:
+            files.add(tensor.scale_file)
+    # Only plain file names inside `out_dir` are ever deleted.
+    return {name for name in files if Path(name).name == name and name != CONTAINER_FILE}
+
+
+class _DirectorySink:
+    """format_version 0.1: one `.t81bin` file per tensor next to `manifest.json`."""
+
+    def __init__(self, out_dir: Path) -> None:
+        self.out_dir = out_dir
+
+    @staticmethod
+    def payload_file(name: str) -> str:
+        safe_name = name.replace("/", "_").replace(".", "_")
+        return f"{safe_name}.t81bin"
+
+    @staticmethod
+    def scale_file(name: str) -> str:
+        safe_name = name.replace("/", "_").replace(".", "_")
+        return f"{safe_name}.t81scale"
+
+    def open(self, name: str) -> tuple[BinaryIO, str, int | None]:
+        payload_file = self.payload_file(name)
+        return (self.out_dir / payload_file).open("wb"), payload_file, None
+
+    def close(self, handle: BinaryIO) -> None:
+        handle.close()
+
+    def write_scales(self, name: str, data: bytes) -> tuple[str, int | None]:
+        scale_file = self.scale_file(name)
+        (self.out_dir / scale_file).write_bytes(data)
+        return scale_file, None
+
+    def finish(self, index: dict[str, Any]) -> None:
+        previous = _manifest_files(self.out_dir)
+        (self.out_dir / MANIFEST_FILE).write_text(
+            json.dumps(index, indent=2) + "\n", encoding="utf-8"
+        )
+        # Payloads of dropped tensors and scales of tensors no longer calibrated.
+        referenced: set[str | None] = set()
+        for row in index["tensors"]:
+            referenced.add(row["payload_file"])
+            referenced.add(row.get("scale_file"))
+        for name in previous - referenced:
+            (self.out_dir / name).unlink(missing_ok=True)
+        # Drop a 0.2 container from an earlier export: readers refuse a directory with both.
+        (self.out_dir / CONTAINER_FILE).unlink(missing_ok=True)
+
+    def abort(self, *, resumable: bool = False) -> None:
+        pass
+
+
+class _ContainerSink:
+    """format_version 0.2: aligned payloads appended to a single container file."""
+
+    def __init__(self, out_dir: Path) -> None:
+        self.out_dir = out_dir
+        self.writer = ContainerWriter(out_dir / CONTAINER_FILE)
+
+    def open(self, name: str) -> tuple[BinaryIO, str, int | None]:
+        return self.writer.handle, CONTAINER_FILE, self.writer.begin_payload()
+
+    def close(self, handle: BinaryIO) -> None:
+        pass
+
+    def write_scales(self, name: str, data: bytes) -> tuple[str, int | None]:
+        offset = self.writer.begin_payload()
+        self.writer.handle.write(data)
+        return CONTAINER_FILE, offset
+
+    def finish(self, index: dict[str, Any]) -> None:
+        self.writer.finish(index)
+        # Remove a 0.1 export of the same directory so readers find the container.
+        for name in _manifest_files(self.out_dir):
+            (self.out_dir / name).unlink(missing_ok=True)
+        (self.out_dir / MANIFEST_FILE).unlink(missing_ok=True)
+
+    def abort(self, *, resumable: bool = False) -> None:
+        self.writer.abort(keep_partial=resumable)
+
+
+class _PayloadWriter:
+    """Append packed chunks of one tensor in order and accumulate its counts."""
+
+    def __init__(
+        self,
+        name: str,
+        shape: list[int],
+        numel: int,
+        threshold: float,
+        chunks: int,
+        sink: _DirectorySink | _ContainerSink,
+        content_hash: str | None = None,
+        calibration: str | None = None,
+        scales: npt.NDArray[np.float16] | None = None,
+        encoding: str = "2bit",
+        codec: str = "raw",
+    ) -> None:
+        self.name = name
+        self.shape = shape
+        self.numel = numel
+        self.threshold = threshold
+        self.counts = {"-1": 0, "0": 0, "+1": 0}
+        self.remaining = chunks
+        self.sink = sink
+        self.handle: BinaryIO | None = None
+        self.payload_file = ""
+        self.payload_offset: int | None = None
+        self.payload_length = 0
+        self.content_hash = content_hash
+        self.calibration = calibration
+        self.scales = scales
+        self.encoding = encoding
+        self.codec = codec
+        self.stream = CodecStream(codec)
+        self.scale_file: str | None = None
+        self.scale_offset: int | None = None
+
+    def write(self, chunk: CodecChunk, counts: dict[str, int]) -> bool:
+        """Write the next chunk; return True once the tensor is complete."""
+        if self.handle is None:
+            # Opened on first write so container payloads are laid out in input order.
+            self.handle, self.payload_file, self.payload_offset = self.sink.open(self.name)
+        stored = self.stream.feed(chunk)
+        self.handle.write(stored.tobytes())
+        self.payload_length += stored.size
+        for key, count in counts.items():
+            self.counts[key] += count
+        self.remaining -= 1
+        if self.remaining == 0:
+            tail = self.stream.finish()
+            self.handle.write(tail)
+            self.payload_length += len(tail)
+            self.sink.close(self.handle)
+            if self.scales is not None:
+                # Scales follow the payload so container payloads stay in input order.
+                data = self.scales.astype("<f2").tobytes()
+                self.scale_file, self.scale_offset = self.sink.write_scales(self.name, data)
+            return True
+        return False
+
+    def abort(self) -> None:
+        if self.handle is not None:
+            self.sink.close(self.handle)
+
+    def summary(self) -> TensorExportSummary:
+        return TensorExportSummary(
+            name=self.name,
+            shape=self.shape,
+            numel=self.numel,
+            threshold=self.threshold,
+            counts=self.counts,
+            payload_file=self.payload_file,
+            payload_offset=self.payload_offset,
+            # 0.1 raw payloads are exactly `packed_size` bytes; anything else records its length.
+            payload_length=(
+                None
+                if self.payload_offset is None and self.codec == "raw"
+                else self.payload_length
+            ),
+            content_hash=self.content_hash,
+            calibration=self.calibration,
+            scale_file=self.scale_file,
+            scale_offset=self.scale_offset,
+            scale_count=None if self.scales is None else int(self.scales.size),
+            encoding=self.encoding,
+            codec=self.codec,
+        )
+
+
+def _stored_length(tensor: TensorExportSummary) -> int:
+    """Bytes of the tensor's payload as stored (after its codec)."""
+    if tensor.payload_length is not None and tensor.codec != "raw":
+        return tensor.payload_length
+    return packed_size(tensor.numel, tensor.encoding)
+
+
+@dataclass(frozen=True)
+class _ReuseCandidate:
+    """A previously exported payload: its summary and where its packed bytes live."""
+
+    summary: TensorExportSummary
+    source: Path
+    offset: int
+
+    @property
+    def scale_source(self) -> Path:
+        if self.summary.scale_file is None or self.summary.scale_offset is not None:
+            return self.source
+        return self.source.parent / self.summary.scale_file
+
+    def read_scales(self) -> bytes:
+        length = 2 * (self.summary.scale_count or 0)
+        with self.scale_source.open("rb") as source:
+            source.seek(self.summary.scale_offset or 0)
+            data = source.read(length)
+        if len(data) != length:
+            raise ValueError(f"Truncated scales for {self.summary.name} in {source.name}")
+        return data
+
+    def usable(
+        self,
+        shape: list[int],
+        threshold: float,
+        content_hash: str,
+        calibration: str | None,
+        encoding: str,
+        codec: str,
+    ) -> bool:
+        summary = self.summary
+        length = _stored_length(summary)
+        scale_end = (summary.scale_offset or 0) + 2 * (summary.scale_count or 0)
+        return (
+            summary.content_hash == content_hash
+            and summary.shape == shape
+            and summary.calibration == calibration
+            and summary.encoding == encoding
+            # `auto` accepts either codec it could have picked; the trits are the same.
+            and (
+                summary.codec == codec
+                or (codec == AUTO_CODEC and summary.codec in ("raw", "sparse"))
+            )
+            # Calibrated thresholds are derived from the content, not the export threshold.
+            and (calibration is not None or summary.threshold == threshold)
+            and (summary.payload_length is None or summary.payload_length == length)
+            and self.source.is_file()
+            and self.source.stat().st_size >= self.offset + length
+            and self.scale_source.is_file()
+            and self.scale_source.stat().st_size >= scale_end
+        )
+
+
+class _ReusedPayload:
+    """Stands in for `_PayloadWriter` when an unchanged tensor's payload is carried over."""
+
+    def __init__(self, candidate: _ReuseCandidate, sink: _DirectorySink | _ContainerSink) -> None:
+        self.name = candidate.summary.name
+        self.candidate = candidate
+        self.sink = sink
+        self.payload_file = candidate.summary.payload_file
+        self.payload_offset: int | None = None
+        self.scale_file = candidate.summary.scale_file
+        self.scale_offset: int | None = None
+
+    def write(self, *_: Any) -> bool:
+        previous = self.candidate.summary
+        if isinstance(self.sink, _DirectorySink):
+            target = self.sink.out_dir / self.sink.payload_file(previous.name)
+            if target == self.candidate.source:
+                # Same .t81bin (and .t81scale) file as last time: nothing to rewrite.
+                self.payload_file = target.name
+                return True
+        handle, self.payload_file, self.payload_offset = self.sink.open(previous.name)
+        remaining = _stored_length(previous)
+        with self.candidate.source.open("rb") as source:
+            source.seek(self.candidate.offset)
+            while remaining:
+                block = source.read(min(remaining, _COPY_BLOCK_BYTES))
+                if not block:
+                    raise ValueError(f"Truncated payload for {previous.name} in {source.name}")
+                handle.write(block)
+                remaining -= len(block)
+        self.sink.close(handle)
+        if previous.scale_count is not None:
+            self.scale_file, self.scale_offset = self.sink.write_scales(
+                previous.name, self.candidate.read_scales()
+            )
+        return True
+
+    def abort(self) -> None:
+        pass
+
+    def summary(self) -> TensorExportSummary:
+        previous = self.candidate.summary
+        return replace(
+            previous,
+            payload_file=self.payload_file,
+            payload_offset=self.payload_offset,
+            payload_length=(
+                None
+                if self.payload_offset is None and previous.codec == "raw"
+                else _stored_length(previous)
+            ),
+            scale_file=self.scale_file,
+            scale_offset=self.scale_offset,
+        )
+
+
+class _ExportJournal:
+    """Append-only JSON-lines log of tensors an incremental export has started/finished.
+
+    `{"pending": name}` is written before a tensor's payload is (re)written and
+    the full manifest row once it is complete, so after a kill every finished
+    tensor can be reused and every possibly half-written one is redone.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.handle = path.open("w", encoding="utf-8")
+
+    def _append(self, row: dict[str, Any]) -> None:
+        self.handle.write(json.dumps(row) + "\n")
+        self.handle.flush()
+
+    def pending(self, name: str) -> None:
+        self._append({"pending": name})
+
+    def done(self, summary: TensorExportSummary) -> None:
+        self._append(_manifest_row(summary))
+
+    def close(self) -> None:
+        self.handle.close()
+
+
+def _reuse_candidates(out_dir: Path) -> dict[str, _ReuseCandidate]:
+    """Collect reusable payloads from a previous artifact and an interrupted run's journal."""
+    candidates: dict[str, _ReuseCandidate] = {}
+    try:
+        located = locate_artifact(out_dir)
+        manifest = read_manifest(located)
+    except (OSError, ValueError, KeyError):
+        manifest = None
+    if manifest is not None:
+        for tensor in manifest.tensors:
+            candidates[tensor.name] = _ReuseCandidate(
+                tensor, out_dir / tensor.payload_file, tensor.payload_offset or 0
+            )
+
+    journal = out_dir / EXPORT_JOURNAL
+    if not journal.exists():
+        return candidates
+    container = out_dir / CONTAINER_FILE
+    resume = container.with_name(container.name + _RESUME_SUFFIX)
+    if partial_path(container).exists():
+        # Keep the interrupted container's payloads readable while a new one is written.
+        os.replace(partial_path(container), resume)
+    for line in journal.read_text(encoding="utf-8").splitlines():
+        try:
+            row = json.loads(line)
+        except ValueError:
+            break  # Torn final line from the kill.
+        if "pending" in row:
+            candidates.pop(str(row["pending"]), None)
+            continue
+        tensor = _summary_from_row(row)
+        if tensor.payload_offset is None:
+            candidates[tensor.name] = _ReuseCandidate(tensor, out_dir / tensor.payload_file, 0)
+        elif resume.exists():
+            candidates[tensor.name] = _ReuseCandidate(tensor, resume, tensor.payload_offset)
+    return candidates
+
+
+def _run_inline(fn: Callable[..., _T], *args: Any) -> Future[_T]:
+    future: Future[_T] = Future()
+    try:
+        future.set_result(fn(*args))
+    except Exception as exc:
+        future.set_exception(exc)
+    return future
+
+
+def export_tensors_to_ternary(
+    tensors: Iterable[tuple[str, Any]],
     output_dir: str | Path,
     *,
     threshold: float = 0.05,
     source: str = "in_memory",
+    max_memory: int | None = None,
+    workers: int = 1,
+    chunk_values: int = DEFAULT_CHUNK_VALUES,
+    format_version: str = "0.1",
+    incremental: bool = False,
+    calibration: str | CalibrationSpec = "fixed",
+    encoding: str = "2bit",
+    codec: str = "raw",
+    profiler: ExportProfiler | None = None,
+    progress: Callable[[ExportProgress], None] | None = None,
+    total_tensors: int | None = None,
+    total_values: int | None = None,
 ) -> ExportManifest:
-    """Export tensor-like state dict items into packed ternary artifacts + JSON manifest."""
+    """Export `(name, tensor)` pairs into packed ternary artifacts + manifest.
+
+    `format_version="0.1"` writes one `.t81bin` per tensor plus `manifest.json`;
+    `"0.2"` writes a single mmap-friendly container (see `pipelines.container`).
+
+    Each tensor is split into element chunks of `chunk_values` (a multiple of 4,
+    so packed chunks join byte-for-byte). Chunks are quantized and packed on a
+    thread pool of `workers` threads (the NumPy kernels release the GIL) and
+    streamed into the tensor's `.t81bin` file in order, with counts accumulated
+    as they complete. At most `2 * workers` chunks are in flight, so per-tensor
+    memory is bounded no matter how large the tensor is, and `tensors` is pulled
+    lazily (see `iter_checkpoint_tensors`). `max_memory` (bytes) further shrinks
+    chunks so the in-flight working set stays under the cap. Manifest order
+    always follows input order.
+
+    With `incremental=True` every tensor's `content_hash` is recorded, and a
+    tensor whose hash, shape and threshold match the artifact already in
+    `output_dir` (or a tensor finished by an interrupted incremental run, see
+    `EXPORT_JOURNAL`) has its payload carried over instead of re-quantized.
+
+    `calibration` (a `CalibrationSpec` or its string form such as `"absmean"` or
+    `"percentile:99/channel"`) derives each tensor's threshold(s) from its own
+    values and stores the matching float16 dequantization scales beside the
+    payload; the default `"fixed"` uses `threshold` and stores no scales.
+
+    `encoding` selects the payload encoding per `PAYLOAD_ENCODINGS`: `"2bit"`
+    (four trits per byte) or `"base3"` (five trits per byte, about 20% smaller).
+    With `"base3"` chunks are rounded down to a multiple of 5 values so packed
+    chunks still join byte-for-byte.
+
+    `codec` selects how packed payloads are stored, per `PAYLOAD_CODECS` (see
+    `pipelines.codecs`): `"raw"`, `"sparse"` (non-zero bitmap plus sign bits,
+    chunks aligned to 8 values), `"zlib"` or `"lzma"` (each chunk compressed on
+    the pool), or `"auto"`, which picks `"sparse"` per tensor when a sample of
+    its trits shows it at least 10% smaller than `"raw"`. The chosen codec is
+    recorded in the manifest.
+
+    `profiler` (an `ExportProfiler`) records per-stage wall time, bytes and
+    per-tensor memory (see `pipelines.profiling.EXPORT_STAGES`); without one
+    the export takes no extra timestamps.
+
+    `progress` is called on the exporting thread with an `ExportProgress` as
+    each tensor completes (values and bytes done, trailing values/s and ETA).
+    `total_tensors` / `total_values` size the ETA; `total_tensors` defaults
+    to `len(tensors)` when it is sized.
+    """
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+    if format_version not in FORMAT_VERSIONS:
+        raise ValueError(
+            f"Unsupported format_version {format_version!r}; expected one of {FORMAT_VERSIONS}"
+        )
+    if encoding not in PAYLOAD_ENCODINGS:
+        raise ValueError(
+            f"Unsupported encoding {encoding!r}; expected one of {PAYLOAD_ENCODINGS}"
+        )
+    check_codec(codec, allow_auto=True)
+    spec = CalibrationSpec.parse(calibration)
+    calibration_name = None if spec.mode == "fixed" else str(spec)
     out_dir = Path(output_dir)
     out_dir.mkdir(parents=True, exist_ok=True)
+    in_flight = 1 if workers == 1 else 2 * workers
+    step = _chunk_values(chunk_values, max_memory, in_flight)
+    # Packed chunks join byte-for-byte only if every chunk fills whole bytes.
+    group = trits_per_byte(encoding)
+    step = max(group, step // group * group)
+    # Sparse bitmaps join byte-for-byte only if every chunk covers whole bitmap bytes.
+    sparse_group = math.lcm(group, 8)
+    sparse_step = max(sparse_group, step // sparse_group * sparse_group)
+    candidates = _reuse_candidates(out_dir) if incremental else {}
+    sink = _DirectorySink(out_dir) if format_version == "0.1" else _ContainerSink(out_dir)
+    journal = _ExportJournal(out_dir / EXPORT_JOURNAL) if incremental else None
+    tracker = None
+    if progress is not None:
+        if total_tensors is None and isinstance(tensors, Sized):
+            total_tensors = len(tensors)
+        tracker = ProgressTracker(total_tensors, total_values)
+    # Input bytes of submitted tensors, in completion (= input) order.
+    input_bytes: deque[int] = deque()
 
     tensor_summaries: list[TensorExportSummary] = []
-    for name, value in state_dict.items():
-        arr = _to_numpy(value)
-        flattened = arr.reshape(-1)
-        trits = quantize_float_to_trits(flattened.tolist(), threshold=threshold)
-
-        ints = trits.to_ints()
-        counts = {
-            "-1": sum(1 for v in ints if v == -1),
-            "0": sum(1 for v in ints if v == 0),
-            "+1": sum(1 for v in ints if v == 1),
-        }
+    pending: deque[
+        tuple[
+            _PayloadWriter | _ReusedPayload,
+            Future[tuple[CodecChunk, dict[str, int]]],
+        ]
+    ]
+    pending = deque()
+    reused: Future[tuple[CodecChunk, dict[str, int]]] = Future()
+    reused.set_result(((np.empty(0, dtype=np.uint8), None), {}))
 
-        safe_name = name.replace("/", "_").replace(".", "_")
-        payload_file = f"{safe_name}.t81bin"
-        payload_path = out_dir / payload_file
-        payload_path.write_bytes(pack_trits(ints))
-
-        tensor_summaries.append(
-            TensorExportSummary(
-                name=name,
-                shape=list(arr.shape),
-                numel=int(flattened.size),
-                threshold=threshold,
-                counts=counts,
-                payload_file=payload_file,
+    def drain(limit: int) -> None:
+        while len(pending) > limit:
+            writer, future = pending.popleft()
+            chunk, counts = future.result()
+            began = time.perf_counter_ns() if profiler is not None else 0
+            done = writer.write(chunk, counts)
+            if profiler is not None:
+                if isinstance(writer, _ReusedPayload):
+                    stored = _stored_length(writer.candidate.summary)
+                    profiler.record("copy", writer.name, began, bytes_out=stored)
+                else:
+                    profiler.record("write", writer.name, began, bytes_out=int(chunk[0].nbytes))
+                if done:
+                    profiler.tensor_done(writer.name)
+            if done:
+                summary = writer.summary()
+                tensor_summaries.append(summary)
+                if journal is not None:
+                    journal.done(summary)
+                if progress is not None and tracker is not None:
+                    stored = _stored_length(summary)
+                    event = tracker.completed(
+                        summary.name, summary.numel, input_bytes.popleft(), stored
+                    )
+                    progress(event)
+
+    pool = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    submit = pool.submit if pool is not None else _run_inline
+    map_fn = pool.map if pool is not None else map
+    encode: Callable[..., tuple[CodecChunk, dict[str, int]]] = _encode_chunk
+    if profiler is not None:
+        profiler.start()
+        tensors = profiler.iter_source(tensors)
+    try:
+        for name, value in tensors:
+            began = time.perf_counter_ns() if profiler is not None else 0
+            arr = _to_array(value)
+            del value
+            if profiler is not None:
+                profiler.record("to_numpy", name, began, bytes_out=_nbytes(arr))
+                encode = partial(_profiled_encode_chunk, profiler, name)
+            shape = [int(dim) for dim in arr.shape]
+            if progress is not None:
+                input_bytes.append(_nbytes(arr))
+            content_hash = None
+            if incremental:
+                began = time.perf_counter_ns() if profiler is not None else 0
+                content_hash = _content_hash(arr, map_fn)
+                if profiler is not None:
+                    profiler.record("hash", name, began, bytes_in=_nbytes(arr))
+                candidate = candidates.get(name)
+                if candidate is not None and candidate.usable(
+                    shape, threshold, content_hash, calibration_name, encoding, codec
+                ):
+                    drain(in_flight - 1)
+                    pending.append((_ReusedPayload(candidate, sink), reused))
+                    continue
+                assert journal is not None
+                journal.pending(name)
+            flat = arr.reshape(-1)
+            numel = int(flat.shape[0])
+            del arr
+            chunk_threshold: float | npt.NDArray[np.float64] = threshold
+            channel_size = None
+            scales = None
+            tensor_threshold = threshold
+            if calibration_name is not None:
+                began = time.perf_counter_ns() if profiler is not None else 0
+                fitted = calibrate(flat, spec, shape=shape, map_fn=map_fn)
+                if profiler is not None:
+                    profiler.record("calibrate", name, began, bytes_in=_nbytes(flat))
+                scales = fitted.scales
+                tensor_threshold = float(fitted.thresholds.mean())
+                if fitted.thresholds.size == 1:
+                    chunk_threshold = tensor_threshold
+                else:
+                    chunk_threshold = fitted.thresholds
+                    channel_size = fitted.channel_size
+            tensor_codec = codec
+            if codec == AUTO_CODEC:
+                tensor_codec = _auto_codec(flat, tensor_threshold, encoding)
+            tensor_step = sparse_step if tensor_codec == "sparse" else step
+            starts = range(0, max(numel, 1), tensor_step)
+            writer = _PayloadWriter(
+                name,
+                shape,
+                numel,
+                tensor_threshold,
+                len(starts),
+                sink,
+                content_hash,
+                calibration_name,
+                scales,
+                encoding,
+                tensor_codec,
             )
-        )
+            for start in starts:
+                drain(in_flight - 1)
+                future = submit(
+                    encode,
+                    flat,
+                    start,
+                    min(start + tensor_step, numel),
+                    chunk_threshold,
+                    channel_size,
+                    encoding,
+                    tensor_codec,
+                )
+                pending.append((writer, future))
+            del flat
+        drain(0)
+    except BaseException:
+        for unfinished, _ in pending:
+            unfinished.abort()
+        sink.abort(resumable=incremental)
+        if journal is not None:
+            journal.close()
+        raise
+    finally:
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+        if profiler is not None:
+            profiler.stop()
 
     manifest = ExportManifest(
         generated_at_utc=datetime.now(timezone.utc).isoformat(),
-        format_version="0.1",
+        format_version=format_version,
         source=source,
         threshold=threshold,
         tensors=tensor_summaries,
     )
-    manifest_path = out_dir / "manifest.json"
-    manifest_path.write_text(
-        json.dumps(
-            {
-                "generated_at_utc": manifest.generated_at_utc,
-                "format_version": manifest.format_version,
-                "source": manifest.source,
-                "threshold": manifest.threshold,
-                "tensors": [asdict(t) for t in manifest.tensors],
-            },
-            indent=2,
-        )
-        + "\n",
-        encoding="utf-8",
-    )
+    sink.finish(_manifest_payload(manifest))
+    if journal is not None:
+        journal.close()
+        journal.path.unlink()
+        resume = out_dir / (CONTAINER_FILE + _RESUME_SUFFIX)
+        resume.unlink(missing_ok=True)
     return manifest
 
 
+def _manifest_row(tensor: TensorExportSummary) -> dict[str, Any]:
+    # Optional fields are omitted when unset so 0.1 manifests keep their schema.
+    return {key: value for key, value in asdict(tensor).items() if value is not None}
+
+
+def _manifest_payload(manifest: ExportManifest) -> dict[str, Any]:
+    return {
+        "generated_at_utc": manifest.generated_at_utc,
+        "format_version": manifest.format_version,
+        "source": manifest.source,
+        "threshold": manifest.threshold,
+        "tensors": [_manifest_row(t) for t in manifest.tensors],
+    }
+
+
+def export_state_dict_to_ternary(
+    state_dict: dict[str, Any],
+    output_dir: str | Path,
+    *,
+    threshold: float = 0.05,
+    source: str = "in_memory",
+    max_memory: int | None = None,
+    workers: int = 1,
+    chunk_values: int = DEFAULT_CHUNK_VALUES,
+    format_version: str = "0.1",
+    incremental: bool = False,
+    calibration: str | CalibrationSpec = "fixed",
+    encoding: str = "2bit",
+    codec: str = "raw",
+    profiler: ExportProfiler | None = None,
+    progress: Callable[[ExportProgress], None] | None = None,
+) -> ExportManifest:
+    """Export tensor-like state dict items into packed ternary artifacts + JSON manifest."""
+    total_values = None
+    if progress is not None:
+        sizes = [_numel(value) for value in state_dict.values()]
+        if all(size is not None for size in sizes):
+            total_values = sum(size or 0 for size in sizes)
+    return export_tensors_to_ternary(
+        state_dict.items(),
+        output_dir,
+        threshold=threshold,
+        source=source,
+        max_memory=max_memory,
+        workers=workers,
+        chunk_values=chunk_values,
+        format_version=format_version,
+        incremental=incremental,
+        calibration=calibration,
+        encoding=encoding,
+        codec=codec,
+        profiler=profiler,
+        progress=progress,
+        total_tensors=len(state_dict),
+        total_values=total_values,
+    )
+
+
 def load_json_state_dict(path: str | Path) -> dict[str, Any]:
     """Load a JSON mapping of tensor names to nested numeric arrays."""
     payload = json.loads(Path(path).read_text(encoding="utf-8"))
@@ -165,73 +951,246 @@ def load_checkpoint_state_dict(path: str | Path) -> dict[str, Any]:
     )
 
 
+def _safetensors_totals(path: Path) -> tuple[int, int]:
+    """Tensor and element counts from a .safetensors header, without reading tensor data."""
+    with path.open("rb") as handle:
+        header_len = int.from_bytes(handle.read(8), "little")
+        header = json.loads(handle.read(header_len))
+    shapes = [info["shape"] for key, info in header.items() if key != "__metadata__"]
+    return len(shapes), sum(math.prod(int(dim) for dim in shape) for shape in shapes)
+
+
+def _safetensors_view(mapped: mmap.mmap, base: int, key: str, info: Any) -> npt.NDArray[Any]:
+    dtype_name = str(info["dtype"])
+    if dtype_name not in _SAFETENSORS_DTYPES:
+        raise ValueError(f"Unsupported safetensors dtype for {key}: {dtype_name}")
+    dtype = np.dtype(_SAFETENSORS_DTYPES[dtype_name])
+    start, end = (int(x) for x in info["data_offsets"])
+    arr = np.frombuffer(
+        mapped, dtype=dtype, count=(end - start) // dtype.itemsize, offset=base + start
+    ).reshape([int(dim) for dim in info["shape"]])
+    if dtype_name == "BF16":
+        # NumPy has no bfloat16; widen this tensor to float32 (exact).
+        arr = (arr.astype(np.uint32) << 16).view(np.float32)
+    return arr
+
+
+def _iter_safetensors_mmap(path: Path) -> Iterator[tuple[str, npt.NDArray[Any]]]:
+    """Yield zero-copy ndarray views into a memory-mapped .safetensors file.
+
+    The mapping is closed when the generator finishes or is closed, unless
+    yielded views are still alive; it is then released with the last of them.
+    """
+    with path.open("rb") as handle:
+        header_len = int.from_bytes(handle.read(8), "little")
+        header = json.loads(handle.read(header_len))
+        mapped = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+    try:
+        for key, info in header.items():
+            if key != "__metadata__":
+                # No local keeps the view, so closing the generator can unmap the file.
+                yield key, _safetensors_view(mapped, 8 + header_len, key, info)
+    finally:
+        try:
+            mapped.close()
+        except BufferError:
+            pass  # Views handed out are still referenced; they keep the mapping alive.
+
+
+def iter_checkpoint_tensors(path: str | Path) -> Iterator[tuple[str, Any]]:
+    """Lazily yield `(name, tensor)` pairs from a checkpoint, one tensor at a time.
+
+    `.safetensors` files are read through safetensors' lazy handle when torch is
+    installed, otherwise memory-mapped directly (no extra dependency needed).
+    `.pt/.pth/.bin` files are loaded with `torch.load(mmap=True)` where the
+    checkpoint format allows it.
+    """
+    checkpoint = Path(path)
+    suffix = checkpoint.suffix.lower()
+
+    if suffix == ".safetensors":
+        if (
+            importlib.util.find_spec("torch") is None
+            or importlib.util.find_spec("safetensors") is None
+        ):
+            yield from _iter_safetensors_mmap(checkpoint)
+            return
+        from safetensors import safe_open
+
+        with safe_open(str(checkpoint), framework="pt", device="cpu") as handle:
+            for key in handle.keys():
+                yield key, handle.get_tensor(key)
+        return
+
+    if suffix in {".pt", ".pth", ".bin"}:
+        if importlib.util.find_spec("torch") is None:
+            raise RuntimeError("Missing dependency: torch. Install with `pip install -e '.[hf]'`.")
+        import torch
+
+        try:
+            loaded = torch.load(str(checkpoint), map_location="cpu", mmap=True)
+        except RuntimeError:
+            # Legacy (non-zipfile) checkpoints cannot be memory-mapped.
+            loaded = torch.load(str(checkpoint), map_location="cpu")
+        state_dict = _normalize_loaded_checkpoint(loaded)
+        del loaded
+        for key in list(state_dict):
+            yield key, state_dict.pop(key)
+        return
+
+    raise ValueError(
+        f"Unsupported checkpoint format: {suffix}. Expected .safetensors, .pt, .pth, or .bin"
+    )
+
+
 def export_checkpoint_to_ternary(
     checkpoint_path: str | Path,
     output_dir: str | Path,
     *,
     threshold: float = 0.05,
+    max_memory: int | None = None,
+    workers: int = 1,
+    chunk_values: int = DEFAULT_CHUNK_VALUES,
+    format_version: str = "0.1",
+    incremental: bool = False,
+    calibration: str | CalibrationSpec = "fixed",
+    encoding: str = "2bit",
+    codec: str = "raw",
+    profiler: ExportProfiler | None = None,
+    progress: Callable[[ExportProgress], None] | None = None,
 ) -> ExportManifest:
-    """Load a checkpoint file and export packed ternary artifacts."""
-    state_dict = load_checkpoint_state_dict(checkpoint_path)
-    return export_state_dict_to_ternary(
-        state_dict,
+    """Stream a checkpoint file tensor-by-tensor into packed ternary artifacts."""
+    total_tensors = total_values = None
+    if progress is not None and Path(checkpoint_path).suffix.lower() == ".safetensors":
+        total_tensors, total_values = _safetensors_totals(Path(checkpoint_path))
+    return export_tensors_to_ternary(
+        iter_checkpoint_tensors(checkpoint_path),
         output_dir=output_dir,
         threshold=threshold,
         source=str(checkpoint_path),
+        max_memory=max_memory,
+        workers=workers,
+        chunk_values=chunk_values,
+        format_version=format_version,
+        incremental=incremental,
+        calibration=calibration,
+        encoding=encoding,
+        codec=codec,
+        profiler=profiler,
+        progress=progress,
+        total_tensors=total_tensors,
+        total_values=total_values,
     )
 
 
 def read_manifest(path: str | Path) -> ExportManifest:
-    """Read a JSON manifest file into typed structures."""
-    payload = json.loads(Path(path).read_text(encoding="utf-8"))
-    tensors: list[TensorExportSummary] = []
-    for row in payload["tensors"]:
-        tensors.append(
-            TensorExportSummary(
-                name=row["name"],
-                shape=[int(x) for x in row["shape"]],
-                numel=int(row["numel"]),
-                threshold=float(row["threshold"]),
-                counts={
-                    "-1": int(row["counts"]["-1"]),
-                    "0": int(row["counts"]["0"]),
-                    "+1": int(row["counts"]["+1"]),
-                },
-                payload_file=row["payload_file"],
-            )
-        )
+    """Read a manifest into typed structures.
+
+    `path` may be a 0.1 `manifest.json`, a 0.2 container file, or an artifact
+    directory holding either.
+    """
+    located = locate_artifact(path)
+    if is_container(located):
+        payload = read_index(located)
+    else:
+        payload = json.loads(located.read_text(encoding="utf-8"))
     return ExportManifest(
         generated_at_utc=str(payload["generated_at_utc"]),
         format_version=str(payload["format_version"]),
         source=str(payload["source"]),
         threshold=float(payload["threshold"]),
-        tensors=tensors,
+        tensors=[_summary_from_row(row) for row in payload["tensors"]],
     )
 
 
-def inspect_artifact(output_dir: str | Path) -> ArtifactInspection:
-    """Validate payload decode lengths and summarize aggregate trit counts."""
-    out_dir = Path(output_dir)
-    manifest = read_manifest(out_dir / "manifest.json")
+def _summary_from_row(row: dict[str, Any]) -> TensorExportSummary:
+    content_hash = row.get("content_hash")
+    calibration = row.get("calibration")
+    scale_file = row.get("scale_file")
+    return TensorExportSummary(
+        name=row["name"],
+        shape=[int(x) for x in row["shape"]],
+        numel=int(row["numel"]),
+        threshold=float(row["threshold"]),
+        counts={
+            "-1": int(row["counts"]["-1"]),
+            "0": int(row["counts"]["0"]),
+            "+1": int(row["counts"]["+1"]),
+        },
+        payload_file=row["payload_file"],
+        payload_offset=_optional_int(row.get("payload_offset")),
+        payload_length=_optional_int(row.get("payload_length")),
+        content_hash=None if content_hash is None else str(content_hash),
+        calibration=None if calibration is None else str(calibration),
+        scale_file=None if scale_file is None else str(scale_file),
+        scale_offset=_optional_int(row.get("scale_offset")),
+        scale_count=_optional_int(row.get("scale_count")),
+        encoding=str(row.get("encoding", "2bit")),
+        codec=str(row.get("codec", "raw")),
+    )
+
+
+def _optional_int(value: Any) -> int | None:
+    return None if value is None else int(value)
+
+
+def _payload_matches(tensor: TensorExportSummary, payload: memoryview) -> bool:
+    try:
+        if len(payload) != packed_size(tensor.numel, tensor.encoding):
+            return False
+        neg, zero, pos = count_packed_trits(payload, tensor.numel, tensor.encoding)
+    except ValueError:
+        return False
+    return {"-1": neg, "0": zero, "+1": pos} == tensor.counts
+
+
+def inspect_artifact(output_dir: str | Path, *, workers: int = 1) -> ArtifactInspection:
+    """Validate payload lengths and trit counts and summarize aggregate counts.
+
+    Accepts a 0.1 artifact directory, a 0.2 container, or a directory holding one.
+    Stored calibration scales must be present, of `scale_count` length and finite.
+    Payloads are memory-mapped and counted on the packed bytes (see
+    `count_packed_trits`), so memory stays bounded; `workers > 1` validates
+    tensors concurrently.
+    """
+    # Local import: artifact_reader imports this module.
+    from t81_python.pipelines.artifact_reader import ArtifactReader
+
+    if workers < 1:
+        raise ValueError(f"workers must be >= 1, got {workers}")
+
+    with ArtifactReader(output_dir) as reader:
+        manifest = reader.manifest
+
+        def check(tensor: TensorExportSummary) -> bool:
+            view = reader[tensor.name]
+            try:
+                packed = view.packed()
+            except ValueError:
+                return False
+            if not _payload_matches(tensor, packed):
+                return False
+            try:
+                scales = view.scales()
+            except ValueError:
+                return False
+            return scales is None or bool(np.isfinite(scales).all())
+
+        if workers == 1:
+            results = [check(tensor) for tensor in manifest.tensors]
+        else:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                results = list(pool.map(check, manifest.tensors))
 
     total_trits = 0
     counts = {"-1": 0, "0": 0, "+1": 0}
     per_tensor_payload_ok: dict[str, bool] = {}
-
-    for tensor in manifest.tensors:
+    for tensor, ok in zip(manifest.tensors, results):
         total_trits += tensor.numel
         counts["-1"] += tensor.counts["-1"]
         counts["0"] += tensor.counts["0"]
         counts["+1"] += tensor.counts["+1"]
-
-        payload = (out_dir / tensor.payload_file).read_bytes()
-        decoded = unpack_trits(payload, count=tensor.numel)
-        decoded_counts = {
-            "-1": sum(1 for value in decoded.values if int(value) == -1),
-            "0": sum(1 for value in decoded.values if int(value) == 0),
-            "+1": sum(1 for value in decoded.values if int(value) == 1),
-        }
-        per_tensor_payload_ok[tensor.name] = decoded_counts == tensor.counts
+        per_tensor_payload_ok[tensor.name] = ok
 
     return ArtifactInspection(
         manifest=manifest,
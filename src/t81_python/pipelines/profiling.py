@@ -0,0 +1,216 @@
+"""Opt-in per-stage timing, byte and memory accounting for export pipelines."""
+
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+import time
+import tracemalloc
+from collections.abc import Iterable, Iterator
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any, TypeVar
+
+from t81_python.formats import PROFILE_FORMATS as PROFILE_FORMATS
+
+# Stages recorded by `export_tensors_to_ternary`:
+# - load: pulling the next tensor from the source iterator (checkpoint reads)
+# - to_numpy: converting it to a CPU array
+# - hash / calibrate: content hashing (incremental) and threshold/scale calibration
+# - quantize_pack: fused threshold + count + pack (+ payload codec) of one chunk, on a worker
+# - write / copy: appending a chunk to the payload file, or carrying over a reused payload
+EXPORT_STAGES = ("load", "to_numpy", "hash", "calibrate", "quantize_pack", "write", "copy")
+
+_T = TypeVar("_T")
+
+
+@dataclass(frozen=True)
+class StageEvent:
+    stage: str
+    tensor: str
+    start_ns: int
+    duration_ns: int
+    thread_id: int
+    bytes_in: int = 0
+    bytes_out: int = 0
+
+
+@dataclass(frozen=True)
+class TensorMemory:
+    """Memory high-water marks sampled when a tensor's payload completes."""
+
+    tensor: str
+    at_ns: int
+    max_rss_bytes: int | None
+    peak_traced_bytes: int | None = None
+
+
+def _max_rss_bytes() -> int | None:
+    try:
+        import resource
+    except ImportError:  # Not available on Windows.
+        return None
+    rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return int(rss) if sys.platform == "darwin" else int(rss) * 1024
+
+
+class ExportProfiler:
+    """Collect per-stage spans and per-tensor memory for exports.
+
+    Pass one as `profiler=` to the export functions (or `--profile` on the
+    CLI); exports without a profiler take no timestamps. Every span records
+    wall time, bytes in/out and the recording thread, and each completed
+    tensor records the process peak RSS. With `trace_memory=True`,
+    `tracemalloc` runs during the export and each tensor also records the
+    peak traced Python/NumPy heap since the previous tensor completed; this
+    slows allocation-heavy code, so it is off by default.
+    """
+
+    def __init__(self, *, trace_memory: bool = False) -> None:
+        self.trace_memory = trace_memory
+        self.events: list[StageEvent] = []
+        self.memory: list[TensorMemory] = []
+        self.origin_ns = time.perf_counter_ns()
+        self._started_tracing = False
+
+    def start(self) -> None:
+        """Begin an export; starts `tracemalloc` if memory tracing is requested."""
+        if not self.trace_memory:
+            return
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+        else:
+            tracemalloc.start()
+            self._started_tracing = True
+
+    def stop(self) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    def record(
+        self, stage: str, tensor: str, start_ns: int, *, bytes_in: int = 0, bytes_out: int = 0
+    ) -> None:
+        """Record a span of `stage` from `start_ns` (`time.perf_counter_ns()`) until now."""
+        duration = time.perf_counter_ns() - start_ns
+        # list.append is atomic, so worker threads can record concurrently.
+        self.events.append(
+            StageEvent(
+                stage, tensor, start_ns, duration, threading.get_ident(), bytes_in, bytes_out
+            )
+        )
+
+    def tensor_done(self, tensor: str) -> None:
+        peak = None
+        if self.trace_memory and tracemalloc.is_tracing():
+            peak = tracemalloc.get_traced_memory()[1]
+            tracemalloc.reset_peak()
+        self.memory.append(TensorMemory(tensor, time.perf_counter_ns(), _max_rss_bytes(), peak))
+
+    def iter_source(self, tensors: Iterable[tuple[str, _T]]) -> Iterator[tuple[str, _T]]:
+        """Yield from `tensors`, recording the time spent producing each item as `load`."""
+        iterator = iter(tensors)
+        while True:
+            start = time.perf_counter_ns()
+            try:
+                name, value = next(iterator)
+            except StopIteration:
+                return
+            self.record("load", name, start)
+            yield name, value
+
+    def stage_totals(self) -> dict[str, dict[str, int | float]]:
+        totals: dict[str, dict[str, int | float]] = {}
+        for event in self.events:
+            row = totals.setdefault(
+                event.stage, {"seconds": 0.0, "calls": 0, "bytes_in": 0, "bytes_out": 0}
+            )
+            row["seconds"] += event.duration_ns / 1e9
+            row["calls"] += 1
+            row["bytes_in"] += event.bytes_in
+            row["bytes_out"] += event.bytes_out
+        return totals
+
+    def tensor_totals(self) -> dict[str, dict[str, Any]]:
+        """Per tensor: seconds per stage, bytes in/out and the memory sample."""
+        tensors: dict[str, dict[str, Any]] = {}
+        for event in self.events:
+            row = tensors.setdefault(event.tensor, {"stages": {}, "bytes_in": 0, "bytes_out": 0})
+            stages = row["stages"]
+            stages[event.stage] = stages.get(event.stage, 0.0) + event.duration_ns / 1e9
+            row["bytes_in"] += event.bytes_in
+            row["bytes_out"] += event.bytes_out
+        for sample in self.memory:
+            row = tensors.setdefault(sample.tensor, {"stages": {}, "bytes_in": 0, "bytes_out": 0})
+            row["max_rss_bytes"] = sample.max_rss_bytes
+            row["peak_traced_bytes"] = sample.peak_traced_bytes
+        return tensors
+
+    def to_json(self) -> dict[str, Any]:
+        return {
+            "stages": self.stage_totals(),
+            "tensors": self.tensor_totals(),
+            "events": [asdict(event) for event in self.events],
+        }
+
+    def to_chrome_trace(self) -> dict[str, Any]:
+        """Chrome trace-event JSON (loadable in Perfetto or chrome://tracing)."""
+        pid = os.getpid()
+        lanes: dict[int, int] = {}
+        trace: list[dict[str, Any]] = []
+        main_thread = threading.main_thread().ident
+        for event in sorted(self.events, key=lambda event: event.start_ns):
+            if event.thread_id not in lanes:
+                lane = lanes[event.thread_id] = len(lanes)
+                label = "main" if event.thread_id == main_thread else f"worker {lane}"
+                trace.append(
+                    {
+                        "name": "thread_name",
+                        "ph": "M",
+                        "pid": pid,
+                        "tid": lane,
+                        "args": {"name": label},
+                    }
+                )
+            trace.append(
+                {
+                    "name": event.stage,
+                    "cat": "export",
+                    "ph": "X",
+                    "ts": (event.start_ns - self.origin_ns) / 1e3,
+                    "dur": event.duration_ns / 1e3,
+                    "pid": pid,
+                    "tid": lanes[event.thread_id],
+                    "args": {
+                        "tensor": event.tensor,
+                        "bytes_in": event.bytes_in,
+                        "bytes_out": event.bytes_out,
+                    },
+                }
+            )
+        for sample in self.memory:
+            counters = {
+                "max_rss_bytes": sample.max_rss_bytes,
+                "peak_traced_bytes": sample.peak_traced_bytes,
+            }
+            trace.append(
+                {
+                    "name": "memory",
+                    "ph": "C",
+                    "ts": (sample.at_ns - self.origin_ns) / 1e3,
+                    "pid": pid,
+                    "args": {key: value for key, value in counters.items() if value is not None},
+                }
+            )
+        return {"traceEvents": trace, "displayTimeUnit": "ms"}
+
+    def write(self, path: str | Path, format: str = "chrome") -> None:
+        """Write a Chrome trace (`format="chrome"`) or the `to_json()` summary to `path`."""
+        if format not in PROFILE_FORMATS:
+            raise ValueError(
+                f"Unknown profile format {format!r}; expected one of {PROFILE_FORMATS}"
+            )
+        payload = self.to_chrome_trace() if format == "chrome" else self.to_json()
+        Path(path).write_text(json.dumps(payload, indent=1) + "\n", encoding="utf-8")
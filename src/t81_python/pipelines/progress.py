@@ -0,0 +1,170 @@
+"""Per-tensor export progress events, throughput/ETA tracking and terminal reporters."""
+
+from __future__ import annotations
+
+import json
+import sys
+import time
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import TextIO
+
+from t81_python.formats import PROGRESS_MODES as PROGRESS_MODES
+
+# Throughput is measured over tensors completed in this many trailing seconds.
+_RATE_WINDOW_SECONDS = 10.0
+_BAR_WIDTH = 24
+
+
+@dataclass(frozen=True)
+class ExportProgress:
+    """State of an export after `tensor` completed.
+
+    `tensors_total` / `values_total` are `None` when the source size is not
+    known up front (e.g. a lazy iterator); `eta_seconds` is then based on
+    tensor counts if possible, else `None`.
+    """
+
+    tensor: str
+    tensors_done: int
+    tensors_total: int | None
+    values_done: int
+    values_total: int | None
+    bytes_in: int
+    bytes_out: int
+    elapsed_seconds: float
+    values_per_second: float
+    eta_seconds: float | None
+
+    @property
+    def fraction(self) -> float | None:
+        if self.values_total:
+            return min(self.values_done / self.values_total, 1.0)
+        if self.tensors_total:
+            return min(self.tensors_done / self.tensors_total, 1.0)
+        return None
+
+
+class ProgressTracker:
+    """Turn tensor completions into `ExportProgress` events (one call per tensor)."""
+
+    def __init__(self, tensors_total: int | None = None, values_total: int | None = None) -> None:
+        self.tensors_total = tensors_total
+        self.values_total = values_total
+        self.tensors_done = 0
+        self.values_done = 0
+        self.bytes_in = 0
+        self.bytes_out = 0
+        self.started = time.monotonic()
+        self._window: deque[tuple[float, int]] = deque([(self.started, 0)])
+
+    def completed(self, tensor: str, values: int, bytes_in: int, bytes_out: int) -> ExportProgress:
+        now = time.monotonic()
+        self.tensors_done += 1
+        self.values_done += values
+        self.bytes_in += bytes_in
+        self.bytes_out += bytes_out
+        self._window.append((now, self.values_done))
+        while len(self._window) > 2 and now - self._window[1][0] >= _RATE_WINDOW_SECONDS:
+            self._window.popleft()
+        since, values_then = self._window[0]
+        rate = (self.values_done - values_then) / max(now - since, 1e-9)
+        elapsed = now - self.started
+        eta = None
+        if self.values_total is not None and rate > 0:
+            eta = max(self.values_total - self.values_done, 0) / rate
+        elif self.tensors_total is not None:
+            remaining = max(self.tensors_total - self.tensors_done, 0)
+            eta = elapsed / self.tensors_done * remaining
+        return ExportProgress(
+            tensor=tensor,
+            tensors_done=self.tensors_done,
+            tensors_total=self.tensors_total,
+            values_done=self.values_done,
+            values_total=self.values_total,
+            bytes_in=self.bytes_in,
+            bytes_out=self.bytes_out,
+            elapsed_seconds=elapsed,
+            values_per_second=rate,
+            eta_seconds=eta,
+        )
+
+
+def _duration(seconds: float | None) -> str:
+    if seconds is None:
+        return "--:--"
+    minutes, secs = divmod(int(seconds), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}" if hours else f"{minutes:02d}:{secs:02d}"
+
+
+def _size(count: float) -> str:
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if count < 1024:
+            return f"{count:.1f} {unit}"
+        count /= 1024
+    return f"{count:.1f} TiB"
+
+
+class ProgressReporter:
+    """Export `progress=` callback that prints a progress bar or JSON lines.
+
+    At most one update per `min_interval` seconds is written (the check is a
+    clock read per completed tensor, outside the chunk loop); `close()` writes
+    the last event if it was held back and ends the bar line.
+    """
+
+    def __init__(
+        self, mode: str = "bar", stream: TextIO | None = None, min_interval: float | None = None
+    ) -> None:
+        if mode not in PROGRESS_MODES:
+            raise ValueError(f"Unknown progress mode {mode!r}; expected one of {PROGRESS_MODES}")
+        self.mode = mode
+        self.stream = sys.stderr if stream is None else stream
+        if min_interval is None:
+            min_interval = 0.1 if mode == "bar" else 1.0
+        self.min_interval = min_interval
+        self._last_write = float("-inf")
+        self._held: ExportProgress | None = None
+        self._wrote_bar = False
+
+    def __call__(self, event: ExportProgress) -> None:
+        now = time.monotonic()
+        if now - self._last_write < self.min_interval:
+            self._held = event
+            return
+        self._last_write = now
+        self._held = None
+        self._write(event)
+
+    def close(self) -> None:
+        if self._held is not None:
+            self._write(self._held)
+            self._held = None
+        if self._wrote_bar:
+            self.stream.write("\n")
+            self.stream.flush()
+            self._wrote_bar = False
+
+    def _write(self, event: ExportProgress) -> None:
+        if self.mode == "json":
+            row = asdict(event)
+            row["fraction"] = event.fraction
+            self.stream.write(json.dumps(row) + "\n")
+            self.stream.flush()
+            return
+        fraction = event.fraction
+        if fraction is None:
+            bar, percent = "?" * _BAR_WIDTH, "  ?  "
+        else:
+            filled = int(fraction * _BAR_WIDTH)
+            bar, percent = "#" * filled + "-" * (_BAR_WIDTH - filled), f"{fraction:5.1%}"
+        total = "?" if event.tensors_total is None else str(event.tensors_total)
+        line = (
+            f"[{bar}] {percent} {event.tensors_done}/{total} tensors "
+            f"{_size(event.bytes_in)} {event.values_per_second / 1e6:,.1f}M values/s "
+            f"ETA {_duration(event.eta_seconds)}"
+        )
+        self.stream.write(f"\r{line}\033[K")
+        self.stream.flush()
+        self._wrote_bar = True
@@ -3,56 +3,383 @@
 from __future__ import annotations
 
 from collections.abc import Iterable
+from typing import Any
 
 import numpy as np
 import numpy.typing as npt
 
 from .core import Trit, TritVector
+from .formats import PAYLOAD_ENCODINGS as PAYLOAD_ENCODINGS
 
-_TRIT_TO_PACKED = {-1: 0, 0: 1, 1: 2}
-_PACKED_TO_TRIT = {0: -1, 1: 0, 2: 1}
+_SHIFTS = (0, 2, 4, 6)
+# Elements thresholded per step; keeps comparison temporaries cache-sized.
+_QUANTIZE_BLOCK = 1 << 16
+# Channels at least this long are thresholded run by run instead of via a gathered bound array.
+_CHANNEL_RUN = 1 << 10
+
+
+def _build_unpack_lut() -> npt.NDArray[np.int8]:
+    """Map each byte value to its four decoded trits (symbol 3 decodes to 2, i.e. invalid)."""
+    byte = np.arange(256, dtype=np.uint8)
+    lut = np.empty((256, 4), dtype=np.int8)
+    for slot, shift in enumerate(_SHIFTS):
+        lut[:, slot] = ((byte >> shift) & 0b11).astype(np.int8) - 1
+    return lut
+
+
+_UNPACK_LUT = _build_unpack_lut()
+# Bytes histogrammed per `np.bincount` call in `count_packed_trits` (bounds the intp temporary).
+_COUNT_BLOCK = 1 << 20
+
+
+def _build_symbol_count_lut() -> npt.NDArray[np.int64]:
+    """Map each byte value to how many of its four slots hold symbols 0, 1, 2 and 3."""
+    byte = np.arange(256, dtype=np.uint8)
+    lut = np.zeros((256, 4), dtype=np.int64)
+    for shift in _SHIFTS:
+        lut[byte, (byte >> shift) & 0b11] += 1
+    return lut
+
+
+_SYMBOL_COUNT_LUT = _build_symbol_count_lut()
+
+_TRITS_PER_BYTE = {"2bit": 4, "base3": 5}
+_BASE3_LIMIT = 3**5
+_INVALID = {"2bit": "invalid symbol 3", "base3": "invalid base-3 byte (>= 243)"}
+
+
+def _build_base3_unpack_lut() -> npt.NDArray[np.int8]:
+    """Map each byte value to its five decoded trits (invalid bytes decode to 2)."""
+    byte = np.arange(256, dtype=np.int64)
+    lut = np.empty((256, 5), dtype=np.int8)
+    for slot in range(5):
+        lut[:, slot] = (byte // 3**slot) % 3 - 1
+    lut[_BASE3_LIMIT:] = 2
+    return lut
+
+
+_BASE3_UNPACK_LUT = _build_base3_unpack_lut()
+
+
+def _build_base3_count_lut() -> npt.NDArray[np.int64]:
+    """Per-byte counts of digits 0, 1, 2 and, in the last column, invalid bytes."""
+    lut = np.zeros((256, 4), dtype=np.int64)
+    for digit in range(3):
+        lut[:, digit] = (_BASE3_UNPACK_LUT == digit - 1).sum(axis=1)
+    lut[_BASE3_LIMIT:] = 0
+    lut[_BASE3_LIMIT:, 3] = 5
+    return lut
+
+
+_BASE3_COUNT_LUT = _build_base3_count_lut()
+
+
+def trits_per_byte(encoding: str) -> int:
+    """Trits stored per payload byte for `encoding` (4 for `2bit`, 5 for `base3`)."""
+    try:
+        return _TRITS_PER_BYTE[encoding]
+    except KeyError:
+        raise ValueError(
+            f"Unknown payload encoding {encoding!r}; expected one of {PAYLOAD_ENCODINGS}"
+        ) from None
+
+
+def packed_size(count: int, encoding: str = "2bit") -> int:
+    """Payload bytes needed for `count` trits in `encoding`."""
+    return -(-count // trits_per_byte(encoding))
+
+
+def _pack_symbols(
+    groups: npt.NDArray[np.uint8], encoding: str, out: npt.NDArray[np.uint8]
+) -> None:
+    """Pack rows of symbols (trit + 1) into one byte per row of `groups`."""
+    if encoding == "2bit":
+        out[:] = groups[:, 0]
+        for slot in (1, 2, 3):
+            out |= groups[:, slot] << _SHIFTS[slot]
+        return
+    # Horner's rule from the most significant digit; every partial sum stays below 243.
+    out[:] = groups[:, 4]
+    for slot in (3, 2, 1, 0):
+        out *= 3
+        out += groups[:, slot]
+
+
+def _as_float_view(values: Any) -> tuple[npt.NDArray[Any], bool]:
+    """Return a flat view of `values` and whether it holds raw bfloat16 bits.
+
+    ndarrays, buffer-protocol objects and CPU torch tensors are viewed without
+    copying; other iterables are materialized as float64.
+    """
+    if hasattr(values, "detach") and hasattr(values, "cpu") and hasattr(values, "numpy"):
+        tensor = values.detach().cpu().reshape(-1)
+        if str(tensor.dtype) == "torch.bfloat16":
+            import torch
+
+            return tensor.view(torch.int16).numpy().view(np.uint16), True
+        values = tensor.numpy()
+    if isinstance(values, np.ndarray):
+        arr = values
+    else:
+        try:
+            arr = np.asarray(memoryview(values))
+        except TypeError:
+            arr = np.asarray(values if hasattr(values, "__len__") else list(values))
+    if arr.dtype.name == "bfloat16":
+        return arr.reshape(-1).view(np.uint16), True
+    if arr.dtype.kind != "f":
+        arr = arr.astype(np.float64)
+    return arr.reshape(-1), False
+
+
+def _dtype_threshold(dtype: np.dtype[Any], threshold: float) -> np.floating[Any]:
+    """Largest value of `dtype` not above `threshold`.
+
+    For any `x` representable in `dtype`, `x > threshold` iff `x > result`, so
+    comparing in the input's own precision matches exact float64 thresholding.
+    """
+    bound: np.floating[Any] = dtype.type(threshold)
+    if float(bound) > threshold:
+        bound = np.nextafter(bound, dtype.type(0))
+    return bound
+
+
+def _channel_bounds(dtype: np.dtype[Any], thresholds: npt.ArrayLike) -> npt.NDArray[Any]:
+    """Vectorized `_dtype_threshold` for an array of per-channel thresholds."""
+    exact = np.asarray(thresholds, dtype=np.float64).reshape(-1)
+    if not (exact >= 0).all():
+        raise ValueError("thresholds must be non-negative")
+    bounds = exact.astype(dtype)
+    rounded_up = bounds.astype(np.float64) > exact
+    bounds[rounded_up] = np.nextafter(bounds[rounded_up], dtype.type(0))
+    return bounds
+
+
+def quantize_array_to_trits(
+    values: Any,
+    threshold: float = 0.05,
+    *,
+    out: npt.NDArray[np.int8] | None = None,
+) -> npt.NDArray[np.int8]:
+    """Threshold floats to an int8 trit array without copying the input.
+
+    Accepts ndarrays, memoryviews/buffer-protocol objects and CPU torch tensors
+    (including float16 and bfloat16) and compares in the input's own dtype. The
+    result is written to `out` when given (a C-contiguous int8 array with one
+    element per input value), otherwise to a new flat array.
+    """
+    if not threshold >= 0:
+        raise ValueError(f"threshold must be non-negative, got {threshold}")
+    arr, bfloat16_bits = _as_float_view(values)
+    if out is None:
+        out = np.empty(arr.size, dtype=np.int8)
+    elif out.dtype != np.int8 or out.size != arr.size or not out.flags.c_contiguous:
+        raise ValueError(f"out must be a C-contiguous int8 array with {arr.size} elements")
+    target = out.reshape(-1)
+
+    upper = _dtype_threshold(np.dtype(np.float32) if bfloat16_bits else arr.dtype, threshold)
+    lower = -upper
+    for start in range(0, arr.size, _QUANTIZE_BLOCK):
+        block = arr[start : start + _QUANTIZE_BLOCK]
+        if bfloat16_bits:
+            block = (block.astype(np.uint32) << 16).view(np.float32)
+        dst = target[start : start + _QUANTIZE_BLOCK]
+        np.greater(block, upper, out=dst)
+        np.subtract(dst, np.less(block, lower), out=dst, casting="unsafe")
+    return out
+
+
+def quantize_pack_trits(
+    values: Any,
+    threshold: float | npt.ArrayLike = 0.05,
+    *,
+    block_size: int | None = None,
+    channel_size: int | None = None,
+    offset: int = 0,
+    encoding: str = "2bit",
+) -> tuple[npt.NDArray[np.uint8], tuple[int, int, int]]:
+    """Fused threshold + count + 2-bit pack in one pass over `values`.
+
+    Returns the packed payload (byte-identical to `pack_trits_array` of
+    `quantize_array_to_trits`) and the `(neg, zero, pos)` counts. Input is
+    walked in `block_size` slices (a multiple of the trits per byte; about 64K
+    values by default) through reused scratch buffers, so no full-size trit
+    array is materialized. `encoding` selects the payload encoding (see
+    `PAYLOAD_ENCODINGS`).
+
+    With `channel_size`, `threshold` is an array of per-channel thresholds and
+    value `i` is compared against `threshold[(offset + i) // channel_size]`;
+    `offset` is the position of `values` within the whole tensor.
+    """
+    group = trits_per_byte(encoding)
+    if block_size is None:
+        block_size = _QUANTIZE_BLOCK - _QUANTIZE_BLOCK % group
+    if block_size <= 0 or block_size % group:
+        raise ValueError(f"block_size must be a positive multiple of {group}, got {block_size}")
+    arr, bfloat16_bits = _as_float_view(values)
+    total = arr.size
+    packed = np.empty(-(-total // group), dtype=np.uint8)
+    compare_dtype = np.dtype(np.float32) if bfloat16_bits else arr.dtype
+    channel_bounds: npt.NDArray[Any] | None = None
+    channel_width = channel_size or 1
+    if channel_size is not None:
+        if channel_size <= 0:
+            raise ValueError(f"channel_size must be positive, got {channel_size}")
+        channel_bounds = _channel_bounds(compare_dtype, threshold)
+        upper: Any = None
+        lower: Any = None
+    else:
+        scalar = float(threshold)  # type: ignore[arg-type]
+        if not scalar >= 0:
+            raise ValueError(f"threshold must be non-negative, got {scalar}")
+        upper = _dtype_threshold(compare_dtype, scalar)
+        lower = -upper
+
+    step = min(block_size, max(group, -(-total // group) * group))
+    above = np.empty(step, dtype=np.bool_)
+    below = np.empty(step, dtype=np.bool_)
+    symbols = np.empty(step, dtype=np.uint8)
+    neg = pos = 0
+    for start in range(0, total, step):
+        block = arr[start : start + step]
+        if bfloat16_bits:
+            block = (block.astype(np.uint32) << 16).view(np.float32)
+        size = block.size
+        gt = above[:size]
+        lt = below[:size]
+        if channel_bounds is None:
+            np.greater(block, upper, out=gt)
+            np.less(block, lower, out=lt)
+        elif channel_width >= _CHANNEL_RUN:
+            # Long channels: compare each run against its scalar bound.
+            first = offset + start
+            for run in range(first - first % channel_width, first + size, channel_width):
+                lo = max(run, first) - first
+                hi = min(run + channel_width, first + size) - first
+                bound = channel_bounds[run // channel_width]
+                np.greater(block[lo:hi], bound, out=gt[lo:hi])
+                np.less(block[lo:hi], -bound, out=lt[lo:hi])
+        else:
+            index = np.arange(offset + start, offset + start + size) // channel_width
+            bounds = channel_bounds[index]
+            np.greater(block, bounds, out=gt)
+            np.less(block, np.negative(bounds), out=lt)
+        pos += int(np.count_nonzero(gt))
+        neg += int(np.count_nonzero(lt))
+
+        padded = -(-size // group) * group
+        sym = symbols[:padded]
+        np.add(gt, 1, out=sym[:size], casting="unsafe")
+        np.subtract(sym[:size], lt, out=sym[:size], casting="unsafe")
+        sym[size:] = 0
+        first_byte = start // group
+        _pack_symbols(
+            sym.reshape(-1, group), encoding, packed[first_byte : first_byte + padded // group]
+        )
+    return packed, (neg, total - neg - pos, pos)
 
 
 def quantize_float_to_trits(values: Iterable[float], threshold: float = 0.05) -> TritVector:
     """Convert floats to {-1, 0, +1} with symmetric thresholding."""
-    arr = np.asarray(list(values), dtype=np.float64)
-    trits = np.where(arr > threshold, 1, np.where(arr < -threshold, -1, 0))
-    return TritVector.from_ints(trits.tolist())
+    return TritVector.from_numpy(quantize_array_to_trits(values, threshold))
 
 
 def dequantize_trits(values: Iterable[int | Trit], scale: float = 1.0) -> npt.NDArray[np.float32]:
     """Map trits back to float values using a scalar multiplier."""
-    ints = np.asarray([int(v) for v in values], dtype=np.float32)
-    out = np.asarray(ints * np.float32(scale), dtype=np.float32)
+    if isinstance(values, TritVector):
+        ints = values.as_numpy().astype(np.float32)
+    elif isinstance(values, np.ndarray):
+        ints = values.astype(np.float32)
+    else:
+        ints = np.asarray([int(v) for v in values], dtype=np.float32)
+    ints *= np.float32(scale)
+    return ints
+
+
+def pack_trits_array(trits: npt.ArrayLike, encoding: str = "2bit") -> npt.NDArray[np.uint8]:
+    """Pack an int8 array of trits, four 2-bit symbols (or five base-3 digits) per byte.
+
+    `2bit` output is byte-identical to `pack_trits`: symbols are stored
+    little-endian within each byte and a trailing partial byte is zero-padded.
+    `base3` stores the first trit in the least significant digit, likewise
+    padded with zero digits.
+    """
+    group = trits_per_byte(encoding)
+    arr = np.asarray(trits).reshape(-1)
+    if arr.size and (int(arr.min()) < -1 or int(arr.max()) > 1):
+        raise ValueError("Trit arrays may only contain -1, 0 or 1")
+    symbols = np.zeros(-(-arr.size // group) * group, dtype=np.uint8)
+    np.add(arr, 1, out=symbols[: arr.size], casting="unsafe")
+    packed = np.empty(symbols.size // group, dtype=np.uint8)
+    _pack_symbols(symbols.reshape(-1, group), encoding, packed)
+    return packed
+
+
+def _payload_bytes(payload: bytes | npt.ArrayLike) -> npt.NDArray[np.uint8]:
+    if isinstance(payload, (bytes, bytearray, memoryview)):
+        return np.frombuffer(payload, dtype=np.uint8)
+    return np.asarray(payload, dtype=np.uint8).reshape(-1)
+
+
+def unpack_trits_array(
+    payload: bytes | npt.ArrayLike, count: int, encoding: str = "2bit"
+) -> npt.NDArray[np.int8]:
+    """Decode `count` trits from a packed payload into an int8 array (one table lookup per byte)."""
+    group = trits_per_byte(encoding)
+    raw = _payload_bytes(payload)
+    needed = -(-count // group)
+    if raw.size < needed:
+        raise ValueError(f"Expected {count} trits, decoded {raw.size * group}")
+    lut = _UNPACK_LUT if encoding == "2bit" else _BASE3_UNPACK_LUT
+    out = lut[raw[:needed]].reshape(-1)[:count]
+    if out.size and int(out.max()) > 1:
+        raise ValueError(f"Packed payload contains {_INVALID[encoding]}")
     return out
 
 
+def count_packed_trits(
+    payload: bytes | npt.ArrayLike, count: int, encoding: str = "2bit"
+) -> tuple[int, int, int]:
+    """Count (-1, 0, +1) trits directly on a packed payload without decoding it.
+
+    Bytes are histogrammed with `np.bincount` and mapped through a 256-entry
+    table of per-byte symbol counts; padding in the final byte is excluded.
+    """
+    group = trits_per_byte(encoding)
+    raw = _payload_bytes(payload)
+    needed = -(-count // group)
+    if raw.size < needed:
+        raise ValueError(f"Expected {count} trits, decoded {raw.size * group}")
+    raw = raw[:needed]
+    histogram = np.zeros(256, dtype=np.int64)
+    for start in range(0, needed, _COUNT_BLOCK):
+        histogram += np.bincount(raw[start : start + _COUNT_BLOCK], minlength=256)
+    if encoding == "2bit":
+        symbols = histogram @ _SYMBOL_COUNT_LUT
+        unpack_lut = _UNPACK_LUT
+    else:
+        symbols = histogram @ _BASE3_COUNT_LUT
+        unpack_lut = _BASE3_UNPACK_LUT
+    padding = needed * group - count
+    if padding and int(raw[-1]) < (_BASE3_LIMIT if encoding == "base3" else 256):
+        for trit in unpack_lut[int(raw[-1]), group - padding :]:
+            symbols[int(trit) + 1] -= 1
+    if symbols[3]:
+        raise ValueError(f"Packed payload contains {_INVALID[encoding]}")
+    return int(symbols[0]), int(symbols[1]), int(symbols[2])
+
+
 def pack_trits(values: Iterable[int | Trit]) -> bytes:
     """Pack trits into a compact byte stream using 2-bit symbols."""
-    out = bytearray()
-    current = 0
-    shift = 0
-    for raw in values:
-        mapped = _TRIT_TO_PACKED[int(raw)]
-        current |= (mapped & 0b11) << shift
-        shift += 2
-        if shift == 8:
-            out.append(current)
-            current = 0
-            shift = 0
-    if shift:
-        out.append(current)
-    return bytes(out)
+    if isinstance(values, TritVector):
+        arr = values.as_numpy()
+    elif isinstance(values, np.ndarray):
+        arr = values
+    else:
+        arr = np.fromiter(map(int, values), dtype=np.int64)
+    return pack_trits_array(arr).tobytes()
 
 
 def unpack_trits(payload: bytes, count: int) -> TritVector:
     """Decode a packed byte stream created by `pack_trits`."""
-    out: list[int] = []
-    for byte in payload:
-        for shift in (0, 2, 4, 6):
-            if len(out) >= count:
-                return TritVector.from_ints(out)
-            out.append(_PACKED_TO_TRIT[(byte >> shift) & 0b11])
-    if len(out) != count:
-        raise ValueError(f"Expected {count} trits, decoded {len(out)}")
-    return TritVector.from_ints(out)
+    return TritVector.from_numpy(unpack_trits_array(payload, count))
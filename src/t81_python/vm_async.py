@@ -0,0 +1,205 @@
+"""asyncio front end for running T81VM programs without blocking the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+from collections.abc import AsyncIterator, Callable, Sequence
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from types import TracebackType
+from typing import Any, TypeVar
+
+import numpy.typing as npt
+
+from .vm_bridge import DEFAULT_TRACE_PAGE, VMBridge
+from .vm_pool import VMRunResult, _load_job_program
+
+DEFAULT_SLICE_STEPS = 10_000
+
+_T = TypeVar("_T")
+
+
+def _run_slice(bridge: VMBridge, budget: int) -> tuple[int, int]:
+    before = bridge.trace_len()
+    status = bridge.run_to_halt(budget)
+    return status, bridge.trace_len() - before
+
+
+class AsyncVMBridge:
+    """Run VM programs from coroutines on a bounded pool of bridge handles.
+
+    At most `max_in_flight` programs execute at once, each on its own handle in
+    a worker thread. Runs advance in `slice_steps` slices and return to the
+    event loop between slices, so cancelling the awaiting task stops a run at
+    the next slice boundary and other coroutines are never starved. A cancelled
+    run keeps its handle and its `max_in_flight` slot until the slice already
+    executing on the worker thread has returned.
+    """
+
+    def __init__(
+        self,
+        lib_path: Path | None = None,
+        *,
+        max_in_flight: int | None = None,
+        slice_steps: int = DEFAULT_SLICE_STEPS,
+        program_cache_size: int = 0,
+    ) -> None:
+        self.max_in_flight = max_in_flight if max_in_flight is not None else (os.cpu_count() or 1)
+        if self.max_in_flight < 1:
+            raise ValueError("max_in_flight must be >= 1")
+        if slice_steps < 1:
+            raise ValueError("slice_steps must be >= 1")
+        self.lib_path = VMBridge._resolve_lib_path(lib_path)
+        self.slice_steps = slice_steps
+        self.program_cache_size = program_cache_size
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.max_in_flight, thread_name_prefix="t81vm-async"
+        )
+        self._idle: list[VMBridge] = []
+        self._bridges: list[VMBridge] = []
+        self._running: dict[int, Future[Any]] = {}
+        self._slots: asyncio.Semaphore | None = None
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        # Created lazily so it binds to the running loop rather than one at construction.
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_in_flight)
+        return self._slots
+
+    async def _acquire(self) -> VMBridge:
+        """Take a `max_in_flight` slot and a handle; both go back through `_release`."""
+        await self._semaphore().acquire()
+        if self._idle:
+            return self._idle.pop()
+        try:
+            bridge = VMBridge(self.lib_path, program_cache_size=self.program_cache_size)
+        except BaseException:
+            self._semaphore().release()
+            raise
+        self._bridges.append(bridge)
+        return bridge
+
+    def _return(self, bridge: VMBridge) -> None:
+        self._idle.append(bridge)
+        self._semaphore().release()
+
+    def _release(self, bridge: VMBridge) -> None:
+        """Return `bridge` and its slot once no executor call is still using it.
+
+        Cancelling the awaiting task does not stop a slice that already started
+        on a worker thread, so the handle is only reused after that call returns.
+        """
+        future = self._running.pop(id(bridge), None)
+        if future is None or future.done():
+            self._return(bridge)
+            return
+        loop = asyncio.get_running_loop()
+
+        def finished(_: Future[Any]) -> None:
+            try:
+                loop.call_soon_threadsafe(self._return, bridge)
+            except RuntimeError:  # Loop already closed: only the handle needs returning.
+                self._idle.append(bridge)
+
+        future.add_done_callback(finished)
+
+    async def _call(self, bridge: VMBridge, fn: Callable[..., _T], *args: Any) -> _T:
+        """Run `fn(bridge, *args)` on the executor."""
+        future = self._executor.submit(fn, bridge, *args)
+        self._running[id(bridge)] = future
+        result = await asyncio.wrap_future(future)
+        del self._running[id(bridge)]
+        return result
+
+    async def run_to_halt(
+        self,
+        program: str | Path,
+        *,
+        max_steps: int = 100_000,
+        registers: Sequence[int] = (),
+        trace: bool = False,
+    ) -> VMRunResult:
+        """Load and run `program` for at most `max_steps` steps.
+
+        Returns the same `VMRunResult` as `VMPool`, including `status=-1` with
+        `error` set for a program that fails to load.
+        """
+        path = Path(program)
+        bridge = await self._acquire()
+        try:
+            error = await self._call(bridge, _load_job_program, path)
+            if error is not None:
+                return VMRunResult(path, status=-1, state_hash=0, registers=(), error=error)
+            status = await self._run_slices(bridge, max_steps)
+            return VMRunResult(
+                program=path,
+                status=status,
+                state_hash=bridge.state_hash(),
+                registers=tuple(bridge.register(index) for index in registers),
+                trace=(await self._call(bridge, VMBridge.trace_array)) if trace else None,
+            )
+        finally:
+            self._release(bridge)
+
+    async def _run_slices(self, bridge: VMBridge, max_steps: int) -> int:
+        executed = status = 0
+        while executed < max_steps:
+            budget = min(self.slice_steps, max_steps - executed)
+            status, ran = await self._call(bridge, _run_slice, budget)
+            executed += ran
+            if ran < budget:
+                break
+        return status
+
+    async def iter_trace_pages(
+        self,
+        program: str | Path,
+        *,
+        max_steps: int = 100_000,
+        page_size: int = DEFAULT_TRACE_PAGE,
+    ) -> AsyncIterator[npt.NDArray[Any]]:
+        """Run `program` and yield its trace as `TRACE_DTYPE` pages while it executes.
+
+        New entries are copied out after every slice, so the first pages arrive
+        before the run finishes. Raises RuntimeError if the program fails to load.
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        bridge = await self._acquire()
+        try:
+            error = await self._call(bridge, _load_job_program, Path(program))
+            if error is not None:
+                raise RuntimeError(error)
+            emitted = executed = 0
+            finished = max_steps <= 0
+            while not finished:
+                budget = min(self.slice_steps, max_steps - executed)
+                _, ran = await self._call(bridge, _run_slice, budget)
+                executed += ran
+                finished = ran < budget or executed >= max_steps
+                length = bridge.trace_len()
+                while length - emitted >= page_size or (finished and emitted < length):
+                    stop = min(emitted + page_size, length)
+                    yield await self._call(bridge, VMBridge.trace_array, emitted, stop)
+                    emitted = stop
+        finally:
+            self._release(bridge)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        for bridge in self._bridges:
+            bridge.close()
+        self._bridges.clear()
+        self._idle.clear()
+
+    async def __aenter__(self) -> AsyncVMBridge:
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        await asyncio.get_running_loop().run_in_executor(None, self.close)
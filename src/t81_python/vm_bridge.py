@@ -3,9 +3,17 @@
 from __future__ import annotations
 
 import ctypes
+import hashlib
 import os
+import tempfile
+from collections import OrderedDict
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
+from typing import Any
+
+import numpy as np
+import numpy.typing as npt
 
 
 @dataclass(frozen=True)
@@ -23,6 +31,29 @@ class _CTraceEntry(ctypes.Structure):
     ]
 
 
+# Structured dtype with the exact layout of `t81vm_trace_entry`, so a NumPy array of
+# it can be handed to the C API as a `t81vm_trace_entry*` without conversion.
+TRACE_DTYPE: np.dtype[Any] = np.dtype(_CTraceEntry)
+DEFAULT_TRACE_PAGE = 1 << 16
+
+
+@dataclass(frozen=True)
+class VMRunSnapshots:
+    """Register/state-hash snapshots taken by `VMBridge.run` after each slice."""
+
+    status: int
+    steps: int
+    step: npt.NDArray[np.int64]
+    registers: npt.NDArray[np.int64]
+    state_hash: npt.NDArray[np.uint64]
+
+
+@dataclass(frozen=True)
+class _LoadedProgram:
+    handle: ctypes.c_void_p
+    source: Path | bytes
+
+
 def default_vm_lib_paths(workspace_root: Path | None = None) -> list[Path]:
     root = workspace_root if workspace_root is not None else Path(__file__).resolve().parents[3]
     return [
@@ -34,7 +65,9 @@ def default_vm_lib_paths(workspace_root: Path | None = None) -> list[Path]:
 class VMBridge:
     """Minimal runtime bridge for loading and executing T81VM programs."""
 
-    def __init__(self, lib_path: Path | None = None) -> None:
+    def __init__(self, lib_path: Path | None = None, *, program_cache_size: int = 0) -> None:
+        if program_cache_size < 0:
+            raise ValueError("program_cache_size must be >= 0")
         path = self._resolve_lib_path(lib_path)
         self._lib = ctypes.CDLL(str(path))
 
@@ -56,11 +89,57 @@ class VMBridge:
             ctypes.POINTER(_CTraceEntry),
         ]
         self._lib.t81vm_trace_get.restype = ctypes.c_int
+        # Same symbol taking a raw address, used to fill NumPy buffers in place.
+        self._trace_get_into = ctypes.CFUNCTYPE(
+            ctypes.c_int, ctypes.c_void_p, ctypes.c_size_t, ctypes.c_void_p
+        )(("t81vm_trace_get", self._lib))
+        # Optional bulk export: int t81vm_trace_get_range(vm, start, count, entry* out).
+        self._trace_get_range = getattr(self._lib, "t81vm_trace_get_range", None)
+        if self._trace_get_range is not None:
+            self._trace_get_range.argtypes = [
+                ctypes.c_void_p,
+                ctypes.c_size_t,
+                ctypes.c_size_t,
+                ctypes.POINTER(_CTraceEntry),
+            ]
+            self._trace_get_range.restype = ctypes.c_int
+        # Optional bulk register read: size_t t81vm_registers(vm, int64_t* out, size_t count)
+        # returns the number of registers written; t81vm_register_count reports the total.
+        self._registers_into = getattr(self._lib, "t81vm_registers", None)
+        if self._registers_into is not None:
+            self._registers_into.argtypes = [ctypes.c_void_p, ctypes.c_void_p, ctypes.c_size_t]
+            self._registers_into.restype = ctypes.c_size_t
+        self._register_count = getattr(self._lib, "t81vm_register_count", None)
+        if self._register_count is not None:
+            self._register_count.argtypes = [ctypes.c_void_p]
+            self._register_count.restype = ctypes.c_size_t
+        # Optional: int t81vm_load_buffer(vm, const uint8_t* data, size_t len).
+        self._load_buffer = getattr(self._lib, "t81vm_load_buffer", None)
+        if self._load_buffer is not None:
+            self._load_buffer.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_size_t]
+            self._load_buffer.restype = ctypes.c_int
+        # Optional: int t81vm_reset(vm), restoring the post-load state.
+        self._reset = getattr(self._lib, "t81vm_reset", None)
+        if self._reset is not None:
+            self._reset.argtypes = [ctypes.c_void_p]
+            self._reset.restype = ctypes.c_int
 
+        # Hot calls bind their foreign functions once instead of resolving them per call.
+        self._state_hash_fn = self._lib.t81vm_state_hash
+        self._register_fn = self._lib.t81vm_register
+
+        self._handle = self._create_handle()
+        # Source of the program on the active handle, used when reset falls back to reloading.
+        self._source: Path | bytes | None = None
+        self.program_cache_size = program_cache_size
+        self._programs: OrderedDict[str, _LoadedProgram] = OrderedDict()
+        self._path_digests: dict[tuple[str, int, int], str] = {}
+
+    def _create_handle(self) -> ctypes.c_void_p:
         handle = self._lib.t81vm_create()
-        if handle == 0:
+        if not handle:
             raise RuntimeError("failed to create t81vm handle")
-        self._handle = ctypes.c_void_p(handle)
+        return ctypes.c_void_p(handle)
 
     @staticmethod
     def _resolve_lib_path(explicit: Path | None) -> Path:
@@ -82,40 +161,308 @@ class VMBridge:
         raise FileNotFoundError("unable to locate t81-vm C API library")
 
     def close(self) -> None:
-        if getattr(self, "_handle", None):
-            self._lib.t81vm_destroy(self._handle)
-            self._handle = ctypes.c_void_p()
+        handles = [entry.handle for entry in getattr(self, "_programs", {}).values()]
+        active = getattr(self, "_handle", None)
+        if active and not any(handle is active for handle in handles):
+            handles.append(active)
+        for handle in handles:
+            self._lib.t81vm_destroy(handle)
+        if hasattr(self, "_programs"):
+            self._programs.clear()
+        self._handle = ctypes.c_void_p()
 
     def __del__(self) -> None:
         self.close()
 
+    @property
+    def has_bulk_registers(self) -> bool:
+        """True when `registers()` reads the register file in one `t81vm_registers` call."""
+        return self._registers_into is not None
+
+    @property
+    def has_load_buffer(self) -> bool:
+        """True when programs can be loaded from memory without a temporary file."""
+        return self._load_buffer is not None
+
+    @property
+    def has_reset(self) -> bool:
+        """True when `reset()` restores state without re-parsing the program."""
+        return self._reset is not None
+
+    def _load_into(self, handle: ctypes.c_void_p, source: Path | bytes) -> None:
+        if isinstance(source, Path):
+            status = int(self._lib.t81vm_load_file(handle, str(source).encode("utf-8")))
+            if status != 0:
+                raise RuntimeError(f"t81vm_load_file failed with status={status}")
+            return
+        if self._load_buffer is not None:
+            status = int(self._load_buffer(handle, source, len(source)))
+            if status != 0:
+                raise RuntimeError(f"t81vm_load_buffer failed with status={status}")
+            return
+        fd, name = tempfile.mkstemp(prefix="t81vm-", suffix=".tisc.json")
+        try:
+            with os.fdopen(fd, "wb") as handle_file:
+                handle_file.write(source)
+            self._load_into(handle, Path(name))
+        finally:
+            os.unlink(name)
+
+    def _detach_active(self) -> None:
+        """Drop the active handle from the program cache before it is overwritten."""
+        for digest, entry in self._programs.items():
+            if entry.handle is self._handle:
+                del self._programs[digest]
+                break
+
     def load_file(self, path: Path) -> None:
-        status = self._lib.t81vm_load_file(self._handle, str(path).encode("utf-8"))
-        if status != 0:
-            raise RuntimeError(f"t81vm_load_file failed with status={status}")
+        self._detach_active()
+        self._source = None
+        self._load_into(self._handle, Path(path))
+        self._source = Path(path)
+
+    def load_bytes(self, data: bytes) -> None:
+        """Load a program (TISC JSON or text) from memory.
+
+        Uses `t81vm_load_buffer` when the library exports it, otherwise a temporary file.
+        """
+        self._detach_active()
+        self._source = None
+        self._load_into(self._handle, bytes(data))
+        self._source = bytes(data)
+
+    def reset(self) -> None:
+        """Return the active handle to its post-load state.
+
+        Uses `t81vm_reset` when available; otherwise the program is reloaded from
+        the bytes or path it was last loaded from.
+        """
+        if self._source is None:
+            raise RuntimeError("no program loaded")
+        if self._reset is not None:
+            status = int(self._reset(self._handle))
+            if status != 0:
+                raise RuntimeError(f"t81vm_reset failed with status={status}")
+            return
+        self._load_into(self._handle, self._source)
+
+    def _digest_path(self, path: Path) -> tuple[str, bytes | None]:
+        stat = path.stat()
+        key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+        digest = self._path_digests.get(key)
+        if digest is not None and digest in self._programs:
+            return digest, None
+        data = path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        self._path_digests[key] = digest
+        return digest, data
+
+    def load_program(self, program: str | Path | bytes) -> str:
+        """Make `program` the active program and return its SHA-256 content digest.
+
+        With `program_cache_size > 0`, up to that many loaded handles are kept in
+        an LRU keyed by content digest. Loading a program that is already cached
+        switches to its handle and resets it, skipping file I/O and parsing (an
+        unchanged file is recognised by path, mtime and size alone).
+        """
+        if isinstance(program, bytes):
+            data: bytes | None = program
+            digest = hashlib.sha256(program).hexdigest()
+        else:
+            digest, data = self._digest_path(Path(program))
+        cached = self._programs.get(digest)
+        if cached is not None:
+            self._programs.move_to_end(digest)
+            if cached.handle is not self._handle:
+                if not any(entry.handle is self._handle for entry in self._programs.values()):
+                    self._lib.t81vm_destroy(self._handle)
+                self._handle = cached.handle
+            self._source = cached.source
+            self.reset()
+            return digest
+
+        source: Path | bytes = program if isinstance(program, bytes) else Path(program)
+        if data is not None and self._load_buffer is not None:
+            source = data
+        if self.program_cache_size == 0:
+            if isinstance(source, bytes):
+                self.load_bytes(source)
+            else:
+                self.load_file(source)
+            return digest
+
+        if not any(entry.handle is self._handle for entry in self._programs.values()):
+            handle = self._handle
+        elif len(self._programs) >= self.program_cache_size:
+            evicted_digest, evicted = self._programs.popitem(last=False)
+            handle = evicted.handle
+            self._path_digests = {
+                key: value for key, value in self._path_digests.items() if value != evicted_digest
+            }
+        else:
+            handle = self._create_handle()
+        self._handle = handle
+        self._source = None
+        self._load_into(handle, source)
+        self._source = source
+        self._programs[digest] = _LoadedProgram(handle, source)
+        return digest
 
     def run_to_halt(self, max_steps: int = 100_000) -> int:
         return int(self._lib.t81vm_run_to_halt(self._handle, max_steps))
 
+    def run(
+        self,
+        steps: int,
+        *,
+        snapshot_every: int | None = None,
+        registers: int | None = None,
+    ) -> VMRunSnapshots:
+        """Run up to `steps` steps, snapshotting registers and state hash every `snapshot_every`.
+
+        Each snapshot costs one `t81vm_run_to_halt` slice plus one bulk register
+        read, independent of the slice length. Executed steps are measured by
+        trace growth, so a slice that runs short (halt or trap) ends the run.
+        `registers` is the number of registers captured per snapshot; by default
+        all of them when the library reports a count, otherwise none. If the VM
+        writes fewer registers than requested, the columns are trimmed to the
+        fewest written in any snapshot.
+        """
+        if steps < 0:
+            raise ValueError("steps must be >= 0")
+        every = steps if snapshot_every is None else snapshot_every
+        if every <= 0 and steps:
+            raise ValueError("snapshot_every must be positive")
+        count = registers if registers is not None else (self.register_count() or 0)
+        run_slice = self._lib.t81vm_run_to_halt
+        trace_len = self._lib.t81vm_trace_len
+        handle = self._handle
+        snapshots = -(-steps // every) if steps else 0
+        step_at = np.empty(snapshots, dtype=np.int64)
+        register_rows = np.zeros((snapshots, count), dtype=np.int64)
+        width = count
+        hashes = np.empty(snapshots, dtype=np.uint64)
+        executed = taken = status = 0
+        while executed < steps:
+            budget = min(every, steps - executed)
+            before = trace_len(handle)
+            status = run_slice(handle, budget)
+            ran = trace_len(handle) - before
+            executed += ran
+            step_at[taken] = executed
+            if count:
+                width = min(width, self.registers(count, out=register_rows[taken]).size)
+            hashes[taken] = self._state_hash_fn(handle)
+            taken += 1
+            if ran < budget:
+                break
+        return VMRunSnapshots(
+            status=int(status),
+            steps=executed,
+            step=step_at[:taken],
+            registers=register_rows[:taken, :width],
+            state_hash=hashes[:taken],
+        )
+
     def state_hash(self) -> int:
-        return int(self._lib.t81vm_state_hash(self._handle))
+        return int(self._state_hash_fn(self._handle))
 
     def register(self, index: int) -> int:
-        return int(self._lib.t81vm_register(self._handle, index))
+        return int(self._register_fn(self._handle, index))
 
-    def trace(self) -> list[VMTraceEntry]:
-        count = int(self._lib.t81vm_trace_len(self._handle))
-        out: list[VMTraceEntry] = []
-        for i in range(count):
-            c_entry = _CTraceEntry()
-            status = int(self._lib.t81vm_trace_get(self._handle, i, ctypes.byref(c_entry)))
-            if status != 0:
-                raise RuntimeError(f"t81vm_trace_get failed with status={status} index={i}")
-            out.append(
-                VMTraceEntry(
-                    pc=int(c_entry.pc),
-                    opcode=int(c_entry.opcode),
-                    trap=None if c_entry.trap < 0 else int(c_entry.trap),
+    def register_count(self) -> int | None:
+        """Number of VM registers, or None when the library does not export it."""
+        if self._register_count is None:
+            return None
+        return int(self._register_count(self._handle))
+
+    def registers(
+        self, count: int | None = None, *, out: npt.NDArray[np.int64] | None = None
+    ) -> npt.NDArray[np.int64]:
+        """Read registers `0..count-1` into an int64 array.
+
+        One `t81vm_registers` call when the library exports it, otherwise one
+        `t81vm_register` call per register. `count` defaults to `register_count()`.
+        """
+        if count is None:
+            count = self.register_count()
+            if count is None:
+                raise ValueError("register count unknown: library lacks t81vm_register_count")
+        if out is None:
+            out = np.empty(count, dtype=np.int64)
+        elif out.dtype != np.int64 or out.shape != (count,) or not out.flags.c_contiguous:
+            raise ValueError(f"out must be a C-contiguous int64 array of shape ({count},)")
+        if self._registers_into is not None:
+            written = int(self._registers_into(self._handle, out.ctypes.data, count))
+            return out[:written]
+        read = self._register_fn
+        for index in range(count):
+            out[index] = read(self._handle, index)
+        return out
+
+    @property
+    def has_bulk_trace(self) -> bool:
+        """True when the loaded library exports `t81vm_trace_get_range`."""
+        return self._trace_get_range is not None
+
+    def trace_len(self) -> int:
+        return int(self._lib.t81vm_trace_len(self._handle))
+
+    def trace_array(self, start: int = 0, stop: int | None = None) -> npt.NDArray[Any]:
+        """Copy trace entries `[start, stop)` into a `TRACE_DTYPE` structured array.
+
+        Uses one `t81vm_trace_get_range` call when the library provides it, and
+        otherwise fills the array in place with `t81vm_trace_get`.
+        """
+        length = self.trace_len()
+        stop = length if stop is None else stop
+        if not 0 <= start <= stop <= length:
+            raise IndexError(f"trace range [{start}, {stop}) out of bounds for {length} entries")
+        out = np.empty(stop - start, dtype=TRACE_DTYPE)
+        if out.size == 0:
+            return out
+        if self._trace_get_range is not None:
+            status = int(
+                self._trace_get_range(
+                    self._handle,
+                    start,
+                    out.size,
+                    out.ctypes.data_as(ctypes.POINTER(_CTraceEntry)),
                 )
             )
+            if status != 0:
+                raise RuntimeError(
+                    f"t81vm_trace_get_range failed with status={status} start={start}"
+                )
+            return out
+        trace_get, base, itemsize = self._trace_get_into, out.ctypes.data, TRACE_DTYPE.itemsize
+        for offset in range(out.size):
+            status = int(trace_get(self._handle, start + offset, base + offset * itemsize))
+            if status != 0:
+                raise RuntimeError(
+                    f"t81vm_trace_get failed with status={status} index={start + offset}"
+                )
         return out
+
+    def iter_trace_pages(
+        self, page_size: int = DEFAULT_TRACE_PAGE, start: int = 0
+    ) -> Iterator[npt.NDArray[Any]]:
+        """Yield the trace lazily as `TRACE_DTYPE` arrays of at most `page_size` entries.
+
+        The trace length is sampled once, so entries appended while iterating are
+        not included.
+        """
+        if page_size <= 0:
+            raise ValueError("page_size must be positive")
+        length = self.trace_len()
+        for page_start in range(start, length, page_size):
+            yield self.trace_array(page_start, min(page_start + page_size, length))
+
+    def trace(self) -> list[VMTraceEntry]:
+        entries = self.trace_array()
+        return [
+            VMTraceEntry(pc=pc, opcode=opcode, trap=None if trap < 0 else trap)
+            for pc, opcode, trap in zip(
+                entries["pc"].tolist(), entries["opcode"].tolist(), entries["trap"].tolist()
+            )
+        ]
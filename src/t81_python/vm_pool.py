@@ -0,0 +1,183 @@
+"""Run batches of T81VM programs across a pool of bridge handles."""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from types import TracebackType
+from typing import Any
+
+import numpy.typing as npt
+
+from .vm_bridge import VMBridge
+
+
+@dataclass(frozen=True)
+class VMRunResult:
+    """Outcome of one pooled program run; `trace` is a `TRACE_DTYPE` array when requested."""
+
+    program: Path
+    status: int
+    state_hash: int
+    registers: tuple[int, ...]
+    trace: npt.NDArray[Any] | None = None
+    error: str | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.status == 0 and self.error is None
+
+
+@dataclass(frozen=True)
+class _VMJob:
+    program: Path
+    max_steps: int
+    registers: tuple[int, ...]
+    trace: bool
+
+
+def _load_job_program(bridge: VMBridge, program: Path) -> str | None:
+    """Load `program` on `bridge`, returning an error message instead of raising."""
+    try:
+        if bridge.program_cache_size:
+            bridge.load_program(program)
+        else:
+            bridge.load_file(program)
+    except (OSError, RuntimeError) as exc:
+        return str(exc)
+    return None
+
+
+def _run_job(bridge: VMBridge, job: _VMJob) -> VMRunResult:
+    error = _load_job_program(bridge, job.program)
+    if error is not None:
+        return VMRunResult(job.program, status=-1, state_hash=0, registers=(), error=error)
+    status = bridge.run_to_halt(job.max_steps)
+    return VMRunResult(
+        program=job.program,
+        status=status,
+        state_hash=bridge.state_hash(),
+        registers=tuple(bridge.register(index) for index in job.registers),
+        trace=bridge.trace_array() if job.trace else None,
+    )
+
+
+# One bridge per worker process, created by the pool initializer.
+_PROCESS_BRIDGE: VMBridge | None = None
+
+
+def _init_process_worker(lib_path: Path, program_cache_size: int) -> None:
+    global _PROCESS_BRIDGE
+    _PROCESS_BRIDGE = VMBridge(lib_path, program_cache_size=program_cache_size)
+
+
+def _run_in_process(job: _VMJob) -> VMRunResult:
+    assert _PROCESS_BRIDGE is not None
+    return _run_job(_PROCESS_BRIDGE, job)
+
+
+class VMPool:
+    """Run many programs concurrently, one `VMBridge` handle per worker.
+
+    Thread workers are the default: ctypes releases the GIL for the duration of
+    every C call, so `t81vm_run_to_halt` runs in parallel across threads. Pass
+    `processes=True` to isolate each handle in its own worker process instead.
+    `program_cache_size` is passed to every worker bridge, so repeated programs
+    reuse already-parsed handles (see `VMBridge.load_program`).
+    """
+
+    def __init__(
+        self,
+        workers: int | None = None,
+        lib_path: Path | None = None,
+        *,
+        processes: bool = False,
+        program_cache_size: int = 0,
+    ) -> None:
+        self.workers = workers if workers is not None else (os.cpu_count() or 1)
+        if self.workers < 1:
+            raise ValueError("workers must be >= 1")
+        self.lib_path = VMBridge._resolve_lib_path(lib_path)
+        self.processes = processes
+        self.program_cache_size = program_cache_size
+        self._local = threading.local()
+        self._bridges: list[VMBridge] = []
+        self._lock = threading.Lock()
+        self._executor: Executor
+        if processes:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_process_worker,
+                initargs=(self.lib_path, program_cache_size),
+            )
+        else:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="t81vm"
+            )
+
+    def _thread_bridge(self) -> VMBridge:
+        bridge: VMBridge | None = getattr(self._local, "bridge", None)
+        if bridge is None:
+            bridge = VMBridge(self.lib_path, program_cache_size=self.program_cache_size)
+            self._local.bridge = bridge
+            with self._lock:
+                self._bridges.append(bridge)
+        return bridge
+
+    def _run_in_thread(self, job: _VMJob) -> VMRunResult:
+        return _run_job(self._thread_bridge(), job)
+
+    def imap(
+        self,
+        programs: Iterable[str | Path],
+        *,
+        max_steps: int = 100_000,
+        registers: Sequence[int] = (),
+        trace: bool = False,
+        chunksize: int = 16,
+    ) -> Iterator[VMRunResult]:
+        """Yield one `VMRunResult` per program, in input order.
+
+        `registers` lists the register indices captured after each run. A program
+        that fails to load yields `status=-1` with `error` set instead of aborting
+        the batch. `chunksize` batches jobs per IPC round-trip in process mode.
+        """
+        jobs = (
+            _VMJob(Path(program), max_steps, tuple(registers), trace) for program in programs
+        )
+        if self.processes:
+            return self._executor.map(_run_in_process, jobs, chunksize=chunksize)
+        return self._executor.map(self._run_in_thread, jobs)
+
+    def run(
+        self,
+        programs: Iterable[str | Path],
+        *,
+        max_steps: int = 100_000,
+        registers: Sequence[int] = (),
+        trace: bool = False,
+    ) -> list[VMRunResult]:
+        """Run a batch of programs and return their results in input order."""
+        return list(self.imap(programs, max_steps=max_steps, registers=registers, trace=trace))
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            for bridge in self._bridges:
+                bridge.close()
+            self._bridges.clear()
+
+    def __enter__(self) -> VMPool:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        self.close()
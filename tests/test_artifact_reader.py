@@ -0,0 +1,92 @@
+from pathlib import Path
+
+import numpy as np
+import numpy.typing as npt
+import pytest
+
+from t81_python.pipelines import ArtifactReader, export_state_dict_to_ternary
+from t81_python.quantization import quantize_array_to_trits
+
+
+def _export(tmp_path: Path) -> dict[str, npt.NDArray[np.float32]]:
+    rng = np.random.default_rng(11)
+    state_dict = {
+        "embed.weight": (rng.standard_normal((9, 7)) * 0.1).astype(np.float32),
+        "bias": np.asarray([0.2, -0.3, 0.01], dtype=np.float32),
+    }
+    export_state_dict_to_ternary(state_dict, tmp_path, threshold=0.05)
+    return state_dict
+
+
+def test_reader_dequantizes_to_manifest_shape(tmp_path: Path) -> None:
+    state_dict = _export(tmp_path)
+    with ArtifactReader(tmp_path) as reader:
+        assert reader.names() == ["embed.weight", "bias"]
+        assert "bias" in reader and len(reader) == 2
+        for name, value in state_dict.items():
+            tensor = reader[name]
+            expected = quantize_array_to_trits(value, 0.05).reshape(value.shape)
+            out = tensor.to_numpy(scale=0.5)
+            assert out.dtype == np.float32
+            assert out.shape == value.shape
+            assert np.array_equal(out, expected.astype(np.float32) * 0.5)
+
+
+def test_reader_packed_view_is_zero_copy_payload(tmp_path: Path) -> None:
+    _export(tmp_path)
+    with ArtifactReader(tmp_path) as reader:
+        tensor = reader["bias"]
+        packed = tensor.packed()
+        assert isinstance(packed, memoryview)
+        assert bytes(packed) == (tmp_path / tensor.summary.payload_file).read_bytes()
+        del packed, tensor
+
+
+def test_reader_row_slices_match_full_decode(tmp_path: Path) -> None:
+    _export(tmp_path)
+    with ArtifactReader(tmp_path) as reader:
+        tensor = reader["embed.weight"]
+        full = tensor.to_numpy()
+        for start, stop in [(0, 1), (1, 4), (3, 9), (5, 20)]:
+            assert np.array_equal(tensor.rows(start, stop), full[start:stop])
+        assert np.array_equal(tensor.trits(5, 11), full.reshape(-1)[5:11].astype(np.int8))
+        with pytest.raises(IndexError):
+            tensor.trits(0, 100)
+        del tensor
+
+
+def test_reader_opens_single_file_container(tmp_path: Path) -> None:
+    state_dict = _export(tmp_path / "v01")
+    export_state_dict_to_ternary(state_dict, tmp_path / "v02", format_version="0.2")
+    with ArtifactReader(tmp_path / "v01") as legacy, ArtifactReader(tmp_path / "v02") as packed:
+        assert packed.manifest.format_version == "0.2"
+        for name in legacy:
+            assert bytes(packed[name].packed()) == bytes(legacy[name].packed())
+            assert np.array_equal(packed[name].rows(2, 4), legacy[name].rows(2, 4))
+
+
+def test_reader_applies_stored_calibration_scales(tmp_path: Path) -> None:
+    state_dict = {
+        "w": np.random.default_rng(3).standard_normal((5, 8)).astype(np.float32),
+        "b": np.asarray([0.4, -0.1, 0.9], dtype=np.float32),
+    }
+    for version in ("0.1", "0.2"):
+        out = tmp_path / version
+        export_state_dict_to_ternary(
+            state_dict, out, format_version=version, calibration="absmean/channel"
+        )
+        with ArtifactReader(out) as reader:
+            weight = reader["w"]
+            scales = weight.scales()
+            assert scales is not None and scales.shape == (5,)
+            gamma = np.abs(state_dict["w"]).mean(axis=1)
+            assert np.allclose(scales, gamma, rtol=1e-3)
+            trits = weight.trits().reshape(5, 8).astype(np.float32)
+            assert np.array_equal(weight.to_numpy(), trits * scales[:, None])
+            assert np.array_equal(weight.rows(1, 3), weight.to_numpy()[1:3])
+            assert np.array_equal(weight.to_numpy(scale=1.0), trits)
+            bias = reader["b"]
+            assert bias.summary.scale_count == 1  # 1-D tensors get one per-tensor scale
+            bias_scales = bias.scales()
+            assert bias_scales is not None
+            assert np.array_equal(bias.to_numpy(), bias.trits() * bias_scales[0])
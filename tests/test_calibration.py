@@ -0,0 +1,52 @@
+import numpy as np
+import pytest
+
+from t81_python.calibration import _CALIBRATION_BLOCK, CalibrationSpec, calibrate
+
+
+def test_spec_parses_and_round_trips() -> None:
+    for text in ("fixed", "absmean", "absmean/channel", "percentile:99", "percentile:75/channel"):
+        assert str(CalibrationSpec.parse(text)) == text
+    assert CalibrationSpec.parse("percentile") == CalibrationSpec("percentile", percentile=50.0)
+    for bad in ("median", "fixed/channel", "absmean:3", "absmean/row", "percentile:0"):
+        with pytest.raises(ValueError):
+            CalibrationSpec.parse(bad)
+
+
+def test_absmean_matches_reference() -> None:
+    values = np.random.default_rng(0).standard_normal((4, 32)).astype(np.float32)
+    tensor = calibrate(values, "absmean", shape=values.shape)
+    gamma = np.abs(values).mean(dtype=np.float64)
+    assert tensor.channel_size == values.size
+    assert tensor.thresholds == pytest.approx([gamma / 2])
+    assert tensor.scales.dtype == np.float16
+    assert float(tensor.scales[0]) == pytest.approx(gamma, rel=1e-3)
+
+    channel = calibrate(values, "absmean/channel", shape=values.shape)
+    assert channel.channel_size == 32
+    assert channel.thresholds == pytest.approx(np.abs(values).mean(axis=1) / 2)
+
+
+def test_percentile_scale_is_mean_above_threshold() -> None:
+    values = np.arange(1, 101, dtype=np.float32) * np.where(np.arange(100) % 2, 1, -1)
+    result = calibrate(values, "percentile:90")
+    assert result.thresholds == pytest.approx([np.percentile(np.abs(values), 90)])
+    assert float(result.scales[0]) == pytest.approx(np.abs(values)[90:].mean(), rel=1e-3)
+
+
+def test_blocked_reduction_matches_numpy_reference() -> None:
+    values = np.random.default_rng(1).standard_normal(2 * _CALIBRATION_BLOCK + 12)
+    magnitude = np.abs(values.astype(np.float32))
+    absmean = calibrate(values.astype(np.float32), "absmean")
+    assert absmean.thresholds == pytest.approx([magnitude.mean(dtype=np.float64) / 2])
+    percentile = calibrate(values.astype(np.float32), "percentile:80")
+    cut = np.percentile(magnitude, 80)
+    assert percentile.thresholds == pytest.approx([cut])
+    assert float(percentile.scales[0]) == pytest.approx(magnitude[magnitude > cut].mean(), rel=1e-3)
+
+
+def test_fixed_and_empty_tensors() -> None:
+    fixed = calibrate([0.5, -0.2], "fixed", threshold=0.3)
+    assert fixed.thresholds.tolist() == [0.3] and fixed.scales.size == 0
+    empty = calibrate(np.zeros((0, 4), dtype=np.float32), "absmean/channel", shape=(0, 4))
+    assert empty.thresholds.tolist() == [0.0] and empty.scales.tolist() == [0.0]
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import argparse
 import importlib.util
 import json
 import subprocess
@@ -7,6 +8,9 @@ import sys
 from pathlib import Path
 
 import numpy as np
+import pytest
+
+from t81_python.cli import _parse_size, _positive_int
 
 
 def _run_cli(*args: str) -> subprocess.CompletedProcess[str]:
@@ -44,10 +48,104 @@ def test_cli_export_hf_safetensors_and_inspect(tmp_path: Path) -> None:
         str(checkpoint),
     )
 
-    export = _run_cli("export-hf", str(checkpoint), str(out_dir), "--threshold", "0.05")
+    export = _run_cli(
+        "export-hf", str(checkpoint), str(out_dir), "--threshold", "0.05", "--max-memory", "1M"
+    )
     assert "Exported 1 tensors" in export.stdout
 
     inspect = _run_cli("inspect-artifact", str(out_dir))
     payload = json.loads(inspect.stdout)
     assert payload["total_tensors"] == 1
     assert payload["payload_ok"]["layer.weight"] is True
+
+
+def test_cli_export_container_and_inspect(tmp_path: Path) -> None:
+    input_json = tmp_path / "state.json"
+    out_dir = tmp_path / "out"
+    input_json.write_text(json.dumps({"w": [0.1, -0.2, 0.0, 0.06, 0.3]}), encoding="utf-8")
+
+    _run_cli("export-hf-json", str(input_json), str(out_dir), "--format-version", "0.2")
+
+    inspect = _run_cli("inspect-artifact", str(out_dir / "artifact.t81"))
+    payload = json.loads(inspect.stdout)
+    assert payload["format_version"] == "0.2"
+    assert payload["payload_ok"]["w"] is True
+
+
+def test_cli_export_incremental_records_content_hashes(tmp_path: Path) -> None:
+    input_json = tmp_path / "state.json"
+    out_dir = tmp_path / "out"
+    input_json.write_text(json.dumps({"w": [0.1, -0.2, 0.0, 0.06]}), encoding="utf-8")
+
+    for _ in range(2):
+        _run_cli("export-hf-json", str(input_json), str(out_dir), "--incremental")
+    manifest = json.loads((out_dir / "manifest.json").read_text(encoding="utf-8"))
+    assert manifest["tensors"][0]["content_hash"].startswith("sha256:")
+    assert not (out_dir / ".t81-export.journal").exists()
+
+
+def test_cli_export_profile_writes_chrome_trace(tmp_path: Path) -> None:
+    input_json = tmp_path / "state.json"
+    input_json.write_text(json.dumps({"w": [0.1, -0.2, 0.0, 0.06]}), encoding="utf-8")
+    trace = tmp_path / "trace.json"
+
+    export = _run_cli(
+        "export-hf-json", str(input_json), str(tmp_path / "out"), "--profile", str(trace)
+    )
+    assert "chrome profile" in export.stdout
+    events = json.loads(trace.read_text(encoding="utf-8"))["traceEvents"]
+    assert {"load", "to_numpy", "quantize_pack", "write"} <= {event["name"] for event in events}
+
+
+def test_cli_export_progress_json_lines_on_stderr(tmp_path: Path) -> None:
+    input_json = tmp_path / "state.json"
+    input_json.write_text(json.dumps({"a": [0.1, -0.2], "b": [0.0, 0.06]}), encoding="utf-8")
+
+    export = _run_cli(
+        "export-hf-json", str(input_json), str(tmp_path / "out"), "--progress", "json"
+    )
+    rows = [json.loads(line) for line in export.stderr.splitlines()]
+    assert rows[-1]["tensor"] == "b"
+    assert rows[-1]["tensors_done"] == rows[-1]["tensors_total"] == 2
+    assert "Exported 2 tensors" in export.stdout
+
+
+def test_cli_info_and_help_do_not_import_numpy() -> None:
+    assert _run_cli("info").stdout.startswith("t81-python:")
+    assert "export-hf" in _run_cli("--help").stdout
+    probe = (
+        "import sys\n"
+        "sys.argv = ['t81-python', '--help']\n"
+        "import t81_python.cli\n"
+        "try:\n"
+        "    t81_python.cli.main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print(sorted(name for name in ('numpy', 'asyncio') if name in sys.modules))\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe], check=True, text=True, capture_output=True
+    )
+    assert result.stdout.strip().splitlines()[-1] == "[]"
+
+
+def test_parse_size_rejects_non_finite_and_non_positive_sizes() -> None:
+    assert _parse_size("512M") == 512 << 20
+    assert _parse_size("1.5k") == 1536
+    for text in ("inf", "-inf", "nan", "infG", "0", "-1M", "lots"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            _parse_size(text)
+
+
+def test_jobs_must_be_a_positive_integer(tmp_path: Path) -> None:
+    assert _positive_int("4") == 4
+    for text in ("0", "-1", "two"):
+        with pytest.raises(argparse.ArgumentTypeError):
+            _positive_int(text)
+    result = subprocess.run(
+        [sys.executable, "-m", "t81_python.cli", "inspect-artifact", str(tmp_path), "--jobs", "0"],
+        text=True,
+        capture_output=True,
+    )
+    assert result.returncode == 2
+    assert "must be at least 1" in result.stderr and "Traceback" not in result.stderr
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from t81_python.pipelines import PAYLOAD_CODECS, decode_payload, encode_payload
+from t81_python.pipelines.codecs import CodecStream, choose_codec, encode_chunk, sparse_size
+from t81_python.quantization import PAYLOAD_ENCODINGS, pack_trits_array
+
+
+def _sparse_trits(count: int, nonzero: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    signs = rng.choice(np.array([-1, 1], dtype=np.int8), size=count)
+    return np.where(rng.random(count) < nonzero, signs, 0).astype(np.int8)
+
+
+def test_codec_roundtrip() -> None:
+    for count in (0, 1, 7, 8, 9, 1001):
+        trits = _sparse_trits(count, 0.3, seed=count)
+        for encoding in PAYLOAD_ENCODINGS:
+            packed = pack_trits_array(trits, encoding)
+            for codec in PAYLOAD_CODECS:
+                stored = encode_payload(packed, count, codec, encoding)
+                assert np.array_equal(decode_payload(stored, count, codec, encoding), packed)
+
+
+def test_sparse_layout_and_size() -> None:
+    trits = np.array([0, 1, 0, -1, 0, 0, 0, 0, 1], dtype=np.int8)
+    stored = encode_payload(pack_trits_array(trits), trits.size, "sparse")
+    # Bitmap 0b00001010 + 0b1, then signs (+1, -1, +1) = 0b101.
+    assert stored == bytes([0b00001010, 0b1, 0b101])
+    assert len(stored) == sparse_size(9, 3)
+
+
+def test_chunked_sparse_stream_matches_whole_payload() -> None:
+    trits = _sparse_trits(4000, 0.1, seed=5)
+    stream = CodecStream("sparse")
+    parts = []
+    for start in range(0, trits.size, 800):
+        chunk = trits[start : start + 800]
+        parts.append(stream.feed(encode_chunk(pack_trits_array(chunk), chunk.size, "sparse")))
+    joined = b"".join(part.tobytes() for part in parts) + stream.finish()
+    assert joined == encode_payload(pack_trits_array(trits), trits.size, "sparse")
+
+
+def test_compressed_streams_concatenate() -> None:
+    trits = _sparse_trits(800, 0.05, seed=2)
+    first, second = pack_trits_array(trits[:400]), pack_trits_array(trits[400:])
+    for codec in ("zlib", "lzma"):
+        stored = encode_payload(first, 400, codec) + encode_payload(second, 400, codec)
+        assert np.array_equal(decode_payload(stored, 800, codec), pack_trits_array(trits))
+
+
+def test_choose_codec_prefers_sparse_only_when_clearly_smaller() -> None:
+    assert choose_codec((5, 90, 5)) == "sparse"
+    assert choose_codec((45, 10, 45)) == "raw"
+    # base3 is denser, so sparse must beat 1/5 byte per trit instead of 1/4.
+    assert choose_codec((25, 50, 25)) == "sparse"
+    assert choose_codec((25, 50, 25), "base3") == "raw"
+
+
+def test_decode_rejects_malformed_payloads() -> None:
+    packed = pack_trits_array(_sparse_trits(64, 0.5))
+    sparse = encode_payload(packed, 64, "sparse")
+    with pytest.raises(ValueError, match="Sparse"):
+        decode_payload(sparse[:-1], 64, "sparse")
+    with pytest.raises(ValueError, match="Sparse"):
+        decode_payload(sparse[:3], 64, "sparse")
+    for codec in ("zlib", "lzma"):
+        with pytest.raises(ValueError):
+            decode_payload(encode_payload(packed, 64, codec)[:-3], 64, codec)
+    with pytest.raises(ValueError, match="codec"):
+        encode_payload(packed, 64, "rans")
@@ -0,0 +1,76 @@
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from t81_python.compute import ternary_matmul
+from t81_python.pipelines import ArtifactReader, export_state_dict_to_ternary
+from t81_python.quantization import pack_trits_array
+
+
+def _weights(shape: tuple[int, int], seed: int = 0) -> tuple[np.ndarray, np.ndarray]:
+    trits = np.random.default_rng(seed).integers(-1, 2, size=shape).astype(np.int8)
+    return pack_trits_array(trits.reshape(-1)), trits.astype(np.float32)
+
+
+def test_matmul_matches_dense_for_vectors_and_batches() -> None:
+    rng = np.random.default_rng(1)
+    # Odd column counts put row starts in the middle of packed bytes.
+    for shape in ((1, 4), (7, 9), (300, 257), (3, 1)):
+        packed, dense = _weights(shape)
+        x = rng.standard_normal(shape[1]).astype(np.float32)
+        batch = rng.standard_normal((shape[1], 5)).astype(np.float32)
+        assert np.allclose(ternary_matmul(packed, shape, x), dense @ x, atol=1e-4)
+        for workers in (1, 3):
+            result = ternary_matmul(packed.tobytes(), shape, batch, workers=workers)
+            assert result.shape == (shape[0], 5)
+            assert np.allclose(result, dense @ batch, atol=1e-4)
+
+
+def test_matmul_applies_scales_and_writes_out() -> None:
+    packed, dense = _weights((6, 8))
+    x = np.arange(8, dtype=np.float32)
+    scales = np.linspace(0.5, 3.0, 6)
+    out = np.empty(6, dtype=np.float32)
+    assert ternary_matmul(packed, (6, 8), x, scales=scales, out=out) is out
+    assert np.allclose(out, (dense @ x) * scales, atol=1e-4)
+    assert np.allclose(ternary_matmul(packed, (6, 8), x, scales=2.0), 2 * (dense @ x))
+    with pytest.raises(ValueError, match="scales"):
+        ternary_matmul(packed, (6, 8), x, scales=[1.0, 2.0])
+
+
+def test_matmul_rejects_mismatched_inputs() -> None:
+    packed, _ = _weights((4, 4))
+    with pytest.raises(ValueError, match="payload"):
+        ternary_matmul(packed[:-1], (4, 4), np.ones(4))
+    with pytest.raises(ValueError, match="x must"):
+        ternary_matmul(packed, (4, 4), np.ones(5))
+    with pytest.raises(ValueError, match="2 dimensions"):
+        ternary_matmul(packed, (16,), np.ones(16))
+    with pytest.raises(ValueError, match="out must"):
+        ternary_matmul(packed, (4, 4), np.ones(4), out=np.empty(4, dtype=np.float64))
+
+
+def test_invalid_symbols_decode_to_nan() -> None:
+    result = ternary_matmul(b"\xff", (1, 4), np.ones(4, dtype=np.float32))
+    assert np.isnan(result).all()
+
+
+def test_artifact_tensor_matmul_uses_stored_scales(tmp_path: Path) -> None:
+    weight = np.random.default_rng(2).standard_normal((12, 20)).astype(np.float32)
+    export_state_dict_to_ternary({"w": weight}, tmp_path, calibration="absmean/channel")
+    x = np.random.default_rng(3).standard_normal(20).astype(np.float32)
+    with ArtifactReader(tmp_path) as reader:
+        tensor = reader["w"]
+        assert np.allclose(tensor.matmul(x), tensor.to_numpy() @ x, atol=1e-4)
+        trits = tensor.to_numpy(scale=1.0)
+        assert np.allclose(tensor.matmul(x, scale=1.0), trits @ x, atol=1e-4)
+        del tensor
+
+
+def test_matmul_decodes_base3_payloads() -> None:
+    trits = np.random.default_rng(4).integers(-1, 2, size=(9, 13)).astype(np.int8)
+    packed = pack_trits_array(trits.reshape(-1), "base3")
+    x = np.linspace(-1.0, 1.0, 13, dtype=np.float32)
+    result = ternary_matmul(packed, (9, 13), x, encoding="base3", workers=2)
+    assert np.allclose(result, trits.astype(np.float32) @ x, atol=1e-4)
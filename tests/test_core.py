@@ -0,0 +1,53 @@
+import pickle
+
+import numpy as np
+import pytest
+
+from t81_python.core import Trit, TritVector
+
+
+def test_trit_vector_from_ints_roundtrip() -> None:
+    vector = TritVector.from_ints([-1, 0, 1, Trit.POS])
+    assert len(vector) == 4
+    assert vector.to_ints() == [-1, 0, 1, 1]
+    assert list(vector) == [Trit.NEG, Trit.ZERO, Trit.POS, Trit.POS]
+    assert vector.values == (Trit.NEG, Trit.ZERO, Trit.POS, Trit.POS)
+
+
+def test_trit_vector_is_compact_and_read_only() -> None:
+    vector = TritVector.from_ints(np.asarray([1, -1, 0], dtype=np.int64))
+    arr = vector.as_numpy()
+    assert arr.dtype == np.int8
+    assert arr.nbytes == len(vector)
+    assert vector.as_numpy() is arr
+    with pytest.raises(ValueError):
+        arr[0] = 0
+    with pytest.raises(AttributeError):
+        vector._data = arr
+
+
+def test_trit_vector_from_numpy_is_zero_copy() -> None:
+    source = np.asarray([1, 0, -1, 1], dtype=np.int8)
+    vector = TritVector.from_numpy(source)
+    assert np.shares_memory(vector.as_numpy(), source)
+
+
+def test_trit_vector_equality_hash_and_pickle() -> None:
+    a = TritVector.from_ints([1, 0, -1])
+    b = TritVector.from_numpy(np.asarray([1, 0, -1], dtype=np.int8))
+    assert a == b
+    assert hash(a) == hash(b)
+    assert a != TritVector.from_ints([1, 0, 0])
+    assert pickle.loads(pickle.dumps(a)) == a
+
+
+def test_trit_vector_packed_roundtrip() -> None:
+    vector = TritVector.from_ints([-1, 0, 1, -1, 1])
+    assert TritVector.from_packed(vector.packed(), len(vector)) == vector
+
+
+def test_trit_vector_rejects_invalid_values() -> None:
+    with pytest.raises(ValueError):
+        TritVector.from_ints([0, 2])
+    with pytest.raises(ValueError):
+        TritVector.from_ints(np.asarray([300], dtype=np.int64))
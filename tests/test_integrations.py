@@ -1,6 +1,41 @@
+from __future__ import annotations
+
+import importlib.util
+from collections.abc import Iterator
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
 from t81_python.integrations import hf_available, llama_cpp_available
-from t81_python.integrations.huggingface import quantize_state_dict
+from t81_python.integrations.huggingface import (
+    export_model,
+    iter_model_tensors,
+    quantize_model,
+    quantize_state_dict,
+)
 from t81_python.integrations.llama_cpp import build_model_kwargs
+from t81_python.pipelines import ArtifactReader, ExportProgress
+from t81_python.quantization import quantize_array_to_trits, unpack_trits_array
+
+
+class _Model:
+    """Stand-in for a `transformers` model: only `named_parameters()` is used."""
+
+    def __init__(self) -> None:
+        rng = np.random.default_rng(3)
+        self.params = {
+            "embed.weight": rng.standard_normal((16, 8)).astype(np.float32) * 0.1,
+            "layers.0.mlp.weight": rng.standard_normal((8, 8)).astype(np.float16) * 0.1,
+            "layers.0.norm.weight": np.ones(8, dtype=np.float32),
+            "lm_head.weight": rng.standard_normal((16, 8)).astype(np.float32) * 0.1,
+        }
+        self.visited: list[str] = []
+
+    def named_parameters(self) -> Iterator[tuple[str, Any]]:
+        for name, value in self.params.items():
+            self.visited.append(name)
+            yield name, value
 
 
 def test_integration_availability_checks_return_bool() -> None:
@@ -14,6 +49,61 @@ def test_hf_quantize_state_dict_basic() -> None:
     assert out["weight"] == [1, -1, 0]
 
 
+def test_iter_model_tensors_filters_by_parameter_and_module_name() -> None:
+    model = _Model()
+    names = [name for name, _ in iter_model_tensors(model, exclude=("*norm*", "lm_head"))]
+    assert names == ["embed.weight", "layers.0.mlp.weight"]
+    names = [name for name, _ in iter_model_tensors(model, include=("layers.*",))]
+    assert names == ["layers.0.mlp.weight", "layers.0.norm.weight"]
+
+
+def test_quantize_model_int8_and_packed() -> None:
+    model = _Model()
+    trits = quantize_model(model, exclude=("*norm*",))
+    packed = quantize_model(model, exclude=("*norm*",), packed=True, encoding="base3")
+    assert list(trits) == ["embed.weight", "layers.0.mlp.weight", "lm_head.weight"]
+    for name, values in trits.items():
+        expected = quantize_array_to_trits(model.params[name])
+        assert values.dtype == np.int8
+        assert np.array_equal(values, expected)
+        assert np.array_equal(unpack_trits_array(packed[name], values.size, "base3"), expected)
+
+
+def test_export_model_streams_selected_parameters(tmp_path: Path) -> None:
+    model = _Model()
+    events: list[ExportProgress] = []
+    manifest = export_model(
+        model, tmp_path, exclude=("*norm*",), format_version="0.2", progress=events.append
+    )
+    assert manifest.source == "_Model"
+    assert [tensor.name for tensor in manifest.tensors] == [
+        "embed.weight",
+        "layers.0.mlp.weight",
+        "lm_head.weight",
+    ]
+    assert events[-1].tensors_total == 3 and events[-1].values_total == 16 * 8 * 2 + 64
+    with ArtifactReader(tmp_path) as reader:
+        for name in reader:
+            expected = quantize_array_to_trits(model.params[name])
+            assert np.array_equal(reader[name].trits(), expected)
+            assert reader[name].shape == model.params[name].shape
+
+
+def test_export_model_from_torch_module(tmp_path: Path) -> None:
+    if importlib.util.find_spec("torch") is None:
+        return
+    import torch
+
+    torch.manual_seed(0)
+    model = torch.nn.Sequential(torch.nn.Linear(32, 16), torch.nn.LayerNorm(16))
+    model.to(torch.bfloat16)
+    manifest = export_model(model, tmp_path, include=("0",), threshold=0.02)
+    assert [tensor.name for tensor in manifest.tensors] == ["0.weight", "0.bias"]
+    with ArtifactReader(tmp_path) as reader:
+        weight = model[0].weight.detach()
+        assert np.array_equal(reader["0.weight"].trits(), quantize_array_to_trits(weight, 0.02))
+
+
 def test_build_model_kwargs() -> None:
     kwargs = build_model_kwargs(model_path="model.gguf", n_ctx=8192, n_threads=8)
     assert kwargs["model_path"] == "model.gguf"
@@ -0,0 +1,40 @@
+from __future__ import annotations
+
+import subprocess
+import sys
+
+import t81_python
+import t81_python.integrations
+import t81_python.pipelines
+from t81_python.core import TritVector
+from t81_python.pipelines.hf_export import inspect_artifact
+
+
+def test_package_surface_resolves_lazily() -> None:
+    for module in (t81_python, t81_python.pipelines, t81_python.integrations):
+        for name in module.__all__:
+            assert getattr(module, name) is not None, name
+            assert name in dir(module)
+    assert t81_python.TritVector is TritVector
+    assert t81_python.pipelines.inspect_artifact is inspect_artifact
+
+
+def test_unknown_attribute_raises_attribute_error() -> None:
+    for module in (t81_python, t81_python.pipelines, t81_python.integrations):
+        try:
+            module.missing_name
+        except AttributeError as exc:
+            assert "missing_name" in str(exc)
+        else:
+            raise AssertionError(f"{module.__name__}.missing_name resolved")
+
+
+def test_import_does_not_load_numpy() -> None:
+    probe = (
+        "import sys, t81_python, t81_python.pipelines, t81_python.integrations\n"
+        "print('numpy' in sys.modules)\n"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", probe], check=True, text=True, capture_output=True
+    )
+    assert result.stdout.strip() == "False"
@@ -1,16 +1,29 @@
 import importlib.util
 import json
+from collections.abc import Iterator
 from pathlib import Path
+from types import GeneratorType
+from typing import Any
 
 import numpy as np
+import pytest
 
 from t81_python.pipelines import (
+    FORMAT_VERSIONS,
+    ArtifactReader,
     export_checkpoint_to_ternary,
     export_state_dict_to_ternary,
+    export_tensors_to_ternary,
+    hf_export,
     inspect_artifact,
+    iter_checkpoint_tensors,
     load_checkpoint_state_dict,
     load_json_state_dict,
+    read_manifest,
 )
+from t81_python.pipelines.container import CONTAINER_FILE, PAYLOAD_ALIGNMENT, is_container
+from t81_python.pipelines.hf_export import EXPORT_JOURNAL, _content_hash, _iter_safetensors_mmap
+from t81_python.quantization import pack_trits_array, quantize_array_to_trits
 
 
 def test_export_state_dict_to_ternary(tmp_path: Path) -> None:
@@ -111,3 +124,462 @@ def test_export_checkpoint_to_ternary_pt(tmp_path: Path) -> None:
     manifest = export_checkpoint_to_ternary(checkpoint, out_dir, threshold=0.05)
     assert len(manifest.tensors) == 1
     assert manifest.tensors[0].name == "w"
+
+
+def test_export_torch_half_precision_tensors(tmp_path: Path) -> None:
+    if importlib.util.find_spec("torch") is None:
+        return
+    import torch
+
+    state_dict = {
+        "half": torch.tensor([0.2, -0.3, 0.0, 0.04], dtype=torch.float16),
+        "bf16": torch.tensor([0.2, -0.3, 0.0, 0.04], dtype=torch.bfloat16),
+    }
+    manifest = export_state_dict_to_ternary(state_dict, tmp_path, threshold=0.05)
+    for tensor in manifest.tensors:
+        assert tensor.counts == {"-1": 1, "0": 2, "+1": 1}
+    assert all(inspect_artifact(tmp_path).per_tensor_payload_ok.values())
+
+
+def test_export_with_max_memory_matches_unchunked_payloads(tmp_path: Path) -> None:
+    rng = np.random.default_rng(3)
+    state_dict = {"w": (rng.standard_normal((37, 11)) * 0.1).astype(np.float32)}
+
+    full = export_state_dict_to_ternary(state_dict, tmp_path / "full", threshold=0.05)
+    chunked = export_state_dict_to_ternary(
+        state_dict, tmp_path / "chunked", threshold=0.05, max_memory=64
+    )
+
+    assert chunked.tensors[0].counts == full.tensors[0].counts
+    payload = full.tensors[0].payload_file
+    assert (tmp_path / "chunked" / payload).read_bytes() == (
+        tmp_path / "full" / payload
+    ).read_bytes()
+
+
+def test_export_tensors_consumes_iterator_lazily(tmp_path: Path) -> None:
+    pulled: list[str] = []
+
+    def tensors() -> Iterator[tuple[str, list[float]]]:
+        for name in ("a", "b"):
+            pulled.append(name)
+            yield name, [0.1, -0.2, 0.0]
+
+    manifest = export_tensors_to_ternary(tensors(), tmp_path, threshold=0.05)
+    assert pulled == ["a", "b"]
+    assert [t.name for t in manifest.tensors] == ["a", "b"]
+
+
+def test_iter_safetensors_mmap_without_torch(tmp_path: Path) -> None:
+    if importlib.util.find_spec("safetensors") is None:
+        return
+    from safetensors.numpy import save_file
+
+    checkpoint = tmp_path / "weights.safetensors"
+    payload: dict[str, Any] = {
+        "a": np.asarray([[0.1, -0.2], [0.0, 0.06]], dtype=np.float32),
+        "b": np.asarray([0.01, -0.4], dtype=np.float16),
+    }
+    save_file(payload, str(checkpoint))
+
+    loaded = dict(_iter_safetensors_mmap(checkpoint))
+    assert set(loaded) == {"a", "b"}
+    for key, value in payload.items():
+        assert loaded[key].dtype == value.dtype
+        assert np.array_equal(loaded[key], value)
+
+    names = [name for name, _ in iter_checkpoint_tensors(checkpoint)]
+    assert sorted(names) == ["a", "b"]
+
+
+def test_iter_safetensors_mmap_closes_mapping_when_abandoned(tmp_path: Path) -> None:
+    data = np.asarray([0.1, -0.2, 0.3], dtype=np.float32).tobytes()
+    header = json.dumps(
+        {
+            "a": {"dtype": "F32", "shape": [3], "data_offsets": [0, len(data)]},
+            "b": {"dtype": "F32", "shape": [3], "data_offsets": [0, len(data)]},
+        }
+    ).encode()
+    checkpoint = tmp_path / "weights.safetensors"
+    checkpoint.write_bytes(len(header).to_bytes(8, "little") + header + data)
+
+    tensors = _iter_safetensors_mmap(checkpoint)
+    assert isinstance(tensors, GeneratorType)
+    name, value = next(tensors)
+    assert name == "a" and np.allclose(value, [0.1, -0.2, 0.3])
+    assert tensors.gi_frame is not None
+    mapped = tensors.gi_frame.f_locals["mapped"]
+    tensors.close()
+    assert not mapped.closed  # `value` still views the mapping.
+    del value
+    tensors = _iter_safetensors_mmap(checkpoint)
+    assert isinstance(tensors, GeneratorType)
+    next(tensors)
+    assert tensors.gi_frame is not None
+    mapped = tensors.gi_frame.f_locals["mapped"]
+    tensors.close()
+    assert mapped.closed
+
+
+def test_parallel_export_matches_sequential(tmp_path: Path) -> None:
+    rng = np.random.default_rng(5)
+    state_dict = {
+        f"layer_{idx}.weight": (rng.standard_normal((16, 9)) * 0.1).astype(np.float32)
+        for idx in range(12)
+    }
+
+    sequential = export_state_dict_to_ternary(state_dict, tmp_path / "seq", threshold=0.05)
+    parallel = export_state_dict_to_ternary(
+        state_dict, tmp_path / "par", threshold=0.05, workers=4, max_memory=256
+    )
+
+    assert [t.name for t in parallel.tensors] == list(state_dict)
+    assert [t.counts for t in parallel.tensors] == [t.counts for t in sequential.tensors]
+    for tensor in sequential.tensors:
+        assert (tmp_path / "par" / tensor.payload_file).read_bytes() == (
+            tmp_path / "seq" / tensor.payload_file
+        ).read_bytes()
+
+
+def test_export_rejects_non_positive_workers(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="workers"):
+        export_state_dict_to_ternary({"w": [0.1]}, tmp_path, workers=0)
+
+
+def test_chunked_parallel_export_joins_payloads_byte_for_byte(tmp_path: Path) -> None:
+    rng = np.random.default_rng(9)
+    state_dict = {
+        "embed.weight": (rng.standard_normal((41, 13)) * 0.1).astype(np.float32),
+        "empty": np.zeros((0,), dtype=np.float32),
+        "bias": np.asarray([0.2, -0.3, 0.01], dtype=np.float32),
+    }
+
+    whole = export_state_dict_to_ternary(state_dict, tmp_path / "whole", threshold=0.05)
+    chunked = export_state_dict_to_ternary(
+        state_dict, tmp_path / "chunked", threshold=0.05, workers=3, chunk_values=8
+    )
+
+    assert [t.name for t in chunked.tensors] == list(state_dict)
+    assert [t.counts for t in chunked.tensors] == [t.counts for t in whole.tensors]
+    for tensor in whole.tensors:
+        assert (tmp_path / "chunked" / tensor.payload_file).read_bytes() == (
+            tmp_path / "whole" / tensor.payload_file
+        ).read_bytes()
+    assert all(inspect_artifact(tmp_path / "chunked").per_tensor_payload_ok.values())
+
+
+def test_export_rejects_unaligned_chunks(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="multiple of 4"):
+        export_state_dict_to_ternary({"w": [0.1]}, tmp_path, chunk_values=6)
+
+
+def test_export_single_file_container(tmp_path: Path) -> None:
+    rng = np.random.default_rng(13)
+    state_dict = {
+        "layer.weight": (rng.standard_normal((5, 7)) * 0.1).astype(np.float32),
+        "empty": np.zeros((0,), dtype=np.float32),
+        "layer.bias": np.asarray([0.2, -0.3, 0.01], dtype=np.float32),
+    }
+
+    legacy = export_state_dict_to_ternary(state_dict, tmp_path / "v01", threshold=0.05)
+    manifest = export_state_dict_to_ternary(
+        state_dict, tmp_path / "v02", threshold=0.05, format_version="0.2", chunk_values=8
+    )
+
+    container = tmp_path / "v02" / CONTAINER_FILE
+    assert sorted(p.name for p in (tmp_path / "v02").iterdir()) == [CONTAINER_FILE]
+    assert is_container(container)
+    assert manifest.format_version == "0.2"
+
+    data = container.read_bytes()
+    for new, old in zip(manifest.tensors, legacy.tensors):
+        assert new.payload_offset is not None and new.payload_length is not None
+        assert new.payload_offset % PAYLOAD_ALIGNMENT == 0
+        payload = data[new.payload_offset : new.payload_offset + new.payload_length]
+        assert payload == (tmp_path / "v01" / old.payload_file).read_bytes()
+
+    for path in (tmp_path / "v02", container):
+        loaded = read_manifest(path)
+        assert loaded.format_version == "0.2"
+        assert [t.name for t in loaded.tensors] == list(state_dict)
+        summary = inspect_artifact(path)
+        assert all(summary.per_tensor_payload_ok.values())
+
+    legacy_payload = json.loads((tmp_path / "v01" / "manifest.json").read_text(encoding="utf-8"))
+    assert "payload_offset" not in legacy_payload["tensors"][0]
+    assert read_manifest(tmp_path / "v01").format_version == "0.1"
+
+
+def test_reexport_in_other_format_replaces_previous_artifact(tmp_path: Path) -> None:
+    export_state_dict_to_ternary(
+        {"old": [0.1, -0.2]}, tmp_path, calibration="absmean", format_version="0.1"
+    )
+    assert sorted(p.name for p in tmp_path.iterdir()) == [
+        "manifest.json",
+        "old.t81bin",
+        "old.t81scale",
+    ]
+
+    export_state_dict_to_ternary({"new": [0.3, 0.0]}, tmp_path, format_version="0.2")
+    assert sorted(p.name for p in tmp_path.iterdir()) == [CONTAINER_FILE]
+    manifest = read_manifest(tmp_path)
+    assert (manifest.format_version, [t.name for t in manifest.tensors]) == ("0.2", ["new"])
+    with ArtifactReader(tmp_path) as reader:
+        assert reader.names() == ["new"]
+
+    export_state_dict_to_ternary({"newer": [0.3]}, tmp_path, format_version="0.1")
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["manifest.json", "newer.t81bin"]
+    assert [t.name for t in inspect_artifact(tmp_path).manifest.tensors] == ["newer"]
+
+    (tmp_path / CONTAINER_FILE).write_bytes(b"stale")
+    with pytest.raises(ValueError, match="both"):
+        read_manifest(tmp_path)
+
+
+def test_export_rejects_unknown_format_version(tmp_path: Path) -> None:
+    with pytest.raises(ValueError, match="format_version"):
+        export_state_dict_to_ternary({"w": [0.1]}, tmp_path, format_version="9.9")
+
+
+def test_inspect_artifact_flags_corrupt_payloads(tmp_path: Path) -> None:
+    state_dict = {
+        "a": [0.5, -0.1, 0.0, 0.06, 0.2],
+        "b": [0.5, -0.1, 0.0, 0.06],
+        "c": [0.5, -0.1, 0.0, 0.06],
+        "d": [0.5, -0.1, 0.0, 0.06],
+    }
+    manifest = export_state_dict_to_ternary(state_dict, tmp_path, threshold=0.05)
+    files = {t.name: tmp_path / t.payload_file for t in manifest.tensors}
+    files["b"].write_bytes(files["b"].read_bytes()[:-1])  # truncated
+    files["c"].write_bytes(b"\xff")  # invalid symbol 3
+    files["d"].write_bytes(bytes([files["d"].read_bytes()[0] ^ 0b01]))  # flipped symbol
+
+    for workers in (1, 3):
+        summary = inspect_artifact(tmp_path, workers=workers)
+        assert summary.per_tensor_payload_ok == {"a": True, "b": False, "c": False, "d": False}
+        assert summary.total_trits == 17
+
+
+def _count_encoded_chunks(monkeypatch: pytest.MonkeyPatch) -> list[str]:
+    encoded: list[str] = []
+    original = hf_export._encode_chunk
+
+    def counting(flat: Any, start: int, stop: int, *args: Any) -> Any:
+        encoded.append(f"{start}:{stop}")
+        return original(flat, start, stop, *args)
+
+    monkeypatch.setattr(hf_export, "_encode_chunk", counting)
+    return encoded
+
+
+def test_content_hash_ignores_chunking_but_tracks_dtype_and_shape() -> None:
+    values = np.linspace(-1.0, 1.0, 4096, dtype=np.float32)
+    assert _content_hash(values) == _content_hash(values.copy())
+    assert _content_hash(values) != _content_hash(values.reshape(64, 64))
+    assert _content_hash(values) != _content_hash(values.astype(np.float64))
+
+
+def test_incremental_export_reuses_unchanged_tensors(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    encoded = _count_encoded_chunks(monkeypatch)
+    rng = np.random.default_rng(3)
+    state = {f"l{i}.w": rng.standard_normal((8, 9)).astype(np.float32) for i in range(4)}
+    for format_version in FORMAT_VERSIONS:
+        out_dir = tmp_path / format_version
+        export_state_dict_to_ternary(
+            state, out_dir, format_version=format_version, incremental=True
+        )
+        assert len(encoded) == 4
+        assert all(t.content_hash for t in read_manifest(out_dir).tensors)
+
+        changed = dict(state, **{"l2.w": state["l2.w"] * 2})
+        encoded.clear()
+        manifest = export_state_dict_to_ternary(
+            changed, out_dir, format_version=format_version, incremental=True
+        )
+        assert len(encoded) == 1
+        assert [t.name for t in manifest.tensors] == list(state)
+        assert all(inspect_artifact(out_dir).per_tensor_payload_ok.values())
+
+        encoded.clear()
+        export_state_dict_to_ternary(
+            changed, out_dir, threshold=0.1, format_version=format_version, incremental=True
+        )
+        assert len(encoded) == 4
+        encoded.clear()
+
+
+def test_incremental_export_reuses_calibrated_scales(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    encoded = _count_encoded_chunks(monkeypatch)
+    rng = np.random.default_rng(5)
+    state = {f"l{i}.w": rng.standard_normal((3, 5)).astype(np.float32) for i in range(3)}
+    for format_version in FORMAT_VERSIONS:
+        out_dir = tmp_path / format_version
+        options: dict[str, Any] = {"format_version": format_version, "incremental": True}
+        first = export_state_dict_to_ternary(
+            state, out_dir, calibration="absmean/channel", **options
+        )
+        encoded.clear()
+        # The export threshold is unused by calibrated tensors, so they stay reusable.
+        again = export_state_dict_to_ternary(
+            state, out_dir, threshold=0.3, calibration="absmean/channel", **options
+        )
+        assert encoded == []
+        with ArtifactReader(out_dir) as reader:
+            for before, after in zip(first.tensors, again.tensors):
+                scales = reader[after.name].scales()
+                assert scales is not None and scales.size == before.scale_count == 3
+        assert all(inspect_artifact(out_dir).per_tensor_payload_ok.values())
+
+        export_state_dict_to_ternary(state, out_dir, calibration="absmean", **options)
+        assert len(encoded) == 3
+        encoded.clear()
+
+
+def test_incremental_export_resumes_after_interruption(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    encoded = _count_encoded_chunks(monkeypatch)
+    rng = np.random.default_rng(4)
+    state = {f"l{i}.w": rng.standard_normal(33).astype(np.float32) for i in range(5)}
+
+    def interrupted() -> Iterator[tuple[str, Any]]:
+        for index, item in enumerate(state.items()):
+            if index == 3:
+                raise KeyboardInterrupt
+            yield item
+
+    for format_version in FORMAT_VERSIONS:
+        out_dir = tmp_path / format_version
+        with pytest.raises(KeyboardInterrupt):
+            export_tensors_to_ternary(
+                interrupted(), out_dir, format_version=format_version, incremental=True
+            )
+        assert (out_dir / EXPORT_JOURNAL).exists()
+
+        encoded.clear()
+        export_tensors_to_ternary(
+            state.items(), out_dir, format_version=format_version, incremental=True
+        )
+        # The last tensor in flight at the interruption is redone, earlier ones are reused.
+        assert len(encoded) == 3
+        assert not (out_dir / EXPORT_JOURNAL).exists()
+        assert sorted(path.name for path in out_dir.iterdir() if "partial" in path.name) == []
+
+        reference = tmp_path / f"ref-{format_version}"
+        export_tensors_to_ternary(state.items(), reference, format_version=format_version)
+        with ArtifactReader(out_dir) as resumed, ArtifactReader(reference) as fresh:
+            for name in state:
+                assert bytes(resumed[name].packed()) == bytes(fresh[name].packed())
+        encoded.clear()
+
+
+def test_calibrated_export_records_scales_and_inspects(tmp_path: Path) -> None:
+    weight = np.random.default_rng(8).standard_normal((4, 6)).astype(np.float32)
+    manifest = export_state_dict_to_ternary(
+        {"w": weight}, tmp_path, calibration="percentile:75/channel", chunk_values=8
+    )
+    tensor = manifest.tensors[0]
+    assert tensor.calibration == "percentile:75/channel"
+    assert tensor.scale_file == "w.t81scale" and tensor.scale_count == 4
+    assert (tmp_path / "w.t81scale").stat().st_size == 8
+    cuts = np.percentile(np.abs(weight), 75, axis=1)
+    expected = np.concatenate(
+        [quantize_array_to_trits(row, cut) for row, cut in zip(weight, cuts)]
+    )
+    packed = (tmp_path / tensor.payload_file).read_bytes()
+    assert packed == pack_trits_array(expected).tobytes()
+    assert read_manifest(tmp_path / "manifest.json").tensors[0] == tensor
+    assert inspect_artifact(tmp_path).per_tensor_payload_ok == {"w": True}
+
+    (tmp_path / "w.t81scale").write_bytes(b"\0\0")
+    assert inspect_artifact(tmp_path).per_tensor_payload_ok == {"w": False}
+
+
+def test_reexport_removes_unreferenced_payload_and_scale_files(tmp_path: Path) -> None:
+    weight = np.random.default_rng(9).standard_normal((4, 6)).astype(np.float32)
+    for incremental in (False, True):
+        out_dir = tmp_path / str(incremental)
+        state = {"w": weight, "b": weight[0]}
+        export_state_dict_to_ternary(
+            state, out_dir, calibration="absmean/channel", incremental=incremental
+        )
+        assert (out_dir / "w.t81scale").exists() and (out_dir / "b.t81scale").exists()
+
+        export_state_dict_to_ternary({"w": weight}, out_dir, incremental=incremental)
+        assert sorted(p.name for p in out_dir.iterdir()) == ["manifest.json", "w.t81bin"]
+        assert inspect_artifact(out_dir).per_tensor_payload_ok == {"w": True}
+
+
+def test_base3_export_is_smaller_and_validates(tmp_path: Path) -> None:
+    rng = np.random.default_rng(12)
+    state = {"w": rng.standard_normal((13, 11)).astype(np.float32), "b": [0.3, -0.2, 0.0]}
+    for format_version in FORMAT_VERSIONS:
+        dense = export_state_dict_to_ternary(
+            state, tmp_path / f"2bit-{format_version}", format_version=format_version
+        )
+        out_dir = tmp_path / f"base3-{format_version}"
+        manifest = export_state_dict_to_ternary(
+            state, out_dir, format_version=format_version, encoding="base3", chunk_values=8
+        )
+        assert [t.encoding for t in read_manifest(out_dir).tensors] == ["base3", "base3"]
+        assert [t.counts for t in manifest.tensors] == [t.counts for t in dense.tensors]
+        assert all(inspect_artifact(out_dir).per_tensor_payload_ok.values())
+        with ArtifactReader(out_dir) as base3, ArtifactReader(
+            tmp_path / f"2bit-{format_version}"
+        ) as two_bit:
+            assert len(base3["w"].packed()) == 29 < len(two_bit["w"].packed())
+            assert np.array_equal(base3["w"].rows(3, 7), two_bit["w"].rows(3, 7))
+            assert np.array_equal(base3["w"].trits(5, 17), two_bit["w"].trits(5, 17))
+
+    payload = tmp_path / "base3-0.1" / "w.t81bin"
+    payload.write_bytes(b"\xff" + payload.read_bytes()[1:])
+    assert inspect_artifact(tmp_path / "base3-0.1").per_tensor_payload_ok["w"] is False
+    with pytest.raises(ValueError, match="encoding"):
+        export_state_dict_to_ternary(state, tmp_path / "bad", encoding="base4")
+
+
+def test_coded_exports_roundtrip_and_record_codec(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    rng = np.random.default_rng(21)
+    sparse = rng.standard_normal((16, 25)).astype(np.float32)
+    sparse[rng.random(sparse.shape) < 0.9] = 0.0
+    state = {"sparse": sparse, "dense": rng.standard_normal((9, 7)).astype(np.float32)}
+    dense_dir = tmp_path / "raw"
+    export_state_dict_to_ternary(state, dense_dir)
+    for format_version in FORMAT_VERSIONS:
+        for codec in ("sparse", "zlib", "lzma", "auto"):
+            out_dir = tmp_path / f"{codec}-{format_version}"
+            manifest = export_state_dict_to_ternary(
+                state, out_dir, format_version=format_version, codec=codec, chunk_values=12
+            )
+            expected = ["sparse", "raw"] if codec == "auto" else [codec, codec]
+            assert [t.codec for t in read_manifest(out_dir).tensors] == expected
+            assert all(t.payload_length is not None for t in manifest.tensors if t.codec != "raw")
+            assert all(inspect_artifact(out_dir).per_tensor_payload_ok.values())
+            with ArtifactReader(out_dir) as coded, ArtifactReader(dense_dir) as raw:
+                for name in state:
+                    assert bytes(coded[name].packed()) == bytes(raw[name].packed())
+                    assert np.array_equal(coded[name].rows(2, 5), raw[name].rows(2, 5))
+
+    sparse_dir = tmp_path / "sparse-0.1"
+    payload = sparse_dir / "sparse.t81bin"
+    assert payload.stat().st_size < (dense_dir / "sparse.t81bin").stat().st_size
+    encoded = _count_encoded_chunks(monkeypatch)
+    export_state_dict_to_ternary(state, sparse_dir, codec="sparse", incremental=True)
+    export_state_dict_to_ternary(state, sparse_dir, codec="sparse", incremental=True)
+    encoded.clear()
+    export_state_dict_to_ternary(state, sparse_dir, codec="auto", incremental=True)
+    assert encoded == []
+    export_state_dict_to_ternary(state, sparse_dir, codec="zlib", incremental=True)
+    assert len(encoded) == 2
+
+    export_state_dict_to_ternary(state, sparse_dir, codec="sparse")
+    payload.write_bytes(payload.read_bytes()[:-1])
+    assert inspect_artifact(sparse_dir).per_tensor_payload_ok["sparse"] is False
+    with pytest.raises(ValueError, match="codec"):
+        export_state_dict_to_ternary(state, tmp_path / "bad", codec="rans")
@@ -0,0 +1,65 @@
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from t81_python.pipelines import ExportProfiler, export_state_dict_to_ternary, read_manifest
+from t81_python.pipelines.profiling import EXPORT_STAGES
+
+
+def _state() -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(4)
+    return {f"l{i}.w": rng.standard_normal((16, 32)).astype(np.float32) for i in range(3)}
+
+
+def test_profiled_export_records_stages_bytes_and_memory(tmp_path: Path) -> None:
+    state = _state()
+    profiler = ExportProfiler(trace_memory=True)
+    export_state_dict_to_ternary(
+        state,
+        tmp_path,
+        workers=2,
+        chunk_values=128,
+        calibration="absmean",
+        incremental=True,
+        profiler=profiler,
+    )
+    stages = profiler.stage_totals()
+    assert set(stages) == {"load", "to_numpy", "hash", "calibrate", "quantize_pack", "write"}
+    assert set(stages) <= set(EXPORT_STAGES)
+    assert stages["quantize_pack"]["calls"] == 3 * 4
+    assert stages["quantize_pack"]["bytes_in"] == 3 * 16 * 32 * 4
+    assert stages["write"]["bytes_out"] == 3 * 16 * 32 // 4
+
+    tensors = profiler.tensor_totals()
+    assert list(tensors) == list(state)
+    for row in tensors.values():
+        assert row["peak_traced_bytes"] > 0
+        assert row["stages"]["quantize_pack"] > 0
+
+    reused = ExportProfiler()
+    export_state_dict_to_ternary(
+        state, tmp_path, calibration="absmean", incremental=True, profiler=reused
+    )
+    assert reused.stage_totals()["copy"]["calls"] == 3
+    assert "quantize_pack" not in reused.stage_totals()
+    assert [t.name for t in read_manifest(tmp_path).tensors] == list(state)
+
+
+def test_profiler_writes_chrome_trace_and_summary(tmp_path: Path) -> None:
+    profiler = ExportProfiler()
+    export_state_dict_to_ternary(_state(), tmp_path / "out", profiler=profiler)
+    profiler.write(tmp_path / "trace.json")
+    trace = json.loads((tmp_path / "trace.json").read_text(encoding="utf-8"))
+    spans = [event for event in trace["traceEvents"] if event["ph"] == "X"]
+    assert {event["name"] for event in spans} >= {"load", "quantize_pack", "write"}
+    assert all(event["dur"] >= 0 and event["ts"] >= 0 for event in spans)
+    assert sum(event["ph"] == "C" for event in trace["traceEvents"]) == 3
+
+    profiler.write(tmp_path / "summary.json", "json")
+    summary = json.loads((tmp_path / "summary.json").read_text(encoding="utf-8"))
+    assert summary["stages"]["write"]["calls"] == 3
+    assert len(summary["events"]) == len(profiler.events)
+    with pytest.raises(ValueError, match="format"):
+        profiler.write(tmp_path / "x", "pprof")
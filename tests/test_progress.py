@@ -0,0 +1,80 @@
+import io
+import json
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from t81_python.pipelines import (
+    ExportProgress,
+    ProgressReporter,
+    export_state_dict_to_ternary,
+    export_tensors_to_ternary,
+)
+from t81_python.pipelines.progress import ProgressTracker
+
+
+def _state() -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(9)
+    return {f"l{i}.w": rng.standard_normal((8, 16 * (i + 1))).astype(np.float32) for i in range(4)}
+
+
+def test_export_reports_each_tensor_in_order(tmp_path: Path) -> None:
+    state = _state()
+    events: list[ExportProgress] = []
+    export_state_dict_to_ternary(
+        state, tmp_path, workers=2, chunk_values=64, progress=events.append
+    )
+    assert [event.tensor for event in events] == list(state)
+    assert [event.tensors_done for event in events] == [1, 2, 3, 4]
+    last = events[-1]
+    assert last.tensors_total == 4
+    assert last.values_done == last.values_total == sum(v.size for v in state.values())
+    assert last.bytes_in == sum(v.nbytes for v in state.values())
+    assert last.bytes_out == sum(-(-v.size // 4) for v in state.values())
+    assert last.fraction == 1.0
+    assert last.eta_seconds == 0.0
+    assert all(event.values_per_second > 0 for event in events)
+
+
+def test_lazy_sources_report_without_totals(tmp_path: Path) -> None:
+    state = _state()
+    events: list[ExportProgress] = []
+    export_tensors_to_ternary(iter(state.items()), tmp_path, progress=events.append)
+    assert events[-1].tensors_total is None
+    assert events[-1].fraction is None
+    assert events[-1].eta_seconds is None
+
+    events.clear()
+    export_tensors_to_ternary(
+        iter(state.items()), tmp_path, progress=events.append, total_tensors=8
+    )
+    assert events[-1].fraction == 0.5
+    assert events[-1].eta_seconds is not None
+
+
+def test_json_reporter_rate_limits_and_flushes_last_event() -> None:
+    tracker = ProgressTracker(tensors_total=3, values_total=30)
+    stream = io.StringIO()
+    reporter = ProgressReporter("json", stream, min_interval=3600)
+    for name in ("a", "b", "c"):
+        reporter(tracker.completed(name, 10, 40, 3))
+    reporter.close()
+    rows = [json.loads(line) for line in stream.getvalue().splitlines()]
+    assert [row["tensor"] for row in rows] == ["a", "c"]
+    assert rows[-1]["fraction"] == 1.0
+    assert rows[-1]["bytes_in"] == 120
+
+
+def test_bar_reporter_rewrites_one_line() -> None:
+    tracker = ProgressTracker(tensors_total=2)
+    stream = io.StringIO()
+    reporter = ProgressReporter("bar", stream, min_interval=0)
+    reporter(tracker.completed("a", 5, 20, 2))
+    reporter(tracker.completed("b", 5, 20, 2))
+    reporter.close()
+    output = stream.getvalue()
+    assert output.count("\r") == 2 and output.endswith("\n")
+    assert "2/2 tensors" in output and "100.0%" in output
+    with pytest.raises(ValueError, match="progress mode"):
+        ProgressReporter("tqdm")
@@ -1,10 +1,17 @@
 import numpy as np
+import pytest
 
 from t81_python.quantization import (
+    count_packed_trits,
     dequantize_trits,
     pack_trits,
+    pack_trits_array,
+    packed_size,
+    quantize_array_to_trits,
     quantize_float_to_trits,
+    quantize_pack_trits,
     unpack_trits,
+    unpack_trits_array,
 )
 
 
@@ -23,3 +30,170 @@ def test_pack_unpack_roundtrip() -> None:
 def test_dequantize_scale() -> None:
     arr = dequantize_trits([-1, 0, 1], scale=0.5)
     assert np.allclose(arr, np.array([-0.5, 0.0, 0.5], dtype=np.float32))
+
+
+def test_pack_trits_array_matches_reference_layout() -> None:
+    values = np.asarray([-1, 0, 1, -1, 1, 0, 0], dtype=np.int8)
+    packed = pack_trits_array(values)
+    assert packed.dtype == np.uint8
+    # symbols 0,1,2,0 -> 0b00_10_01_00, then 2,1,1 + zero padding -> 0b00_01_01_10
+    assert packed.tobytes() == bytes([0b00100100, 0b00010110])
+    assert pack_trits(values.tolist()) == packed.tobytes()
+
+
+def test_pack_unpack_array_roundtrip_all_lengths() -> None:
+    rng = np.random.default_rng(0)
+    for count in range(0, 13):
+        values = rng.integers(-1, 2, size=count).astype(np.int8)
+        decoded = unpack_trits_array(pack_trits_array(values), count)
+        assert decoded.dtype == np.int8
+        assert np.array_equal(decoded, values)
+
+
+def test_unpack_trits_array_rejects_invalid_payloads() -> None:
+    with pytest.raises(ValueError, match="invalid symbol"):
+        unpack_trits_array(b"\xff", 4)
+    with pytest.raises(ValueError, match="Expected 5 trits"):
+        unpack_trits_array(b"\x00", 5)
+
+
+def test_pack_trits_array_rejects_non_trits() -> None:
+    with pytest.raises(ValueError):
+        pack_trits_array(np.asarray([0, 2], dtype=np.int8))
+
+
+def test_pack_trits_rejects_non_trits_from_any_input() -> None:
+    for values in ([0, 2], [1, 256], np.asarray([0, -2])):
+        with pytest.raises(ValueError, match="may only contain"):
+            pack_trits(values)
+
+
+def test_quantize_array_matches_float64_reference_across_dtypes() -> None:
+    rng = np.random.default_rng(1)
+    for dtype in (np.float16, np.float32, np.float64):
+        values = (rng.standard_normal(4096) * 0.1).astype(dtype)
+        # values straddling the threshold exercise the in-dtype rounding
+        values[0] = dtype(0.05)
+        values[1] = np.nextafter(dtype(0.05), dtype(1))
+        values[2] = -dtype(0.05)
+        wide = values.astype(np.float64)
+        expected = np.where(wide > 0.05, 1, np.where(wide < -0.05, -1, 0))
+        assert np.array_equal(quantize_array_to_trits(values, 0.05), expected)
+
+
+def test_quantize_array_accepts_memoryview_and_writes_out() -> None:
+    values = np.asarray([[0.2, -0.3], [0.0, 0.04]], dtype=np.float32)
+    out = np.full((2, 2), 7, dtype=np.int8)
+    result = quantize_array_to_trits(values.data, 0.05, out=out)
+    assert result is out
+    assert out.tolist() == [[1, -1], [0, 0]]
+
+
+def test_quantize_array_rejects_bad_out_and_threshold() -> None:
+    with pytest.raises(ValueError):
+        quantize_array_to_trits([0.1, 0.2], out=np.empty(3, dtype=np.int8))
+    with pytest.raises(ValueError):
+        quantize_array_to_trits([0.1, 0.2], out=np.empty(2, dtype=np.int16))
+    with pytest.raises(ValueError):
+        quantize_array_to_trits([0.1], threshold=-0.1)
+
+
+def test_quantize_float_to_trits_accepts_generators() -> None:
+    trits = quantize_float_to_trits(v for v in (0.1, -0.2, 0.0))
+    assert trits.to_ints() == [1, -1, 0]
+
+
+def test_count_packed_trits_matches_decoded_counts() -> None:
+    rng = np.random.default_rng(2)
+    for count in range(0, 21):
+        values = rng.integers(-1, 2, size=count).astype(np.int8)
+        counts = count_packed_trits(pack_trits_array(values), count)
+        assert counts == (
+            int(np.count_nonzero(values == -1)),
+            int(np.count_nonzero(values == 0)),
+            int(np.count_nonzero(values == 1)),
+        )
+
+
+def test_count_packed_trits_rejects_invalid_payloads() -> None:
+    with pytest.raises(ValueError, match="invalid symbol"):
+        count_packed_trits(b"\x03", 1)
+    with pytest.raises(ValueError, match="Expected 5 trits"):
+        count_packed_trits(b"\x00", 5)
+
+
+def test_quantize_pack_trits_matches_separate_kernels() -> None:
+    rng = np.random.default_rng(4)
+    for count in (0, 1, 5, 8, 13, 1000):
+        values = (rng.standard_normal(count) * 0.1).astype(np.float32)
+        trits = quantize_array_to_trits(values, 0.05)
+        for block_size in (4, 8, 1 << 16):
+            packed, counts = quantize_pack_trits(values, 0.05, block_size=block_size)
+            assert packed.tobytes() == pack_trits_array(trits).tobytes()
+            assert counts == (
+                int(np.count_nonzero(trits == -1)),
+                int(np.count_nonzero(trits == 0)),
+                int(np.count_nonzero(trits == 1)),
+            )
+
+
+def test_quantize_pack_trits_rejects_unaligned_blocks() -> None:
+    with pytest.raises(ValueError, match="multiple of 4"):
+        quantize_pack_trits([0.1], block_size=6)
+
+
+def test_quantize_pack_trits_per_channel_thresholds_match_rows() -> None:
+    rng = np.random.default_rng(6)
+    thresholds = np.linspace(0.1, 1.5, 6)
+    # Short channels gather per-value bounds; long ones are thresholded run by run.
+    for width in (10, 1500):
+        values = rng.standard_normal((6, width)).astype(np.float16)
+        rows = [quantize_array_to_trits(values[i], thresholds[i]) for i in range(6)]
+        expected = pack_trits_array(np.concatenate(rows)).tobytes()
+        packed, _ = quantize_pack_trits(values, thresholds, channel_size=width, block_size=1024)
+        assert packed.tobytes() == expected
+        # A chunk starting mid-row picks up the right channel through `offset`.
+        tail, _ = quantize_pack_trits(
+            values.reshape(-1)[2 * width :], thresholds, channel_size=width, offset=2 * width
+        )
+        assert tail.tobytes() == pack_trits_array(np.concatenate(rows[2:])).tobytes()
+    with pytest.raises(ValueError, match="non-negative"):
+        quantize_pack_trits(values, -thresholds, channel_size=width)
+
+
+def test_base3_pack_unpack_and_count_all_lengths() -> None:
+    rng = np.random.default_rng(9)
+    for count in range(0, 23):
+        trits = rng.integers(-1, 2, size=count).astype(np.int8)
+        packed = pack_trits_array(trits, "base3")
+        assert packed.size == packed_size(count, "base3") == -(-count // 5)
+        assert int(packed.max(initial=0)) < 243
+        assert np.array_equal(unpack_trits_array(packed, count, "base3"), trits)
+        assert count_packed_trits(packed, count, "base3") == tuple(
+            int(np.count_nonzero(trits == value)) for value in (-1, 0, 1)
+        )
+    # First trit is the least significant base-3 digit.
+    assert pack_trits_array([1, 0, -1, -1, -1], "base3").tolist() == [2 + 1 * 3]
+
+
+def test_base3_rejects_invalid_bytes_and_unknown_encodings() -> None:
+    with pytest.raises(ValueError, match="243"):
+        unpack_trits_array(b"\xf3", 5, "base3")
+    with pytest.raises(ValueError, match="243"):
+        count_packed_trits(b"\x00\xff", 7, "base3")
+    with pytest.raises(ValueError, match="encoding"):
+        pack_trits_array([0], "base4")
+
+
+def test_quantize_pack_trits_base3_matches_separate_kernels() -> None:
+    rng = np.random.default_rng(10)
+    for count in (0, 1, 4, 5, 6, 13, 1000):
+        values = (rng.standard_normal(count) * 0.1).astype(np.float32)
+        expected = pack_trits_array(quantize_array_to_trits(values, 0.05), "base3")
+        for block_size in (5, 10, None):
+            packed, _ = quantize_pack_trits(
+                values, 0.05, block_size=block_size, encoding="base3"
+            )
+            assert packed.tobytes() == expected.tobytes()
+    with pytest.raises(ValueError, match="multiple of 5"):
+        quantize_pack_trits([0.1], block_size=8, encoding="base3")
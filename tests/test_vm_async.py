@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import pytest
+
+from t81_python import vm_async
+from t81_python.vm_async import AsyncVMBridge
+from t81_python.vm_bridge import VMBridge
+
+
+class _FakeBridge:
+    """Stand-in handle that records calls overlapping on the same handle."""
+
+    program_cache_size = 0
+    violations = 0
+
+    def __init__(self, lib_path: Path | None = None, *, program_cache_size: int = 0) -> None:
+        self.busy = False
+
+    @staticmethod
+    def _resolve_lib_path(lib_path: Path | None) -> Path:
+        return Path("fake-libt81vm.so")
+
+    def state_hash(self) -> int:
+        return 0
+
+    def register(self, index: int) -> int:
+        return 0
+
+    def close(self) -> None:
+        pass
+
+
+def test_async_vm_bridge_missing_library_raises() -> None:
+    with pytest.raises(FileNotFoundError):
+        AsyncVMBridge(Path("/definitely/missing/libt81vm_capi.so"))
+
+
+def test_async_vm_bridge_rejects_invalid_limits() -> None:
+    with pytest.raises(ValueError, match="max_in_flight"):
+        AsyncVMBridge(Path("/definitely/missing/libt81vm_capi.so"), max_in_flight=0)
+    with pytest.raises(ValueError, match="slice_steps"):
+        AsyncVMBridge(Path("/definitely/missing/libt81vm_capi.so"), slice_steps=0)
+
+
+def test_async_vm_bridge_matches_sync_bridge_when_library_present(tmp_path: Path) -> None:
+    vm_lib = os.environ.get("T81_VM_LIB")
+    vm_program = os.environ.get("T81_VM_CANARY_PROGRAM")
+    if not vm_lib or not vm_program:
+        pytest.skip("runtime canary env vars not set")
+    assert vm_lib is not None
+    assert vm_program is not None
+
+    reference = VMBridge(Path(vm_lib))
+    reference.load_file(Path(vm_program))
+    expected_status = reference.run_to_halt()
+    expected_trace = reference.trace_array()
+
+    async def scenario() -> None:
+        async with AsyncVMBridge(Path(vm_lib), max_in_flight=2, slice_steps=1) as vm:
+            results = await asyncio.gather(
+                *(vm.run_to_halt(vm_program, registers=range(4), trace=True) for _ in range(6))
+            )
+            for result in results:
+                assert result.status == expected_status
+                assert result.state_hash == reference.state_hash()
+                assert result.trace is not None
+                assert np.array_equal(result.trace, expected_trace)
+
+            pages = [page async for page in vm.iter_trace_pages(vm_program, page_size=2)]
+            assert all(len(page) <= 2 for page in pages)
+            assert np.array_equal(np.concatenate(pages), expected_trace)
+
+            missing = await vm.run_to_halt(tmp_path / "missing.tisc.json")
+            assert not missing.ok
+            with pytest.raises(RuntimeError):
+                async for _ in vm.iter_trace_pages(tmp_path / "missing.tisc.json"):
+                    pass
+
+            task = asyncio.ensure_future(vm.run_to_halt(vm_program))
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+            again = await vm.run_to_halt(vm_program)
+            assert again.status == expected_status
+
+    asyncio.run(scenario())
+
+
+def test_cancelled_run_keeps_handle_until_running_slice_returns(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    started = threading.Event()
+    unblock = threading.Event()
+
+    def blocking_slice(bridge: _FakeBridge, budget: int) -> tuple[int, int]:
+        if bridge.busy:
+            _FakeBridge.violations += 1
+        bridge.busy = True
+        try:
+            if not started.is_set():
+                started.set()
+                unblock.wait(5)
+            return 0, 0
+        finally:
+            bridge.busy = False
+
+    monkeypatch.setattr(vm_async, "VMBridge", _FakeBridge)
+    monkeypatch.setattr(vm_async, "_load_job_program", lambda bridge, path: None)
+    monkeypatch.setattr(vm_async, "_run_slice", blocking_slice)
+    _FakeBridge.violations = 0
+
+    async def scenario() -> None:
+        vm = AsyncVMBridge(max_in_flight=2)
+        try:
+            first = asyncio.ensure_future(vm.run_to_halt("a.tisc.json"))
+            while not started.is_set():
+                await asyncio.sleep(0.001)
+            first.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await first
+            # The cancelled run still holds its slot while the slice executes...
+            slots = vm._semaphore()
+            await slots.acquire()
+            assert slots.locked()
+            slots.release()
+            # ...and its handle is not handed to the next run.
+            second = await vm.run_to_halt("b.tisc.json")
+            assert second.ok
+            assert vm._idle == [vm._bridges[1]]
+            unblock.set()
+            while len(vm._idle) < 2:
+                await asyncio.sleep(0.001)
+            assert not slots.locked()
+            assert len(vm._bridges) == 2
+        finally:
+            unblock.set()
+            vm.close()
+
+    asyncio.run(scenario())
+    assert _FakeBridge.violations == 0
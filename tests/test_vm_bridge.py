@@ -1,11 +1,14 @@
+import ctypes
 import json
 import os
 import subprocess
 from pathlib import Path
+from types import SimpleNamespace
 
+import numpy as np
 import pytest
 
-from t81_python.vm_bridge import VMBridge, default_vm_lib_paths
+from t81_python.vm_bridge import TRACE_DTYPE, VMBridge, _CTraceEntry, default_vm_lib_paths
 
 
 def test_default_vm_lib_paths_include_workspace_candidate() -> None:
@@ -14,6 +17,14 @@ def test_default_vm_lib_paths_include_workspace_candidate() -> None:
     assert str(candidates[0]).endswith("t81-vm/build/libt81vm_capi.dylib")
 
 
+def test_trace_dtype_matches_c_trace_entry_layout() -> None:
+    assert TRACE_DTYPE.itemsize == ctypes.sizeof(_CTraceEntry)
+    assert TRACE_DTYPE.names == ("pc", "opcode", "trap")
+    for name in TRACE_DTYPE.names:
+        assert TRACE_DTYPE.fields is not None
+        assert TRACE_DTYPE.fields[name][1] == getattr(_CTraceEntry, name).offset
+
+
 def test_vm_bridge_explicit_missing_library_raises() -> None:
     with pytest.raises(FileNotFoundError):
         VMBridge(Path("/definitely/missing/libt81vm_capi.so"))
@@ -71,3 +82,128 @@ def test_vm_bridge_parity_p0_opcode_canary_when_library_present(tmp_path: Path)
     assert bridge.register(2) == 1
     assert bridge.register(4) == 7
     assert bridge.register(6) == 7
+
+
+def test_vm_bridge_trace_pages_match_trace_when_library_present() -> None:
+    vm_lib = os.environ.get("T81_VM_LIB")
+    vm_program = os.environ.get("T81_VM_CANARY_PROGRAM")
+    if not vm_lib or not vm_program:
+        pytest.skip("runtime canary env vars not set")
+    assert vm_lib is not None
+    assert vm_program is not None
+
+    bridge = VMBridge(Path(vm_lib))
+    bridge.load_file(Path(vm_program))
+    bridge.run_to_halt()
+    entries = bridge.trace_array()
+    assert entries.dtype == TRACE_DTYPE
+    assert len(entries) == bridge.trace_len()
+
+    pages = list(bridge.iter_trace_pages(page_size=3))
+    assert all(len(page) <= 3 for page in pages)
+    joined = np.concatenate(pages) if pages else np.empty(0, dtype=TRACE_DTYPE)
+    assert np.array_equal(joined, entries)
+
+    trace = bridge.trace()
+    assert [entry.pc for entry in trace] == entries["pc"].tolist()
+    assert [entry.trap is None for entry in trace] == (entries["trap"] < 0).tolist()
+    with pytest.raises(IndexError):
+        bridge.trace_array(0, len(entries) + 1)
+
+
+def test_vm_bridge_rejects_negative_program_cache_size() -> None:
+    with pytest.raises(ValueError, match="program_cache_size"):
+        VMBridge(Path("/definitely/missing/libt81vm_capi.so"), program_cache_size=-1)
+
+
+def test_vm_bridge_program_cache_and_reset_when_library_present() -> None:
+    vm_lib = os.environ.get("T81_VM_LIB")
+    vm_program = os.environ.get("T81_VM_CANARY_PROGRAM")
+    if not vm_lib or not vm_program:
+        pytest.skip("runtime canary env vars not set")
+    assert vm_lib is not None
+    assert vm_program is not None
+
+    program = Path(vm_program)
+    reference = VMBridge(Path(vm_lib))
+    reference.load_file(program)
+    expected_status = reference.run_to_halt()
+    expected_hash = reference.state_hash()
+
+    bridge = VMBridge(Path(vm_lib), program_cache_size=2)
+    with pytest.raises(RuntimeError, match="no program loaded"):
+        bridge.reset()
+    digest = bridge.load_program(program)
+    assert bridge.load_program(program.read_bytes()) == digest
+    for _ in range(3):
+        assert bridge.run_to_halt() == expected_status
+        assert bridge.state_hash() == expected_hash
+        bridge.reset()
+        assert bridge.trace_len() == 0
+        assert bridge.load_program(program) == digest
+
+    bridge.load_bytes(program.read_bytes())
+    assert bridge.run_to_halt() == expected_status
+    assert bridge.state_hash() == expected_hash
+
+
+def test_vm_bridge_run_snapshots_match_run_to_halt_when_library_present() -> None:
+    vm_lib = os.environ.get("T81_VM_LIB")
+    vm_program = os.environ.get("T81_VM_CANARY_PROGRAM")
+    if not vm_lib or not vm_program:
+        pytest.skip("runtime canary env vars not set")
+    assert vm_lib is not None
+    assert vm_program is not None
+
+    reference = VMBridge(Path(vm_lib))
+    reference.load_file(Path(vm_program))
+    expected_status = reference.run_to_halt()
+    expected_registers = [reference.register(index) for index in range(4)]
+
+    bridge = VMBridge(Path(vm_lib))
+    bridge.load_file(Path(vm_program))
+    result = bridge.run(100_000, snapshot_every=2, registers=4)
+    assert result.status == expected_status
+    assert result.steps == reference.trace_len()
+    assert result.step.tolist() == sorted(result.step.tolist())
+    assert result.step[-1] == result.steps
+    assert result.registers.shape == (len(result.step), 4)
+    assert result.registers[-1].tolist() == expected_registers
+    assert int(result.state_hash[-1]) == reference.state_hash()
+
+    registers = bridge.registers(4)
+    assert registers.dtype == np.int64
+    assert registers.tolist() == expected_registers
+    with pytest.raises(ValueError, match="out must be"):
+        bridge.registers(4, out=np.empty(3, dtype=np.int64))
+
+
+def test_vm_bridge_run_trims_registers_the_vm_did_not_write() -> None:
+    trace = [0]
+
+    def run_to_halt(handle: object, budget: int) -> int:
+        trace[0] += budget
+        return 0
+
+    def registers_into(handle: object, address: int, count: int) -> int:
+        written = min(count, 3)
+        values = (ctypes.c_int64 * written).from_address(address)
+        values[:] = list(range(1, written + 1))
+        return written
+
+    # A bridge over Python stand-ins for the C entry points `run()` uses.
+    bridge = VMBridge.__new__(VMBridge)
+    vars(bridge).update(
+        _handle=None,
+        _lib=SimpleNamespace(
+            t81vm_run_to_halt=run_to_halt, t81vm_trace_len=lambda handle: trace[0]
+        ),
+        _registers_into=registers_into,
+        _register_count=None,
+        _state_hash_fn=lambda handle: 7,
+    )
+
+    snapshots = bridge.run(10, snapshot_every=5, registers=8)
+    assert snapshots.steps == 10
+    assert snapshots.registers.tolist() == [[1, 2, 3], [1, 2, 3]]
+    assert snapshots.state_hash.tolist() == [7, 7]
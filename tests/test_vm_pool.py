@@ -0,0 +1,46 @@
+import os
+from pathlib import Path
+
+import pytest
+
+from t81_python.vm_bridge import VMBridge
+from t81_python.vm_pool import VMPool
+
+
+def test_vm_pool_missing_library_raises() -> None:
+    with pytest.raises(FileNotFoundError):
+        VMPool(workers=2, lib_path=Path("/definitely/missing/libt81vm_capi.so"))
+
+
+def test_vm_pool_rejects_zero_workers() -> None:
+    with pytest.raises(ValueError, match="workers"):
+        VMPool(workers=0, lib_path=Path("/definitely/missing/libt81vm_capi.so"))
+
+
+def test_vm_pool_matches_single_bridge_when_library_present(tmp_path: Path) -> None:
+    vm_lib = os.environ.get("T81_VM_LIB")
+    vm_program = os.environ.get("T81_VM_CANARY_PROGRAM")
+    if not vm_lib or not vm_program:
+        pytest.skip("runtime canary env vars not set")
+    assert vm_lib is not None
+    assert vm_program is not None
+
+    bridge = VMBridge(Path(vm_lib))
+    bridge.load_file(Path(vm_program))
+    expected_status = bridge.run_to_halt()
+    expected_hash = bridge.state_hash()
+    expected_registers = tuple(bridge.register(index) for index in range(4))
+
+    programs = [vm_program] * 8 + [str(tmp_path / "missing.tisc.json")]
+    for processes in (False, True):
+        with VMPool(workers=2, lib_path=Path(vm_lib), processes=processes) as pool:
+            results = pool.run(programs, registers=range(4), trace=True)
+
+        assert [result.program for result in results] == [Path(p) for p in programs]
+        for result in results[:-1]:
+            assert result.status == expected_status
+            assert result.state_hash == expected_hash
+            assert result.registers == expected_registers
+            assert result.trace is not None and len(result.trace) == bridge.trace_len()
+        assert not results[-1].ok
+        assert results[-1].error is not None